@@ -0,0 +1,294 @@
+# ============================================================
+# balance_runner.py — Monte Carlo Balancing over the Headless Engine
+# ============================================================
+# Runs many simulated fights (weapon × enemy × companion) and scripted
+# routes through the real engine code (resolve_attack, enemy_counterattack,
+# _companion_intercept, process_command …) on a multiprocessing pool.
+# Every worker process holds its own engine; every trial gets its own
+# seed, so a sweep is reproducible for the same --seed.
+#
+# Combat damage itself is deterministic (upper weapon value vs. lower
+# enemy value). The spread in a fight sweep comes from the starting HP,
+# drawn per trial from [--hp-min, 100]; in routes from the spawn rolls.
+#
+#     python balance_runner.py --trials 200 --processes 8
+#     python balance_runner.py --weapons axt,pistole --enemies zombie --companions keiner,emilia
+#     python balance_runner.py --route my_route.txt --route-runs 500 --out report.json
+#
+# Report: win/death/timeout rate, turns-to-kill, HP remaining per fight
+# scenario; death rate and death locations per route.
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import multiprocessing
+from collections import Counter
+
+COMPANIONS = ('keiner', 'christopher', 'emilia', 'helene')
+ARENA_ROOM = 'wohnbereich'   # Raum in dem die Kämpfe stattfinden
+MAX_TURNS = 60               # Danach gilt der Kampf als unentschieden (z.B. immune Gegner)
+DEFAULT_HP_MIN = 50
+TRIALS_PER_TASK = 50         # Trials je Pool-Aufgabe
+
+_engine = None  # Engine-Modul des Worker-Prozesses
+
+
+def _init_worker():
+    """Eine Engine je Worker-Prozess."""
+    global _engine
+    import engine
+    _engine = engine
+    engine.SAVE_FILE = os.path.join(tempfile.gettempdir(), f'dead_world_balance_{os.getpid()}.json')
+    engine.Engine().new_game(seed=0)
+    engine.output_queue.clear()
+
+
+# ── Kämpfe ────────────────────────────────────────────────────────────────
+def _setup_fight(weapon_key, enemy_key, companion, hp, hunger=0, strength=100, godmode=False):
+    e = _engine
+    stats = e.player_stats
+    stats.update(health=hp, hunger=hunger, strength=strength, in_combat=True,
+                 godmode=godmode, companion=None,
+                 companion_hp=100, companion_stunned_turns=0,
+                 emilia_following=False, helene_following=False,
+                 equipped_weapon=weapon_key, weapon_type=e.weapons[weapon_key]['type'])
+    if companion == 'christopher':
+        stats['companion'] = 'christopher'
+    elif companion == 'emilia':
+        stats['emilia_following'] = True
+    elif companion == 'helene':
+        stats['helene_following'] = True
+    enemy = e.enemies[enemy_key]
+    enemy['health'] = enemy['max_health']
+    room = e.rooms[ARENA_ROOM]
+    room['enemy'] = enemy_key
+    room['items'] = []
+    e.current_room = ARENA_ROOM
+
+
+def simulate_fight(weapon_key, enemy_key, companion, hp, max_turns=MAX_TURNS,
+                   hunger=0, strength=100, godmode=False):
+    """Ein Kampf bis Sieg, Tod oder max_turns → (ausgang, züge, hp_danach)."""
+    e = _engine
+    _setup_fight(weapon_key, enemy_key, companion, hp, hunger, strength, godmode)
+    weapon = e.weapons[weapon_key]
+    enemy = e.enemies[enemy_key]
+    deaths = e.player_deaths
+    for turn in range(1, max_turns + 1):
+        e.resolve_attack(weapon, enemy, enemy_key)
+        e.output_queue.clear()
+        if e.player_deaths != deaths:
+            return 'death', turn, 0
+        if enemy['health'] <= 0:
+            return 'win', turn, e.player_stats['health']
+    return 'timeout', max_turns, e.player_stats['health']
+
+
+def _run_fight_task(task):
+    scenario, seeds, hp_min, max_turns = task
+    results = []
+    for seed in seeds:
+        _engine.rng.reseed(seed)
+        hp = random.Random(seed).randint(hp_min, 100)
+        results.append(simulate_fight(*scenario, hp, max_turns))
+    return scenario, results
+
+
+# ── Routen ────────────────────────────────────────────────────────────────
+def simulate_route(commands, seed):
+    """Spielt eine Befehlsfolge ab Spielstart → Tode (Räume), HP, Endraum."""
+    e = _engine
+    e.Engine().new_game(seed=seed)
+    deaths = []
+    for command in commands:
+        before = e.player_deaths
+        e.submit_input(command)
+        e.output_queue.clear()
+        if e.player_deaths != before:
+            deaths.append(e.last_death_room)
+    return {'deaths': deaths, 'hp': e.player_stats['health'], 'room': e.current_room}
+
+
+def _run_route_task(task):
+    name, commands, seeds = task
+    return name, [simulate_route(commands, seed) for seed in seeds]
+
+
+# ── Auswertung ────────────────────────────────────────────────────────────
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(pct / 100.0 * len(sorted_values)))]
+
+
+def _distribution(values):
+    values = sorted(values)
+    if not values:
+        return None
+    return {
+        'mean': round(sum(values) / len(values), 2),
+        'p10': _percentile(values, 10),
+        'p50': _percentile(values, 50),
+        'p90': _percentile(values, 90),
+    }
+
+
+def aggregate_fights(results):
+    n = len(results)
+    outcomes = Counter(outcome for outcome, _turns, _hp in results)
+    wins = [(turns, hp) for outcome, turns, hp in results if outcome == 'win']
+    hp_hist = Counter(min(hp // 10 * 10, 90) for _turns, hp in wins)
+    return {
+        'trials': n,
+        'win_rate': round(outcomes['win'] / n, 4),
+        'death_rate': round(outcomes['death'] / n, 4),
+        'timeout_rate': round(outcomes['timeout'] / n, 4),
+        'turns_to_kill': _distribution([turns for turns, _hp in wins]),
+        'hp_remaining': _distribution([hp for _turns, hp in wins]),
+        'hp_histogram': {f'{lo}-{lo + 9}': hp_hist[lo] for lo in range(0, 100, 10)},
+    }
+
+
+def aggregate_routes(runs):
+    death_rooms = Counter(room for run in runs for room in run['deaths'])
+    return {
+        'runs': len(runs),
+        'death_rate': round(sum(1 for run in runs if run['deaths']) / len(runs), 4),
+        'deaths_per_run': round(sum(len(run['deaths']) for run in runs) / len(runs), 3),
+        'death_locations': dict(death_rooms.most_common()),
+        'hp_remaining': _distribution([run['hp'] for run in runs]),
+        'end_rooms': dict(Counter(run['room'] for run in runs).most_common(5)),
+    }
+
+
+def _chunks(seeds, size):
+    return [seeds[i:i + size] for i in range(0, len(seeds), size)]
+
+
+def _map(fn, tasks, processes):
+    """Verteilt tasks auf den Pool (processes=1 → im eigenen Prozess)."""
+    if processes == 1:
+        _init_worker()
+        return map(fn, tasks)
+    pool = multiprocessing.Pool(processes, initializer=_init_worker)
+    try:
+        return list(pool.imap_unordered(fn, tasks))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def run_sweep(weapon_keys, enemy_keys, companions, trials, processes,
+              hp_min=DEFAULT_HP_MIN, max_turns=MAX_TURNS, seed=0):
+    """Alle Kombinationen Waffe × Gegner × Begleiter, je trials Kämpfe."""
+    tasks = []
+    base = seed * 1_000_003
+    for index, scenario in enumerate((w, en, c) for w in weapon_keys
+                                     for en in enemy_keys for c in companions):
+        seeds = [base + index * trials + t for t in range(trials)]
+        tasks.extend((scenario, chunk, hp_min, max_turns) for chunk in _chunks(seeds, TRIALS_PER_TASK))
+    collected = {}
+    for scenario, results in _map(_run_fight_task, tasks, processes):
+        collected.setdefault(scenario, []).extend(results)
+    return {'|'.join(scenario): aggregate_fights(results)
+            for scenario, results in sorted(collected.items())}
+
+
+def run_routes(routes, runs, processes, seed=0):
+    """routes: {name: [befehl, ...]} — je Route runs Durchläufe mit eigenem Seed."""
+    tasks = []
+    for index, (name, commands) in enumerate(sorted(routes.items())):
+        seeds = [seed * 1_000_003 + index * runs + r for r in range(runs)]
+        tasks.extend((name, commands, chunk) for chunk in _chunks(seeds, TRIALS_PER_TASK))
+    collected = {}
+    for name, results in _map(_run_route_task, tasks, processes):
+        collected.setdefault(name, []).extend(results)
+    return {name: aggregate_routes(results) for name, results in sorted(collected.items())}
+
+
+def _print_report(report):
+    fights = report.get('fights', {})
+    if fights:
+        print(f"{'Waffe':<18}{'Gegner':<18}{'Begleiter':<12}{'Sieg':>7}{'Tod':>7}"
+              f"{'Züge':>7}{'HP p10':>8}{'HP p50':>8}")
+        for key, row in fights.items():
+            weapon, enemy, companion = key.split('|')
+            turns = row['turns_to_kill']['mean'] if row['turns_to_kill'] else '-'
+            hp = row['hp_remaining'] or {'p10': '-', 'p50': '-'}
+            print(f"{weapon:<18}{enemy:<18}{companion:<12}{row['win_rate']:>7.0%}{row['death_rate']:>7.0%}"
+                  f"{turns:>7}{hp['p10']:>8}{hp['p50']:>8}")
+    for name, row in report.get('routes', {}).items():
+        top = ', '.join(f'{room} ×{count}' for room, count in list(row['death_locations'].items())[:5])
+        print(f"[ROUTE] {name}: {row['runs']} Läufe, Tod in {row['death_rate']:.0%}"
+              f" — Todesorte: {top or 'keine'}")
+    meta = report['meta']
+    print(f"[BALANCE] {meta['fights']} Kämpfe, {meta['route_runs']} Routen-Läufe in "
+          f"{meta['seconds']:.2f} s auf {meta['processes']} Prozess(en)")
+
+
+def _load_route(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+
+def main(argv=None):
+    import engine
+
+    parser = argparse.ArgumentParser(description='Dead World Monte-Carlo-Balancing')
+    parser.add_argument('--trials', type=int, default=100, help='Kämpfe je Kombination')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--weapons', default=','.join(engine.weapons))
+    parser.add_argument('--enemies', default=','.join(engine.enemies))
+    parser.add_argument('--companions', default=','.join(COMPANIONS))
+    parser.add_argument('--hp-min', type=int, default=DEFAULT_HP_MIN,
+                        help='Start-HP je Kampf zufällig aus [hp-min, 100]')
+    parser.add_argument('--max-turns', type=int, default=MAX_TURNS)
+    parser.add_argument('--route', action='append', default=[],
+                        help='Befehlsfolge (eine Zeile = eine Eingabe) als Route')
+    parser.add_argument('--route-runs', type=int, default=200)
+    parser.add_argument('--no-fights', action='store_true', help='Nur Routen')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help='Bericht als JSON schreiben')
+    args = parser.parse_args(argv)
+
+    def keys(text, valid):
+        chosen = [k.strip() for k in text.split(',') if k.strip()]
+        unknown = [k for k in chosen if k not in valid]
+        if unknown:
+            parser.error(f"Unbekannt: {', '.join(unknown)}")
+        return chosen
+
+    start = time.perf_counter()
+    report = {'fights': {}, 'routes': {}}
+    fights = 0
+    if not args.no_fights:
+        weapon_keys = keys(args.weapons, engine.weapons)
+        enemy_keys = keys(args.enemies, engine.enemies)
+        companions = keys(args.companions, COMPANIONS)
+        report['fights'] = run_sweep(weapon_keys, enemy_keys, companions, args.trials,
+                                     args.processes, args.hp_min, args.max_turns, args.seed)
+        fights = len(weapon_keys) * len(enemy_keys) * len(companions) * args.trials
+    routes = {os.path.splitext(os.path.basename(p))[0]: _load_route(p) for p in args.route}
+    if routes:
+        report['routes'] = run_routes(routes, args.route_runs, args.processes, args.seed)
+    report['meta'] = {
+        'seconds': round(time.perf_counter() - start, 3),
+        'processes': args.processes,
+        'fights': fights,
+        'route_runs': len(routes) * args.route_runs,
+        'seed': args.seed,
+        'hp_min': args.hp_min,
+    }
+    _print_report(report)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
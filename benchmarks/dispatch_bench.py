@@ -0,0 +1,114 @@
+# ============================================================
+# benchmarks/dispatch_bench.py — Verb Dispatch Latency
+# ============================================================
+# Compares the old if-chain (every handler in order until one returns
+# True) with the dispatch table in command_handlers. Only the dispatch
+# overhead is timed: the handlers that are asked and decline before the
+# one that takes the command. The winning handler itself is not run.
+#
+# Runs headless (engine.py, no pygame):
+#     python benchmarks/dispatch_bench.py [--repeat N]
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import engine
+import command_handlers
+
+# Ein Befehl pro Verb-Gruppe, grob in Ketten-Reihenfolge
+SAMPLE_COMMANDS = [
+    'hilfe', 'n', 'nimm zeitung', 'inventar', 'untersuche', 'schaue',
+    'karte', 'nachladen', 'schlag zombie', 'ausrüsten fäuste',
+    'schließe schrank', 'schieb regal', 'spreche christopher',
+    'score', 'diagnose', 'xyzzy',
+]
+
+
+def _chain():
+    """Die frühere if-Kette aus process_command (= Registrierungsreihenfolge)."""
+    return list(command_handlers._registered)
+
+
+def _call(entry, cmd, raw_cmd):
+    handler, _verbs, _prefixes, _catch_all, pass_raw = entry
+    return handler(cmd, raw_cmd) if pass_raw else handler(cmd)
+
+
+def _resolve(raw_cmd):
+    room_items = engine.rooms.get(engine.current_room, {}).get('items', [])
+    engine._sync_word_overlay(room_items)
+    words = [engine.resolve_word(w, room_items) for w in raw_cmd.split()]
+    return ' '.join(words), words
+
+
+def _find_winner(cmd, raw_cmd):
+    """Welcher Handler nimmt den Befehl? (führt ihn einmal aus)"""
+    for entry in _chain():
+        if _call(entry, cmd, raw_cmd):
+            engine.output_queue.clear()
+            return entry
+    engine.output_queue.clear()
+    return None
+
+
+def _time_ns(fn, repeat):
+    start = time.perf_counter_ns()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter_ns() - start) / repeat
+
+
+def bench_command(raw_cmd, repeat):
+    """Gibt (handler_name, chain_ns, table_ns) für einen Befehl zurück."""
+    engine.Engine().new_game()
+    cmd, words = _resolve(raw_cmd)
+    winner = _find_winner(cmd, raw_cmd)
+    engine.Engine().new_game()
+    cmd, words = _resolve(raw_cmd)
+    token = words[0] if words else ''
+
+    chain = _chain()
+    chain_losers = chain[:chain.index(winner)] if winner else chain
+
+    def run_chain():
+        for entry in chain_losers:
+            _call(entry, cmd, raw_cmd)
+
+    def run_table():
+        for entry in command_handlers.handlers_for(token):
+            if entry is winner:
+                break
+            _call(entry, cmd, raw_cmd)
+
+    chain_ns = _time_ns(run_chain, repeat)
+    table_ns = _time_ns(run_table, repeat)
+    engine.output_queue.clear()
+    name = winner[0].__name__ if winner else 'handle_unknown_command'
+    return name, chain_ns, table_ns
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    engine.SAVE_FILE = os.path.join(tempfile.gettempdir(), 'dead_world_bench_save.json')
+    print(f"{'Befehl':<22}{'Handler':<30}{'Kette µs':>10}{'Tabelle µs':>12}{'Faktor':>8}")
+    total_chain = total_table = 0.0
+    for raw_cmd in SAMPLE_COMMANDS:
+        name, chain_ns, table_ns = bench_command(raw_cmd, args.repeat)
+        total_chain += chain_ns
+        total_table += table_ns
+        factor = chain_ns / table_ns if table_ns else float('inf')
+        print(f"{raw_cmd:<22}{name:<30}{chain_ns / 1000:>10.3f}{table_ns / 1000:>12.3f}{factor:>8.1f}")
+    print(f"{'SUMME':<52}{total_chain / 1000:>10.3f}{total_table / 1000:>12.3f}"
+          f"{total_chain / max(total_table, 1):>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,399 @@
+# ============================================================
+# benchmarks/hotpath_bench.py — Hot-Path Benchmark Suite
+# ============================================================
+# Times the parser, world and rendering hot paths and writes the
+# results as JSON, so two builds can be compared:
+#   command.*   process_command over scripted command sequences
+#   world.*     move_direction / describe_room on a random walk
+#   text.*      wrap_text / add_to_history on long texts
+#   draw.*      draw_game at every RESOLUTION_PRESETS size
+#   save.*      save_game / restore_game latency
+#   dispatch.*  verb dispatch overhead (dispatch_bench.py)
+#   replay.*    recorded sessions (--log FILE, see input_recorder.py)
+#
+# Each case runs several rounds; the median per operation is what gets
+# compared. Runs headless:
+#     SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy \
+#         python benchmarks/hotpath_bench.py --out bench.json
+#     python benchmarks/hotpath_bench.py --compare bench.json [--threshold 0.15]
+#     python benchmarks/hotpath_bench.py --compare old.json --results new.json
+# --script FILE adds a command script (one command per line), --log FILE
+# a recorded player session as workload.
+# Compare mode exits with 1 if any case got slower than the threshold.
+# Shared or throttled machines drift between runs; --normalize scales the
+# baseline by the ratio of both runs' fixed calibration workload.
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import statistics
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+_BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(_BENCH_DIR))
+sys.path.insert(0, _BENCH_DIR)
+
+import engine
+import dispatch_bench
+import input_recorder
+from config import RESOLUTION_PRESETS
+
+# Befehlsfolgen ab dem Startraum (nach dem Prolog)
+COMMAND_SCRIPTS = {
+    'opening': [
+        'nimm feuerlöscher', 'schlag zombie', 'schlag zombie', 'schlag zombie',
+        'n', 'schaue', 'w', 'nimm konserven', 'nimm medk', 'o', 'o', 'inv',
+    ],
+    'info': [
+        'hilfe', 'inventar', 'karte', 'score', 'diagnose', 'schaue', 'untersuche',
+    ],
+    'unknown': [
+        'xyzzy', 'blabla', 'tanze', 'fliege nach hause', 'nimm', 'gehe', 'öffne',
+    ],
+}
+
+WALK_STEPS = 400          # Schritte je Random-Walk-Runde
+DRAW_PARAGRAPHS = 2000    # Absätze im Verlauf für draw.*
+IDLE_FRAMES = 50          # Unveränderte Frames je Runde (einzeln zu kurz zum Messen)
+DEFAULT_THRESHOLD = 0.15  # +15 % Median = Regression
+
+
+def _measure(fn, rounds, ops=1, setup=None):
+    """Führt fn rounds-mal aus (setup vorher, ungemessen) → Statistik in µs je Operation."""
+    samples = []
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        start = time.perf_counter_ns()
+        fn()
+        samples.append((time.perf_counter_ns() - start) / 1000.0 / ops)
+    return {
+        'median_us': round(statistics.median(samples), 3),
+        'min_us': round(min(samples), 3),
+        'max_us': round(max(samples), 3),
+        'rounds': rounds,
+        'ops': ops,
+    }
+
+
+def _calibrate(rounds):
+    """Fester Python-Workload: misst die Maschinen-/Taktlage dieses Laufs."""
+    def work():
+        table = {}
+        for i in range(20000):
+            table[i % 97] = table.get(i % 97, 0) + i
+        return sorted(table.values())
+    return _measure(work, rounds)['median_us']
+
+
+def _new_game(seed=1234):
+    engine.Engine().new_game(seed=seed)
+    engine.output_queue.clear()
+
+
+# ── command.* ──────────────────────────────────────────────────────────────
+def bench_commands(rounds, scripts):
+    results = {}
+    for name, script in scripts.items():
+        def run(script=script):
+            for cmd in script:
+                engine.process_command(cmd)
+                engine.output_queue.clear()
+        results[f'command.{name}'] = _measure(run, rounds, ops=len(script), setup=_new_game)
+    return results
+
+
+# ── world.* ────────────────────────────────────────────────────────────────
+def _walk_route(steps, seed):
+    """Zufallsweg über ROOM_GRAPH: [(raum, richtung), ...]."""
+    rng = random.Random(seed)
+    graph = engine.ROOM_GRAPH
+    _new_game()
+    with_exits = [rk for rk in graph.room_keys if graph.exits(rk)]
+    room = engine.current_room
+    route = []
+    for _ in range(steps):
+        exits = graph.exits(room)
+        if not exits:
+            # Sackgasse (z.B. Startraum vor dem Kampf) → woanders weiterlaufen
+            room = rng.choice(with_exits)
+            exits = graph.exits(room)
+        direction, target = rng.choice(exits)
+        route.append((room, direction))
+        room = target
+    return route
+
+
+def bench_world(rounds):
+    route = _walk_route(WALK_STEPS, seed=42)
+
+    def walk():
+        for room, direction in route:
+            engine.current_room = room   # Sperren/Trigger lenken sonst vom Weg ab
+            engine.move_direction(direction)
+            engine.output_queue.clear()
+
+    rooms_on_route = [room for room, _direction in route]
+
+    def describe():
+        for room in rooms_on_route:
+            engine.current_room = room
+            engine.describe_room()
+            engine.output_queue.clear()
+
+    return {
+        'world.move_direction': _measure(walk, rounds, ops=len(route), setup=_new_game),
+        'world.describe_room': _measure(describe, rounds, ops=len(rooms_on_route), setup=_new_game),
+    }
+
+
+# ── text.* ─────────────────────────────────────────────────────────────────
+def bench_text(rounds):
+    long_text = ' '.join(rd.get('description', '') for rd in engine.rooms.values())
+    paragraphs = [rd.get('description', '') for rd in engine.rooms.values()] * 5
+    results = {}
+    for width in (60, 80, 140):
+        results[f'text.wrap_text_{width}'] = _measure(
+            lambda width=width: engine.wrap_text(long_text, width), rounds)
+
+    def add():
+        for text in paragraphs:
+            engine.add_to_history(text)
+        engine.output_queue.clear()
+
+    results['text.add_to_history'] = _measure(add, rounds, ops=len(paragraphs))
+    results['text.long_text_chars'] = {'value': len(long_text)}
+    return results
+
+
+# ── save.* ─────────────────────────────────────────────────────────────────
+def bench_save(rounds):
+    def save():
+        engine.save_game()
+        engine.output_queue.clear()
+
+    def restore():
+        engine.restore_game()
+        engine.output_queue.clear()
+
+    _new_game()
+    for cmd in COMMAND_SCRIPTS['opening']:
+        engine.process_command(cmd)
+    engine.output_queue.clear()
+    save()
+    return {
+        'save.save_game': _measure(save, rounds),
+        'save.restore_game': _measure(restore, rounds),
+        'save.file_bytes': {'value': os.path.getsize(engine.SAVE_FILE)},
+    }
+
+
+# ── dispatch.* ─────────────────────────────────────────────────────────────
+def bench_dispatch(repeat):
+    total_chain = total_table = 0.0
+    for raw_cmd in dispatch_bench.SAMPLE_COMMANDS:
+        _name, chain_ns, table_ns = dispatch_bench.bench_command(raw_cmd, repeat)
+        total_chain += chain_ns
+        total_table += table_ns
+    n = len(dispatch_bench.SAMPLE_COMMANDS)
+    return {
+        'dispatch.table': {'median_us': round(total_table / n / 1000.0, 3), 'ops': n},
+        'dispatch.chain': {'median_us': round(total_chain / n / 1000.0, 3), 'ops': n},
+    }
+
+
+# ── replay.* ───────────────────────────────────────────────────────────────
+def bench_replay(rounds, logs):
+    results = {}
+    for path in logs:
+        header, records = input_recorder.read_log(path)
+        entries = sum(1 for entry in records if entry[0] in input_recorder.ENTRY_KINDS)
+        if not entries:
+            continue
+        name = os.path.splitext(os.path.basename(path))[0]
+        results[f'replay.{name}'] = _measure(
+            lambda: input_recorder.replay(header, records), rounds, ops=entries)
+    return results
+
+
+# ── draw.* (pygame-Frontend) ───────────────────────────────────────────────
+def bench_draw(rounds):
+    import pygame
+    import dead_world_intro_v_omega as game
+
+    engine.game_history.enable_spill(None)  # Kein Transcript aus dem Benchmark
+    _new_game()
+    engine.init_frontend(game)  # Engine() hat auf HeadlessFrontend umgestellt
+    game.current_state = game.GAME
+    texts = [rd.get('description', '') for rd in engine.rooms.values()]
+    engine.game_history.extend((texts[i % len(texts)], engine.COLOR_NORMAL)
+                               for i in range(DRAW_PARAGRAPHS))
+
+    results = {}
+    tick = [0]
+
+    def frame(force):
+        tick[0] += 1
+        game.draw_game(tick[0], force=force)
+
+    for name, width, height in RESOLUTION_PRESETS:
+        game.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        game.init_render(game.screen)
+        game.request_full_redraw()
+        for _ in range(3):
+            frame(True)  # Caches (Layout, Glyphen) aufwärmen
+        key = f'{width}x{height}'
+        results[f'draw.full_{key}'] = _measure(lambda: frame(True), rounds)
+
+        def idle():
+            for _ in range(IDLE_FRAMES):
+                frame(False)
+
+        results[f'draw.idle_{key}'] = _measure(idle, rounds, ops=IDLE_FRAMES)
+
+        def scroll():
+            game.scroll_offset = 0 if game.scroll_offset else min(5, game.max_scroll)
+            frame(False)
+
+        results[f'draw.scroll_{key}'] = _measure(scroll, rounds)
+        game.scroll_offset = 0
+    return results
+
+
+GROUPS = ('command', 'world', 'text', 'save', 'dispatch', 'replay', 'draw')
+
+
+def run_suite(rounds, groups=GROUPS, scripts=None, logs=(), dispatch_repeat=2000):
+    engine.SAVE_FILE = os.path.join(tempfile.gettempdir(), 'dead_world_bench_save.json')
+    results = {}
+    if 'command' in groups:
+        results.update(bench_commands(rounds, scripts or COMMAND_SCRIPTS))
+    if 'world' in groups:
+        results.update(bench_world(rounds))
+    if 'text' in groups:
+        results.update(bench_text(rounds))
+    if 'save' in groups:
+        results.update(bench_save(rounds))
+    if 'dispatch' in groups:
+        results.update(bench_dispatch(dispatch_repeat))
+    if 'replay' in groups and logs:
+        results.update(bench_replay(rounds, logs))
+    if 'draw' in groups:
+        # Zuletzt: das Frontend bindet sich beim Import als Engine-Frontend ein
+        results.update(bench_draw(rounds))
+    try:
+        import pygame
+        pygame_version = pygame.version.ver
+    except ImportError:
+        pygame_version = None
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pygame': pygame_version,
+            'platform': platform.platform(),
+            'rounds': rounds,
+            'calibration_us': _calibrate(rounds),
+        },
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold, normalize=False):
+    """[(name, alt_us, neu_us, änderung)] + Liste der Regressionen.
+
+    normalize=True rechnet die Baseline mit dem Verhältnis der
+    Kalibrierungs-Läufe um (andere Maschine / anderer Takt)."""
+    rows, regressions = [], []
+    scale = 1.0
+    if normalize:
+        base_cal = baseline.get('meta', {}).get('calibration_us')
+        cur_cal = current.get('meta', {}).get('calibration_us')
+        if base_cal and cur_cal:
+            scale = cur_cal / base_cal
+    base_results = baseline.get('results', {})
+    for name, entry in current.get('results', {}).items():
+        old = base_results.get(name, {}).get('median_us')
+        new = entry.get('median_us')
+        if old is None or new is None:
+            continue
+        old *= scale
+        change = (new - old) / old if old else 0.0
+        rows.append((name, old, new, change))
+        if change > threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def _print_results(report):
+    print(f"{'Fall':<28}{'Median µs':>12}{'Min µs':>12}")
+    for name, entry in report['results'].items():
+        if 'median_us' in entry:
+            min_us = entry.get('min_us')
+            print(f"{name:<28}{entry['median_us']:>12.2f}{min_us if min_us is not None else '':>12}")
+        else:
+            print(f"{name:<28}{entry['value']:>12}")
+
+
+def _print_compare(rows, regressions, threshold):
+    print(f"{'Fall':<28}{'Alt µs':>12}{'Neu µs':>12}{'Änderung':>10}")
+    for name, old, new, change in rows:
+        flag = '  REGRESSION' if name in regressions else ''
+        print(f"{name:<28}{old:>12.2f}{new:>12.2f}{change:>+10.1%}{flag}")
+    print(f"{len(regressions)} Regression(en) über {threshold:.0%}")
+
+
+def _load_script(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Dead World Hot-Path Benchmarks')
+    parser.add_argument('--rounds', type=int, default=15)
+    parser.add_argument('--only', default=','.join(GROUPS),
+                        help='Gruppen, kommagetrennt: ' + ','.join(GROUPS))
+    parser.add_argument('--script', action='append', default=[],
+                        help='Zusätzliches Befehlsskript (eine Zeile = ein Befehl)')
+    parser.add_argument('--log', action='append', default=[],
+                        help='Aufgezeichnete Sitzung als Workload (input_recorder.py)')
+    parser.add_argument('--out', help='Ergebnisse als JSON schreiben')
+    parser.add_argument('--compare', help='Baseline-JSON zum Vergleich')
+    parser.add_argument('--results', help='Mit --compare: diese Ergebnisse statt eines neuen Laufs')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--normalize', action='store_true',
+                        help='Baseline per Kalibrierungs-Workload auf diese Maschine umrechnen')
+    args = parser.parse_args(argv)
+
+    if args.results:
+        with open(args.results, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    else:
+        scripts = dict(COMMAND_SCRIPTS)
+        for path in args.script:
+            scripts[os.path.splitext(os.path.basename(path))[0]] = _load_script(path)
+        groups = tuple(g.strip() for g in args.only.split(',') if g.strip())
+        report = run_suite(args.rounds, groups, scripts, args.log)
+        _print_results(report)
+        if args.out:
+            with open(args.out, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows, regressions = compare(baseline, report, args.threshold, args.normalize)
+        _print_compare(rows, regressions, args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,283 @@
+# ============================================================
+# combat_tables.py — Vectorized Combat Outcome Tables for Dead World
+# ============================================================
+# Evaluates every combination of weapon × enemy × companion × hunger ×
+# strength × godmode × starting HP as NumPy arrays in one batched pass,
+# turn by turn, instead of looping through resolve_attack. The kernel
+# mirrors the engine's combat rules:
+#   player hit    — upper weapon value; Emilia +10; immune enemy → 1;
+#                   godmode → enemy health + 1 and no counterattack
+#   counterattack — lower enemy value, through _companion_intercept
+#                   (Christopher halves it, takes 15 himself, is stunned
+#                   for 3 turns at 0); Helene heals +8 if still alive
+#   victory       — Christopher heals +5 (_companion_post_combat_heal)
+# Hunger and strength are carried as grid axes. The engine does not read
+# them in combat today, so their rows come out identical — the
+# cross-check runs them through the engine to keep it that way.
+#
+# Combat is deterministic for a given starting HP, so the "exact" table
+# averages over every HP in [--hp-min, 100]; the "sampled" table draws
+# --trials starting HPs per cell, like balance_runner does.
+#
+#     python combat_tables.py --out tables.json
+#     python combat_tables.py --mode sampled --trials 500 --out tables.csv
+#     python combat_tables.py --check 2000     # gegen die Engine (balance_runner.simulate_fight)
+#
+# NumPy is optional for the game itself and only needed here; it comes
+# with the "tools" extra (uv sync --extra tools / pip install -e ".[tools]").
+# The --check run is this module's test against the engine, see README.
+
+import sys
+import csv
+import json
+import time
+import argparse
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+from balance_runner import COMPANIONS, MAX_TURNS, DEFAULT_HP_MIN
+
+HUNGER_STATES = (0, 50, 90)
+STRENGTH_STATES = (100, 50, 10)
+GODMODE_STATES = (False, True)
+AXES = ('weapon', 'enemy', 'companion', 'hunger', 'strength', 'godmode')
+
+EMILIA_BONUS = 10            # resolve_attack
+HELENE_HEAL = 8              # enemy_counterattack
+CHRISTOPHER_HIT = 15         # _companion_intercept: Schaden am Begleiter
+CHRISTOPHER_STUN = 3         # Züge außer Gefecht bei companion_hp 0
+CHRISTOPHER_HEAL = 5         # _companion_post_combat_heal
+
+OUTCOME_OPEN, OUTCOME_WIN, OUTCOME_DEATH, OUTCOME_TIMEOUT = 0, 1, 2, 3
+OUTCOME_NAMES = {OUTCOME_WIN: 'win', OUTCOME_DEATH: 'death', OUTCOME_TIMEOUT: 'timeout'}
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("combat_tables braucht NumPy (uv sync --extra tools / pip install numpy)")
+
+
+class CombatGrid:
+    """Kombinationen der Achsen AXES als flache Parameter-Arrays (eine Zelle je Kombination)."""
+
+    def __init__(self, weapon_keys, enemy_keys, companions=COMPANIONS,
+                 hunger=HUNGER_STATES, strength=STRENGTH_STATES, godmode=GODMODE_STATES):
+        _require_numpy()
+        import engine
+        self.values = dict(zip(AXES, (tuple(weapon_keys), tuple(enemy_keys), tuple(companions),
+                                      tuple(hunger), tuple(strength), tuple(godmode))))
+        index = np.indices([len(v) for v in self.values.values()]).reshape(len(AXES), -1)
+        self.index = dict(zip(AXES, index))
+        w, en, c = self.index['weapon'], self.index['enemy'], self.index['companion']
+        companion = np.array(self.values['companion'])[c]
+
+        self.weapon_damage = np.array([engine.weapons[k]['damage'][1] for k in weapon_keys])[w]
+        self.enemy_health = np.array([engine.enemies[k]['max_health'] for k in enemy_keys])[en]
+        self.enemy_damage = np.array([engine.enemies[k]['damage'][0] for k in enemy_keys])[en]
+        self.immune = np.array([bool(engine.enemies[k].get('immune_to_weapons')) for k in enemy_keys])[en]
+        self.godmode = np.array(self.values['godmode'], dtype=bool)[self.index['godmode']]
+        self.christopher = companion == 'christopher'
+        self.emilia = companion == 'emilia'
+        self.helene = companion == 'helene'
+
+    def __len__(self):
+        return self.index['weapon'].size
+
+    def cell(self, i):
+        """Achsenwerte der Zelle i als dict."""
+        return {axis: self.values[axis][int(self.index[axis][i])] for axis in AXES}
+
+
+def simulate(grid, cells, start_hp, max_turns=MAX_TURNS):
+    """Alle Kämpfe (cells[i], start_hp[i]) parallel bis Sieg, Tod oder max_turns.
+
+    → dict mit Arrays outcome, turns, hp (danach) und damage (erlittener Schaden)
+    """
+    _require_numpy()
+    cells = np.asarray(cells)
+    n = cells.size
+    godmode = grid.godmode[cells]
+    immune = grid.immune[cells]
+    christopher = grid.christopher[cells]
+    helene = grid.helene[cells]
+    enemy_damage = grid.enemy_damage[cells]
+    # Spielerschaden ohne Godmode ist je Zelle konstant
+    hit = np.where(immune, 1, grid.weapon_damage[cells] + np.where(grid.emilia[cells], EMILIA_BONUS, 0))
+    intercepted = np.maximum(1, enemy_damage // 2)
+
+    hp = np.asarray(start_hp, dtype=np.int64).copy()
+    enemy_hp = grid.enemy_health[cells].astype(np.int64)
+    companion_hp = np.full(n, 100, dtype=np.int64)
+    stunned = np.zeros(n, dtype=np.int64)
+    damage = np.zeros(n, dtype=np.int64)
+    outcome = np.full(n, OUTCOME_OPEN, dtype=np.int8)
+    turns = np.full(n, max_turns, dtype=np.int64)
+
+    for turn in range(1, max_turns + 1):
+        active = outcome == OUTCOME_OPEN
+        if not active.any():
+            break
+        enemy_hp -= np.where(active, np.where(godmode, enemy_hp + 1, hit), 0)
+
+        won = active & (enemy_hp <= 0)
+        outcome[won] = OUTCOME_WIN
+        turns[won] = turn
+        healed = won & christopher & (hp < 100)
+        hp[healed] = np.minimum(100, hp[healed] + CHRISTOPHER_HEAL)
+
+        # Gegenangriff (_companion_intercept → Schaden → Helene)
+        hit_back = active & ~won & ~godmode
+        guard = hit_back & christopher
+        recovering = guard & (stunned > 0)
+        guarding = guard & (stunned == 0)
+        stunned[recovering] -= 1
+        companion_hp[guarding] = np.maximum(0, companion_hp[guarding] - CHRISTOPHER_HIT)
+        stunned[guarding & (companion_hp <= 0)] = CHRISTOPHER_STUN
+        taken = np.where(guarding, intercepted, enemy_damage) * hit_back
+        hp -= taken
+        damage += taken
+        mended = hit_back & helene & (hp > 0)
+        hp[mended] = np.minimum(100, hp[mended] + HELENE_HEAL)
+
+        died = hit_back & (hp <= 0)
+        outcome[died] = OUTCOME_DEATH
+        turns[died] = turn
+        hp[died] = 0
+
+    outcome[outcome == OUTCOME_OPEN] = OUTCOME_TIMEOUT
+    return {'outcome': outcome, 'turns': turns, 'hp': hp, 'damage': damage}
+
+
+def _summarize(grid, cells, result, weights=None):
+    """Erwartungswerte je Zelle (gewichtet, Summe der Gewichte je Zelle = 1)."""
+    n = len(grid)
+    if weights is None:
+        weights = np.full(cells.size, 1.0 / np.bincount(cells, minlength=n)[cells])
+
+    def mean(values, mask=None):
+        w = weights if mask is None else weights * mask
+        return np.bincount(cells, w * values, minlength=n), np.bincount(cells, w, minlength=n)
+
+    outcome = result['outcome']
+    p_win = mean(outcome == OUTCOME_WIN)[0]
+    p_death = mean(outcome == OUTCOME_DEATH)[0]
+    p_timeout = mean(outcome == OUTCOME_TIMEOUT)[0]
+    turns_sum, win_weight = mean(result['turns'], outcome == OUTCOME_WIN)
+    expected_damage = mean(result['damage'])[0]
+    rows = []
+    for i in range(n):
+        row = grid.cell(i)
+        row.update(
+            win_probability=round(float(p_win[i]), 4),
+            death_probability=round(float(p_death[i]), 4),
+            timeout_probability=round(float(p_timeout[i]), 4),
+            expected_turns_to_kill=round(float(turns_sum[i] / win_weight[i]), 3) if win_weight[i] > 0 else None,
+            expected_damage_taken=round(float(expected_damage[i]), 3),
+        )
+        rows.append(row)
+    return rows
+
+
+def exact_table(grid, hp_min=DEFAULT_HP_MIN, max_turns=MAX_TURNS):
+    """Erwartungswerte bei gleichverteilter Start-HP in [hp_min, 100] (alle HP-Werte ausgewertet)."""
+    hp_values = np.arange(hp_min, 101)
+    cells = np.repeat(np.arange(len(grid)), hp_values.size)
+    start_hp = np.tile(hp_values, len(grid))
+    return _summarize(grid, cells, simulate(grid, cells, start_hp, max_turns))
+
+
+def sampled_table(grid, trials, hp_min=DEFAULT_HP_MIN, max_turns=MAX_TURNS, seed=0):
+    """Wie balance_runner: trials zufällige Start-HP je Zelle."""
+    rng = np.random.default_rng(seed)
+    cells = np.repeat(np.arange(len(grid)), trials)
+    start_hp = rng.integers(hp_min, 101, size=cells.size)
+    return _summarize(grid, cells, simulate(grid, cells, start_hp, max_turns))
+
+
+def cross_check(grid, samples, hp_min=DEFAULT_HP_MIN, max_turns=MAX_TURNS, seed=0):
+    """Vergleicht samples zufällige Kämpfe mit der skalaren Engine → Liste der Abweichungen."""
+    import balance_runner
+    rng = np.random.default_rng(seed)
+    cells = rng.integers(0, len(grid), size=samples)
+    start_hp = rng.integers(hp_min, 101, size=samples)
+    result = simulate(grid, cells, start_hp, max_turns)
+
+    balance_runner._init_worker()
+    mismatches = []
+    for k in range(samples):
+        cell = grid.cell(int(cells[k]))
+        expected = balance_runner.simulate_fight(
+            cell['weapon'], cell['enemy'], cell['companion'], int(start_hp[k]), max_turns,
+            hunger=cell['hunger'], strength=cell['strength'], godmode=cell['godmode'])
+        got = (OUTCOME_NAMES[int(result['outcome'][k])], int(result['turns'][k]), int(result['hp'][k]))
+        if got != expected:
+            mismatches.append({'cell': cell, 'hp': int(start_hp[k]), 'engine': expected, 'numpy': got})
+    return mismatches
+
+
+def _write(rows, path):
+    if path.endswith('.csv'):
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2, ensure_ascii=False)
+
+
+def main(argv=None):
+    import engine
+
+    parser = argparse.ArgumentParser(description='Dead World Kampf-Tabellen (NumPy)')
+    parser.add_argument('--mode', choices=('exact', 'sampled'), default='exact')
+    parser.add_argument('--trials', type=int, default=200, help='Start-HP-Stichproben je Zelle (sampled)')
+    parser.add_argument('--weapons', default=','.join(engine.weapons))
+    parser.add_argument('--enemies', default=','.join(engine.enemies))
+    parser.add_argument('--companions', default=','.join(COMPANIONS))
+    parser.add_argument('--hp-min', type=int, default=DEFAULT_HP_MIN)
+    parser.add_argument('--max-turns', type=int, default=MAX_TURNS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--check', type=int, metavar='N', default=0,
+                        help='N zufällige Kämpfe gegen die Engine prüfen (Exit 1 bei Abweichung)')
+    parser.add_argument('--out', help='Tabelle als JSON oder CSV (.csv) schreiben')
+    args = parser.parse_args(argv)
+    if np is None:
+        parser.error("NumPy ist nicht installiert (pip install numpy)")
+
+    def keys(text, valid):
+        chosen = [k.strip() for k in text.split(',') if k.strip()]
+        unknown = [k for k in chosen if k not in valid]
+        if unknown:
+            parser.error(f"Unbekannt: {', '.join(unknown)}")
+        return chosen
+
+    grid = CombatGrid(keys(args.weapons, engine.weapons), keys(args.enemies, engine.enemies),
+                      keys(args.companions, COMPANIONS))
+    start = time.perf_counter()
+    if args.mode == 'exact':
+        rows = exact_table(grid, args.hp_min, args.max_turns)
+        fights = len(grid) * (101 - args.hp_min)
+    else:
+        rows = sampled_table(grid, args.trials, args.hp_min, args.max_turns, args.seed)
+        fights = len(grid) * args.trials
+    seconds = time.perf_counter() - start
+    print(f"[TABELLE] {len(grid)} Zellen, {fights} Kämpfe in {seconds * 1000:.1f} ms ({args.mode})")
+    if args.out:
+        _write(rows, args.out)
+
+    if args.check:
+        mismatches = cross_check(grid, args.check, args.hp_min, args.max_turns, args.seed)
+        for m in mismatches[:10]:
+            print(f"[CHECK] {m['cell']} HP {m['hp']}: Engine {m['engine']} ≠ NumPy {m['numpy']}")
+        print(f"[CHECK] {args.check} Kämpfe gegen die Engine, {len(mismatches)} Abweichung(en)")
+        if mismatches:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
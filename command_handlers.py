@@ -5,21 +5,19 @@
 # False otherwise. The main process_command() uses these as a
 # dispatcher chain.
 #
-# IMPORTANT: This module must NOT import from the main game file
+# IMPORTANT: This module must NOT import from the game core (engine.py)
 # at module level. Instead, it receives references at init time.
+# It must not import pygame either — the engine runs headless.
 
-import random
-import datetime
-import pygame
 from config import *
 
 
 
-_game = None  # Reference to main game module (set at runtime)
+_game = None  # Reference to the engine module (set at runtime)
 
 
 def init_handlers(game_module):
-    """Call once at startup. Pass the main game module so handlers can
+    """Call once at startup. Pass the engine module so handlers can
     access add_to_history, rooms, player_inventory, player_stats, etc."""
     global _game
     _game = game_module
@@ -82,8 +80,9 @@ def handle_help(cmd):
     _h("  karte, map - Standort-Info anzeigen")
     _h("")
     _h("System:")
-    _h("  save, speichern - Spiel speichern")
-    _h("  restore, laden - Spiel laden")
+    _h("  save, speichern [slot] - Spiel speichern (Slot 1 ohne Angabe)")
+    _h("  restore, laden [slot] - Spiel laden (auch auto1, auto2 …)")
+    _h("  spielstände, slots - Belegte Slots anzeigen")
     _h("  score, punkte - Punkte anzeigen")
     _h("  zeit - Spielzeit anzeigen")
     _h("  diagnose, d - Gesundheits- und Zustandsbericht")
@@ -645,9 +644,43 @@ def _reset_player():
 # ========================
 # SYSTEM COMMANDS
 # ========================
+def _slot_arg(words, allowed):
+    """Slot aus 'save 2' / 'restore auto1' (ohne Angabe → Slot 1), None bei ungültigem Slot."""
+    if len(words) == 1:
+        return _game.DEFAULT_SLOT
+    slot = words[1]
+    if slot in allowed:
+        return slot
+    _h(f"Unbekannter Slot '{slot}'. Möglich: {', '.join(allowed)}")
+    _h("")
+    return None
+
+
+def _list_save_slots():
+    """Slot-Übersicht aus dem Index (liest keine Spielstände)."""
+    slots = _game.save_slots()
+    entries = dict(slots.entries())
+    _h("═══ SPIELSTÄNDE ═══")
+    for slot in slots.ids:
+        meta = entries.get(slot)
+        label = f"Slot {slot}" if slot in slots.manual else f"Auto {slot[4:]}"
+        if meta is None:
+            _h(f"  {label:<8} — leer —")
+            continue
+        saved_at = str(meta.get('timestamp', '?'))[:16].replace('T', ' ')
+        if 'room_name' not in meta:
+            _h(f"  {label:<8} Spielstand ohne Details, {saved_at}")
+            continue
+        secs = meta.get('elapsed_ms', 0) // 1000
+        played = f"{secs // 3600:02d}:{secs % 3600 // 60:02d}:{secs % 60:02d}"
+        _h(f"  {label:<8} {meta['room_name']}")
+        _h(f"  {'':<8} Punkte {meta.get('score', 0)} · Züge {meta.get('moves', 0)} · Spielzeit {played} · {saved_at}")
+    _h("")
+
+
 def handle_system_commands(cmd):
     """Handles: clear, echo, time, whoami, neu, verbose/brief/superbrief,
-    info, quit, save, restore, score, zeit, diagnose"""
+    info, quit, save, restore, spielstände, score, zeit, diagnose"""
 
     if cmd in ('clear', 'cls'):
         _game.game_history.clear()
@@ -662,7 +695,7 @@ def handle_system_commands(cmd):
         return True
 
     if cmd == 'time':
-        now = datetime.datetime.now()
+        now = _game.wall_time()
         _h(f"Aktuelle Zeit: {now.strftime('%H:%M:%S')}")
         _h(f"Datum: {now.strftime('%d.%m.%Y')}")
         _h("")
@@ -687,7 +720,6 @@ def handle_system_commands(cmd):
         _game.rooms['start']['first_visit'] = True
         _game.rooms['start']['enemy'] = 'zombie'
         _game.rooms['start']['items'] = ['feuerlöscher', 'zeitung']
-        _game.reset_transitions()
         _game.start_game()
         return True
 
@@ -732,12 +764,21 @@ def handle_system_commands(cmd):
         _h("")
         return True
 
-    if cmd in ('save', 'speicher', 'speichern'):
-        _game.save_game()
+    words = cmd.split()
+    if words and words[0] in ('save', 'speicher', 'speichern') and len(words) <= 2:
+        slot = _slot_arg(words, _game.save_slots().manual)
+        if slot:
+            _game.save_game(slot)
+        return True
+
+    if words and words[0] in ('restore', 'laden') and len(words) <= 2:
+        slot = _slot_arg(words, _game.save_slots().ids)
+        if slot:
+            _game.restore_game(slot)
         return True
 
-    if cmd in ('restore', 'laden'):
-        _game.restore_game()
+    if cmd in ('spielstände', 'spielstaende', 'slots'):
+        _list_save_slots()
         return True
 
     if cmd in ('score', 'punkte'):
@@ -748,7 +789,7 @@ def handle_system_commands(cmd):
 
     if cmd == 'zeit':
         _h(f"Spielzeit: {_game.format_elapsed_time()}")
-        ticks_total = pygame.time.get_ticks() - _game.game_start_ticks
+        ticks_total = _game.get_ticks() - _game.game_start_ticks
         _h(f"Pygame Ticks: {ticks_total}")
         _h("")
         return True
@@ -1897,20 +1938,20 @@ def handle_unknown_command(cmd, words):
     # 2) Logisch unmögliche Aktionen
     if verb in ('esse', 'iss') and obj:
         if obj in weapons:
-            _h(random.choice(ILLOGICAL_RESPONSES['eat_weapon']))
+            _h(_game.rng.flavor.choice(ILLOGICAL_RESPONSES['eat_weapon']))
             _h("")
             return
         if obj in all_known_items and obj not in food_items:
-            _h(random.choice(ILLOGICAL_RESPONSES['eat_inedible']))
+            _h(_game.rng.flavor.choice(ILLOGICAL_RESPONSES['eat_inedible']))
             _h("")
             return
     if verb in ('ausrüsten',) and obj:
         if obj in food_items:
-            _h(random.choice(ILLOGICAL_RESPONSES['equip_food']))
+            _h(_game.rng.flavor.choice(ILLOGICAL_RESPONSES['equip_food']))
             _h("")
             return
         if obj in all_known_items and obj not in weapons:
-            _h(random.choice(ILLOGICAL_RESPONSES['equip_non_weapon']))
+            _h(_game.rng.flavor.choice(ILLOGICAL_RESPONSES['equip_non_weapon']))
             _h("")
             return
 
@@ -1938,6 +1979,107 @@ def handle_unknown_command(cmd, words):
 
     # 5) Unbekanntes Verb
     if verb and verb not in KNOWN_VERBS:
-        resp = random.choice(UNKNOWN_VERB_RESPONSES).format(verb=verb)
+        resp = _game.rng.flavor.choice(UNKNOWN_VERB_RESPONSES).format(verb=verb)
         _h(resp)
         _h("")
+
+
+# ========================
+# DISPATCH TABLE
+# ========================
+# Each handler declares the first words it can react to. dispatch() looks
+# the first token up once in a dict and only calls the matching handlers —
+# in the same order as the old if-chain in process_command. Handlers that
+# inspect the whole input (substrings, pending numpad code) are registered
+# as catch_all and run for every token.
+
+_registered = []            # [(handler, verbs, prefixes, catch_all, pass_raw)] in Kettenreihenfolge
+_dispatch_table = {}        # erstes Token -> Tupel passender Einträge
+_DISPATCH_TABLE_MAX = 1024  # Unbekannte Tokens (Tippfehler) lassen die Tabelle nicht endlos wachsen
+
+
+def register_handler(handler, verbs=(), prefixes=(), catch_all=False, pass_raw=False):
+    """Hängt einen Handler an die Dispatch-Reihenfolge an.
+
+    verbs     — erste Wörter, auf die der Handler reagiert
+    prefixes  — Wortanfänge (z.B. 'schlag' für schlag/schlage/schlagen)
+    catch_all — Handler prüft die ganze Eingabe, läuft für jedes Token
+    pass_raw  — Handler bekommt zusätzlich den Rohbefehl (vor der Wort-Auflösung)
+    """
+    _registered.append((handler, frozenset(verbs), tuple(prefixes), catch_all, pass_raw))
+    _dispatch_table.clear()
+
+
+def _compile_token(token):
+    return tuple(
+        entry for entry in _registered
+        if entry[3] or token in entry[1] or (entry[2] and token.startswith(entry[2]))
+    )
+
+
+def handlers_for(token):
+    """Handler-Einträge für ein erstes Token (O(1) nach dem ersten Aufruf)."""
+    entries = _dispatch_table.get(token)
+    if entries is None:
+        if len(_dispatch_table) >= _DISPATCH_TABLE_MAX:
+            compile_dispatch_table()
+        entries = _dispatch_table[token] = _compile_token(token)
+    return entries
+
+
+def compile_dispatch_table():
+    """Baut die Tabelle für alle bekannten Verben vorab (KNOWN_VERBS,
+    VERBS_NEED_OBJECT und alle registrierten Verben)."""
+    _dispatch_table.clear()
+    tokens = set(KNOWN_VERBS) | set(VERBS_NEED_OBJECT) | {''}
+    for entry in _registered:
+        tokens |= entry[1]
+    for token in tokens:
+        _dispatch_table[token] = _compile_token(token)
+
+
+def dispatch(cmd, raw_cmd, words):
+    """Führt den Befehl über die Dispatch-Tabelle aus. Nicht behandelte
+    Eingaben landen im reaktiven Parser (handle_unknown_command)."""
+    token = words[0] if words else ''
+    for handler, _verbs, _prefixes, _catch_all, pass_raw in handlers_for(token):
+        if handler(cmd, raw_cmd) if pass_raw else handler(cmd):
+            return True
+    handle_unknown_command(cmd, words)
+    return False
+
+
+register_handler(handle_godmode, verbs=('godmode', 'tp', 'teleport'), pass_raw=True)
+register_handler(handle_help, verbs=('hilfe', 'help', '?'))
+register_handler(handle_movement, verbs=('gehe', *_DIRECTION_MAP))
+register_handler(handle_item_commands, verbs=(
+    'nimm', 'lese', 'lies', 'lesen', 'inventar', 'inv', 'i',
+    'esse', 'iss', 'nutze', 'benutze',
+))
+register_handler(handle_examine_command, verbs=('untersuche', 'untersuchen', 'u'))
+register_handler(handle_look_map, verbs=('schaue', 'look', 'l', 'karte', 'map'))
+register_handler(handle_reload, verbs=('nachladen', 'reload', 'laden'))
+register_handler(handle_combat_commands,
+    verbs=(
+        'ziehe', 'zieh', 'tanga', 'tangazieher', 'hosenzieher',   # Tangazieher
+        'ausrüsten', 'ignoriere', 'ignore', 'ignorier',
+    ),
+    prefixes=(
+        'schieß', 'schiess', 'schlag', 'stich', 'töte', 'tote',
+        'greif', 'kämpf', 'angriff', 'attacke',
+    ),
+)
+register_handler(handle_container_commands,
+    verbs=('öffne', 'oeffne', 'lege', 'nimm', 'schaue', 'schau'),
+    prefixes=('schließ', 'schliess'),
+)
+register_handler(handle_interaction_commands, catch_all=True)
+register_handler(handle_system_commands, verbs=(
+    'clear', 'cls', 'echo', 'time', 'whoami', 'neu',
+    'verbose', 'ausführl', 'ausführli', 'ausführlich', 'brief', 'kurz',
+    'superbrie', 'superkur', 'superkurz', 'superbrief', 'info',
+    'q', 'quit', 'beenden', 'save', 'speicher', 'speichern',
+    'restore', 'laden', 'spielstände', 'spielstaende', 'slots',
+    'score', 'punkte', 'zeit', 'diagnose', 'd',
+))
+compile_dispatch_table()
@@ -11,6 +11,15 @@ import os
 # ========================
 WIDTH, HEIGHT = 1920, 1080
 FPS = 60
+FPS_IDLE = 10                 # Framerate wenn nichts animiert (Lesen)
+FPS_PULSE = 30                # Framerate für langsame Puls-Animationen (Menüs, Hinweise)
+INPUT_ACTIVE_MS = 300         # Nach einer Eingabe so lange volle FPS halten
+IDLE_SLEEP_AFTER_MS = 3000    # Ab so langer Untätigkeit auf Events blockieren
+IDLE_WAIT_TIMEOUT_MS = 250    # Max. Wartezeit im Schlafmodus (Cursor-Blinken)
+
+# Frame-Profiler (frame_profiler.py): F3 = Overlay an/aus, F4 = CSV schreiben
+PROFILER_ENV_VAR = 'DEAD_WORLD_PROFILE'  # =1 → Profiler ab Start aktiv
+PROFILER_HISTORY = 600        # Gespeicherte Frames (gleitendes Fenster)
 REFERENCE_WIDTH = 1920    
 REFERENCE_HEIGHT = 1080
 
@@ -26,6 +35,15 @@ RESOLUTION_PRESETS = [
 # Terminal-Font (Cascadia Code = moderner Microsoft-Monospace-Font)
 TERMINAL_FONT_NAME = "cascadiacode"
 
+# Max. Anzahl gecachter Zeilen-Surfaces (LRU) für den Terminal-Verlauf
+LINE_CACHE_SIZE = 512
+
+# Max. Zeilen des Terminal-Verlaufs im Speicher (Ringpuffer, ältere → Transcript)
+HISTORY_CAPACITY = 10000
+
+# Max. Anzahl gecachter Glow-Sprites (LRU) für draw_text_glow (Eingabezeile)
+GLOW_CACHE_SIZE = 64
+
 # ========================
 # GAME STATES
 # ========================
@@ -123,6 +141,8 @@ key_repeat_delay = 35
 # TYPEWRITER EFFECT
 # ========================
 TYPEWRITER_SPEED = 1  # Millisekunden pro Zeichen (1 = extrem schnell)
+TYPEWRITER_SKIP = False  # True = Ausgabe sofort komplett anzeigen (z.B. für geskriptete Durchläufe)
+HEADLESS_MAX_CHARS = 80  # Zeilenbreite für das Word-Wrapping ohne Fenster (engine.py)
 
 # ========================
 # COMBAT SYSTEM
@@ -292,4 +312,14 @@ OUTDOOR_ROOMS = {
 # ========================
 import sys as _sys
 _SAVE_DIR = os.path.dirname(_sys.executable) if getattr(_sys, 'frozen', False) else os.path.dirname(os.path.abspath(__file__))
-SAVE_FILE = os.path.join(_SAVE_DIR, 'dead_world_save.json')
+SAVE_FILE = os.path.join(_SAVE_DIR, 'dead_world_save.json')  # Slot 1, weitere Slots daneben (save_slots.py)
+SAVE_SLOTS = 3                # Manuelle Slots: save 1 … save 3
+AUTOSAVE_SLOTS = 2            # Rotierende Autosaves: auto1, auto2 (0 = kein Autosave)
+AUTOSAVE_INTERVAL_MOVES = 25  # Autosave alle N Züge im Frontend (0 = aus)
+PROFILER_CSV_FILE = os.path.join(_SAVE_DIR, 'dead_world_profile.csv')
+# Transcript für Verlaufszeilen, die aus dem Ringpuffer fallen (None = verwerfen)
+HISTORY_SPILL_FILE = os.path.join(_SAVE_DIR, 'dead_world_transcript.jsonl')
+# Aufzeichnung aller Eingaben der Sitzung (Replay: python input_recorder.py <datei>)
+RECORD_SESSIONS = False                # Standard aus — einschalten hier oder per RECORD_ENV_VAR
+RECORD_ENV_VAR = 'DEAD_WORLD_RECORD'   # =1 → Sitzung aufzeichnen
+RECORDING_FILE = os.path.join(_SAVE_DIR, 'dead_world_session.log')
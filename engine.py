@@ -0,0 +1,4640 @@
+# ============================================================
+# engine.py — Headless Game Core for Dead World
+# ============================================================
+# World data (rooms, items, flags, player stats) and all game logic:
+# parser, movement, combat, containers, save/restore. This module must
+# NOT import pygame — it runs in plain Python (simulations, replays,
+# benchmarks).
+#
+# Everything that belongs to the presentation layer (sounds, music,
+# clock, line width, terminal theme) goes through a frontend object set
+# via init_frontend(). Without one, HeadlessFrontend (all no-ops) is used.
+# The pygame frontend (dead_world_intro_v_omega.py) passes itself.
+#
+# Like the rest of the game, the world state lives at module level:
+# ONE live game per process. Parallel runs need one process per game
+# (e.g. multiprocessing), not several Engine objects.
+
+import sys
+import copy
+import json
+import time
+import hashlib
+import os
+import datetime
+import functools
+from collections import deque
+from config import *
+import command_handlers
+from prefix_index import PrefixIndex, rank_candidates
+from room_graph import RoomGraph, EdgeIndex
+from history_buffer import HistoryBuffer
+from rng_service import RngService
+from save_writer import write_atomic
+from save_slots import SaveSlots, DEFAULT_SLOT
+
+
+# ========================
+# FRONTEND-SCHNITTSTELLE
+# ========================
+class HeadlessFrontend:
+    """Frontend ohne Ausgabe — jeder Hook ist ein No-op.
+
+    Ein Frontend muss genau diese Funktionen anbieten (als Methoden oder,
+    wie das pygame-Frontend, als Modulfunktionen)."""
+
+    def play_random_zombie_sound(self):
+        pass
+
+    def play_zombie_dying_sound(self):
+        pass
+
+    def play_random_gun_sound(self):
+        pass
+
+    def play_random_punch_sound(self):
+        pass
+
+    def stop_zombie_sounds(self):
+        pass
+
+    def stop_combat_sounds(self):
+        pass
+
+    def fade_zombie_sounds(self):
+        pass
+
+    def start_ambient_music(self):
+        pass
+
+    def start_combat_music(self):
+        pass
+
+    def stop_combat_resume_ambient(self):
+        pass
+
+    def get_ticks(self):
+        """Millisekunden seit Start (wie pygame.time.get_ticks)."""
+        return int(time.monotonic() * 1000)
+
+    def get_max_chars(self):
+        """Zeichen pro Zeile für das Word-Wrapping."""
+        return HEADLESS_MAX_CHARS
+
+    def on_output(self):
+        """Neue Absätze liegen in output_queue."""
+        pass
+
+    def get_terminal_color(self):
+        return 2
+
+    def apply_terminal_theme(self, index):
+        pass
+
+
+_frontend = HeadlessFrontend()
+
+
+def init_frontend(frontend):
+    """Bindet das Frontend (None → HeadlessFrontend)."""
+    global _frontend
+    _frontend = frontend if frontend is not None else HeadlessFrontend()
+
+
+# Dünne Weiterleitungen — Spiellogik und command_handlers rufen nur diese auf
+def play_random_zombie_sound():
+    _frontend.play_random_zombie_sound()
+
+def play_zombie_dying_sound():
+    _frontend.play_zombie_dying_sound()
+
+def play_random_gun_sound():
+    _frontend.play_random_gun_sound()
+
+def play_random_punch_sound():
+    _frontend.play_random_punch_sound()
+
+def stop_zombie_sounds():
+    _frontend.stop_zombie_sounds()
+
+def stop_combat_sounds():
+    _frontend.stop_combat_sounds()
+
+def fade_zombie_sounds():
+    _frontend.fade_zombie_sounds()
+
+def start_ambient_music():
+    _frontend.start_ambient_music()
+
+def start_combat_music():
+    _frontend.start_combat_music()
+
+def stop_combat_resume_ambient():
+    _frontend.stop_combat_resume_ambient()
+
+def get_ticks():
+    return _clock.get_ticks() if _clock is not None else _frontend.get_ticks()
+
+def wall_time():
+    """Aktuelle Uhrzeit (datetime) — von der injizierten Uhr, sonst System."""
+    return _clock.now() if _clock is not None else datetime.datetime.now()
+
+
+# Zufall und Uhr (siehe rng_service.py)
+rng = RngService()  # Ströme: rng.gameplay, rng.flavor, rng.audio
+_clock = None       # None → Ticks vom Frontend, Uhrzeit vom System
+
+
+def init_clock(clock):
+    """Bindet eine Uhr mit get_ticks()/now(), z.B. ManualClock (None → Frontend + System)."""
+    global _clock
+    _clock = clock
+
+
+# Aufnahme der Eingaben (siehe input_recorder.py)
+_recorder = None
+_entry_depth = 0    # > 0 während ein Eingabe-Einstieg läuft
+
+
+def init_recorder(recorder):
+    """Bindet einen CommandRecorder (None → keine Aufnahme)."""
+    global _recorder
+    _recorder = recorder
+
+
+def _record(kind, *payload):
+    if _recorder is not None:
+        _recorder.record(kind, get_ticks(), *payload)
+
+
+def _input_entry(kind):
+    """Markiert einen Einstiegspunkt für Eingaben. Aufgezeichnet wird nur der
+    äußerste Aufruf — was er selbst auslöst, passiert beim Replay erneut."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def entry(*args):
+            global _entry_depth
+            if _entry_depth == 0:
+                _record(kind, *args)
+            _entry_depth += 1
+            try:
+                return fn(*args)
+            finally:
+                _entry_depth -= 1
+        return entry
+    return decorate
+
+
+# Spielstände im Hintergrund schreiben (siehe save_writer.py)
+_save_writer = None
+
+
+def init_save_writer(writer):
+    """Bindet einen SaveWriter (None → save_game schreibt synchron)."""
+    global _save_writer
+    _save_writer = writer
+
+
+def _flush_saves():
+    """Vor dem Lesen des Spielstands: ausstehende Schreibvorgänge abwarten."""
+    if _save_writer is not None:
+        _save_writer.flush()
+
+
+# Spielstand-Slots (siehe save_slots.py)
+_save_slots = None
+_autosave_interval = 0  # Züge zwischen Autosaves, 0 = aus (schaltet das Frontend ein)
+
+
+def save_slots():
+    """SaveSlots zum aktuellen SAVE_FILE (Tools biegen SAVE_FILE um)."""
+    global _save_slots
+    if _save_slots is None or _save_slots.base_path != SAVE_FILE:
+        _save_slots = SaveSlots(SAVE_FILE)
+    return _save_slots
+
+
+def init_autosave(interval_moves):
+    """Autosave alle interval_moves gezählten Züge (0/None oder AUTOSAVE_SLOTS = 0 → aus)."""
+    global _autosave_interval
+    _autosave_interval = (interval_moves or 0) if save_slots().autosaves else 0
+
+
+def _reseed(seed=None):
+    """Setzt den RNG-Seed (None → nächster der Kette) und zeichnet ihn auf."""
+    if seed is None:
+        rng.advance()
+    else:
+        rng.reseed(seed)
+    _record('s', rng.seed)
+    return rng.seed
+
+
+
+# Text Adventure Game Data
+current_room = 'start'
+game_history = HistoryBuffer(HISTORY_CAPACITY)  # Fertig angezeigte Absätze (text, color), Ringpuffer
+output_queue = deque()         # Noch nicht angezeigte Absätze (text, color) — das Frontend tippt sie ab
+player_inventory = []
+prolog_shown = False
+prolog_lines = []
+prolog_line_index = 0
+
+# Command History für Pfeiltasten
+command_history = []
+history_index = -1
+
+visited_rooms = set()  # Besuchte Räume (zB. für Resets/Stats)
+credits_pending = False # True sobald das Friedhof-Event vorbei → Credits beim nächsten ENTER
+
+#Biblio
+bibliothek_4_schrank_geschoben = False
+#Haus1 Tür
+haus1_tür_auf = True
+#Haus1 Dachbodentür
+haus1_dachbodentür_auf = False
+#Haus1 boxes
+haus1_dachboden_box_geschoben = False
+#Haus1 Nachttisch
+nachtschrank_auf = False
+#Safe
+safe_auf_haus1 = False
+safe_durchsucht_haus1 = False
+# Numpad: wartet der naechste Befehl auf den 6-stelligen Code? (Pygame-freundlich, kein input())
+numpad_awaiting_code = False
+#krankenhaus
+krankenhaus_schrank_geschoben = False
+numpad_nutzen = False
+#Coffeeshop Gasse
+coffeeshop_tür_auf = False
+gasse_ende_untersucht = False
+#Christopher Thomson (NPC – Coffeeshop)
+christopher_getroffen = False   # Erstkontakt bereits gezeigt?
+christopher_dialog_index = 0    # Gesprächsfortschritt
+#Emilia & Helene Albrecht (NPCs – Waldhaus)
+emilia_getroffen = False         # Erstkontakt Waldhaus bereits gezeigt?
+emilia_dialog_index = 0          # Gesprächsfortschritt Emilia
+helene_dialog_index = 0          # Gesprächsfortschritt Helene
+#Friedhof Boss Event
+friedhof_boss_intro_gezeigt = False   # Boss-Intro beim Betreten gezeigt
+friedhof_event_abgeschlossen = False  # Gesamte Sequenz abgeschlossen
+christopher_verletzt = False          # Christopher nach dem Friedhof-Event
+#Skyscraper 1
+skyscraper1_rezeption_untersucht = False
+
+# Kampfsystem (ZOMBIE_RESPAWN_COOLDOWN in config.py)
+zombie_kill_times = {}  # room_key -> get_ticks() wann Zombie zuletzt getötet wurde
+player_deaths = 0       # Tode der Sitzung (übersteht den Neustart, für Statistik)
+last_death_room = None  # Raum des letzten Todes
+
+player_stats = {   
+    'health': 100,
+    'strength': 100,              # Hidden strength (0-100) – never shown as number
+    'hunger': 0,                  # Hidden hunger (0-100) – never shown as number
+    'max_weight': 50,             # Hidden carry capacity
+    'equipped_weapon': None,
+    'weapon_type': None,  # 'ranged', 'melee', None
+    'in_combat': False,
+    'turns_since_last_meal': 0,   # Hunger tick counter
+    'last_recovery_turn': 0,      # Passive recovery tracker
+    # NPC-Begleiter-System
+    'companion': None,            # None | 'christopher' | 'christopher_waiting'
+    'companion_hp': 100,          # Begleiter-Lebenspunkte (0 = betäubt)
+    'companion_stunned_turns': 0, # Züge bis Begleiter wieder helfen kann
+    # Albrecht-Begleiter (Waldhaus)
+    'emilia_following': False,    # Emilia folgt dem Spieler (Liebeskraft aktiv)
+    'helene_following': False,    # Helene folgt dem Spieler (Kräuterheilung aktiv)
+    # Cheat
+    'godmode': False,             # One-Hit-Kills, kein Gegenschaden, Teleport
+}
+
+# === CLASSIC MECHANICS: View Mode, Score, Ambiguity ===
+view_mode = 'verbose'           # 'verbose', 'brief', 'superbrief'
+visited_rooms_desc = set()      # Bereits beschriebene Räume (für brief mode)
+game_score = 0                  # Zork-style Punkte
+game_moves = 0                  # Zähler für Spielerzüge
+scored_items = set()            # Items die bereits Punkte gegeben haben
+scored_kills = set()            # Räume in denen der erste Kill bereits gezählt wurde
+game_start_ticks = 0            # get_ticks() beim Spielstart
+# SAVE_FILE importiert aus config.py
+
+# Pending Ambiguity (wenn der Parser fragt "Was meinst du?")
+pending_ambiguity = None        # {'action': str, 'candidates': [...], 'original_cmd': str}
+
+# === ITEM CLASS (Container-System) ===
+class Item:
+    """Gegenstand mit optionaler Container-Logik."""
+    def __init__(self, key, name, description='',
+                 is_container=False, capacity=5,
+                 is_open=True, is_transparent=False,
+                 weight=1, charge=-1):
+        self.key = key
+        self.name = name
+        self.description = description
+        self.is_container = is_container
+        self.capacity = capacity
+        self.is_open = is_open
+        self.is_transparent = is_transparent
+        self.contents = []          # Liste von Item-Keys
+        self.weight = weight        # Gewicht für Encumbrance-System
+        self.charge = charge        # -1 = kein Licht, 0+ = verbleibende Züge
+        self.max_charge = charge    # Original-Ladung für Reset
+
+# Item-Definitionen – Metadaten für jedes bekannte Item
+ITEM_DEFS = {
+    'feuerlöscher': Item('feuerlöscher', 'Feuerlöscher', 'Ein schwerer, roter Feuerlöscher.', weight=8),
+    'zeitung': Item('zeitung', 'Zeitung', 'Eine zerknitterte Zeitung.', weight=1),
+    'schlüssel': Item('schlüssel', 'Schlüssel', 'Ein rostiger Metallschlüssel.', weight=1),
+    'ak': Item('ak', 'AK-47', 'Eine automatische Waffe.', weight=7),
+    'notizen': Item('notizen', 'Notizen', 'Zerknitterte Labornotizen.', weight=1),
+    'fäuste': Item('fäuste', 'Fäuste', 'Deine bloßen Hände.', weight=0),
+    'konserven': Item('konserven', 'Konservendose', 'Eine ungeöffnete Konserve.', weight=2),
+    'medkit': Item('medkit', 'Medkit', 'Ein Erste-Hilfe-Kasten.', weight=3),
+    'schokoriegel': Item('schokoriegel', 'Schokoriegel', 'Ein alter Schokoriegel.', weight=1),
+    'dosenfleisch': Item('dosenfleisch', 'Dosenfleisch', 'Fragwürdig riechend.', weight=2),
+    'wasser': Item('wasser', 'Wasserflasche', 'Eine Flasche Wasser.', weight=2),
+    'energieriegel': Item('energieriegel', 'Energieriegel', 'Kompakt und nahrhaft.', weight=1),
+    'crackers': Item('crackers', 'Crackers', 'Trockene Crackers.', weight=1),
+    'apfel': Item('apfel', 'Apfel', 'Ein schrumpeliger Apfel.', weight=1),
+    'pistole': Item('pistole', 'Pistole', 'Eine halbautomatische Pistole.', weight=3),
+    'küchenmesser': Item('küchenmesser', 'Küchenmesser', 'Ein scharfes Küchenmesser.', weight=2),
+    'kampfmesser': Item('kampfmesser', 'Kampfmesser', 'Ein robustes Kampfmesser.', weight=2),
+    'baseball_schläger': Item('baseball_schläger', 'Baseball Schläger', 'Ein solider Schläger.', weight=4),
+    'axt': Item('axt', 'Axt', 'Eine scharfe Axt.', weight=6),
+    'machete': Item('machete', 'Machete', 'Eine lange Machete.', weight=4),
+    'tagebuch': Item('tagebuch', 'Tagebuch', 'Dein persönliches Tagebuch.', weight=1),
+    'stück papier': Item('stück papier', 'Stück Papier', 'Ein blutiges Stück Papier.', weight=1),
+    'taschenlampe': Item('taschenlampe', 'Taschenlampe', 'Eine Taschenlampe.', weight=2, charge=100),
+    'goldener_pfeil': Item('goldener_pfeil', 'Goldener Pfeil', 'Ein uralter, golden schimmernder Pfeil. Er strahlt eine unheimliche Energie aus.', weight=1),
+    'gehstock': Item('gehstock', 'Gehstock', 'Ein robuster, hölzerner Gehstock mit gebogenem Griff.', weight=2),
+    # --- SELTENE CONTAINER ---
+    'rucksack': Item('rucksack', 'Rucksack', 'Ein robuster Militärrucksack.',
+                     is_container=True, capacity=8, is_open=False, is_transparent=False, weight=3),
+    'kiste': Item('kiste', 'Kiste', 'Eine schwere Holzkiste.',
+                  is_container=True, capacity=5, is_open=False, is_transparent=False, weight=10),
+    'keycard_armband_lvl1': Item('keycard_armband_lvl1', 'Keycard-Armband (Stufe 1)', 'Ein RFID-Sicherheitsarmband mit Zugangslevel 1.', weight=1),
+    'keycard_armband_lvl2': Item('keycard_armband_lvl2', 'Keycard-Armband (Stufe 2)', 'Ein RFID-Sicherheitsarmband mit Zugangslevel 2.', weight=1),
+    'keycard_armband_lvl3': Item('keycard_armband_lvl3', 'Keycard-Armband (Stufe 3)', 'Ein RFID-Sicherheitsarmband mit höchstem Zugangslevel.', weight=1),
+    'coffeeshop_schlüssel': Item('coffeeshop_schlüssel', 'Coffeeshop-Schlüssel', 'Ein kleiner Schlüssel mit einem verblassten Kaffeetassen-Anhänger. Öffnet wohl eine Tür in der Nähe.', weight=1),
+    'ak_munition': Item('ak_munition', 'AK-47 Magazin', 'Ein volles 30-Schuss-Magazin für die AK-47.', weight=1),
+    'pistolen_munition': Item('pistolen_munition', 'Pistolen-Magazin', 'Ein volles 12-Schuss-Magazin für die Pistole.', weight=1),
+}
+
+def get_item_name(key):
+    """Gibt den Anzeigenamen eines Items zurück."""
+    it = ITEM_DEFS.get(key)
+    return it.name if it else key.capitalize()
+
+# === QUALITATIVE STATUS SYSTEM (Hidden Stats → Descriptive Text) ===
+
+def get_health_description(hp=None):
+    """Gibt eine qualitative Beschreibung des Gesundheitszustands zurück."""
+    if hp is None:
+        hp = player_stats['health']
+    if hp >= 100:
+        return "Du bist in perfekter Verfassung."
+    elif hp >= 80:
+        return "Du hast ein paar Kratzer, nichts Ernstes."
+    elif hp >= 60:
+        return "Du bist leicht verletzt."
+    elif hp >= 40:
+        return "Du bist deutlich angeschlagen."
+    elif hp >= 20:
+        return "Du bist schwer verwundet!"
+    else:
+        return "Du bist dem Tode nahe!"
+
+def get_strength_description(strength=None):
+    """Gibt eine qualitative Beschreibung der Stärke zurück."""
+    if strength is None:
+        strength = player_stats['strength']
+    if strength >= 80:
+        return "Du fühlst dich stark und bereit."
+    elif strength >= 60:
+        return "Du bist etwas erschöpft."
+    elif strength >= 40:
+        return "Deine Kräfte schwinden merklich."
+    elif strength >= 20:
+        return "Du bist am Ende deiner Kräfte!"
+    else:
+        return "Du kannst dich kaum noch auf den Beinen halten!"
+
+def get_hunger_description(hunger=None):
+    """Gibt eine Hungerbeschreibung zurück (oder None wenn noch harmlos)."""
+    if hunger is None:
+        hunger = player_stats['hunger']
+    if hunger >= 80:
+        return "Du fühlst dich schwach vor Hunger!"
+    elif hunger >= 60:
+        return "Du spürst einen nagenden Hunger."
+    elif hunger >= 40:
+        return "Dein Magen knurrt leise."
+    return None
+
+def get_damage_reaction(damage, current_hp):
+    """Gibt eine reaktive Beschreibung zurück wenn der Spieler Schaden nimmt."""
+    if damage >= 25:
+        reactions = [
+            "Ein brutaler Treffer! Du spürst warmes Blut an deiner Seite.",
+            "Der Schmerz durchzuckt deinen ganzen Körper!",
+            "Du taumelst zurück, die Wucht des Schlages raubt dir den Atem.",
+        ]
+    elif damage >= 15:
+        reactions = [
+            "Dieser Schlag hat wehgetan!",
+            "Du beißt die Zähne zusammen. Das wird eine Narbe geben.",
+            "Du spürst deinen Arm taub werden nach dem Treffer.",
+        ]
+    elif damage >= 8:
+        reactions = [
+            "Ein schmerzhafter Treffer, aber du hältst dich.",
+            "Du zuckst zusammen, der Schmerz ist kurz aber heftig.",
+            "Der Schlag tut weh, aber du kannst weiterkämpfen.",
+        ]
+    else:
+        reactions = [
+            "Ein leichter Kratzer, mehr nicht.",
+            "Du spürst kaum etwas — nur ein Kratzen.",
+            "Nur eine Schramme. Du schüttelst es ab.",
+        ]
+    # Add desperation when health is low
+    if current_hp <= 20 and current_hp > 0:
+        return rng.flavor.choice(reactions) + " Du spürst deine Kräfte schwinden..."
+    return rng.flavor.choice(reactions)
+
+def get_enemy_damage_reaction(damage, enemy_hp, enemy_max_hp):
+    """Gibt eine Beschreibung des Schadens am Gegner zurück."""
+    hp_ratio = enemy_hp / max(1, enemy_max_hp)
+    if enemy_hp <= 0:
+        return "Er bricht zusammen!"
+    if damage >= 40:
+        return "Ein verheerender Treffer! Der Gegner taumelt schwer."
+    elif damage >= 20:
+        return "Ein solider Treffer. Der Gegner grunzt vor Schmerz."
+    elif damage >= 10:
+        return "Ein ordentlicher Treffer!"
+    else:
+        return "Der Treffer streift ihn gerade so."
+
+def get_enemy_health_description(hp, max_hp):
+    """Gibt eine qualitative Beschreibung der Gegner-Gesundheit zurück."""
+    if hp <= 0:
+        return "Tot"
+    ratio = hp / max(1, max_hp)
+    if ratio >= 0.9:
+        return "Fast unversehrt"
+    elif ratio >= 0.7:
+        return "Leicht verwundet"
+    elif ratio >= 0.5:
+        return "Sichtbar verwundet"
+    elif ratio >= 0.3:
+        return "Schwer verletzt"
+    else:
+        return "Am Rande des Todes"
+
+def get_player_carry_weight():
+    """Berechnet das aktuelle Tragegewicht des Spielers."""
+    total = 0
+    for item_key in player_inventory:
+        idef = ITEM_DEFS.get(item_key)
+        if idef:
+            total += idef.weight
+    return total
+
+def get_encumbrance_description():
+    """Gibt eine qualitative Beschreibung der Traglast zurück."""
+    weight = get_player_carry_weight()
+    max_w = player_stats['max_weight']
+    ratio = weight / max(1, max_w)
+    if ratio >= 1.0:
+        return "Du trägst viel zu viel! Du kannst dich kaum bewegen."
+    elif ratio >= 0.8:
+        return "Dein Gepäck ist schwer. Jeder Schritt kostet Kraft."
+    elif ratio >= 0.5:
+        return "Du trägst einiges mit dir. Noch machbar."
+    else:
+        return None  # Normal — kein Kommentar nötig
+
+def get_light_warning(charge):
+    """Gibt eine Warnung zurück wenn die Lichtquelle schwach ist."""
+    if charge <= 0:
+        return "Deine Taschenlampe erlischt! Die Dunkelheit verschluckt alles."
+    elif charge <= 10:
+        return "Das Licht deiner Taschenlampe wird immer schwächer!"
+    elif charge <= 20:
+        return "Deine Taschenlampe flackert besorgniserregend."
+    return None
+
+def tick_hidden_systems():
+    """Aktualisiert alle versteckten Systeme pro Spielzug. Aufgerufen nach jedem Befehl."""
+    messages = []
+    
+    # --- HUNGER ---
+    player_stats['hunger'] = min(100, player_stats['hunger'] + 1)
+    player_stats['turns_since_last_meal'] += 1
+    
+    # Hunger-Warnungen bei Schwellen
+    hunger = player_stats['hunger']
+    if hunger == 40:
+        messages.append("Dein Magen knurrt leise.")
+    elif hunger == 60:
+        messages.append("Du spürst einen nagenden Hunger.")
+    elif hunger == 80:
+        messages.append("Du fühlst dich schwach vor Hunger!")
+    
+    # Bei extremem Hunger: Stärke reduzieren
+    if hunger > 80:
+        player_stats['strength'] = max(0, player_stats['strength'] - 1)
+    
+    # --- LICHT ---
+    for item_key in player_inventory:
+        idef = ITEM_DEFS.get(item_key)
+        if idef and idef.charge > 0:
+            idef.charge -= 1
+            warning = get_light_warning(idef.charge)
+            if warning:
+                messages.append(warning)
+    
+    # --- PASSIVE RECOVERY ---
+    if not player_stats['in_combat'] and player_stats['hunger'] < 60:
+        turn_diff = game_moves - player_stats['last_recovery_turn']
+        if turn_diff >= 5 and player_stats['health'] < 100:
+            old_hp = player_stats['health']
+            player_stats['health'] = min(100, player_stats['health'] + 2)
+            player_stats['last_recovery_turn'] = game_moves
+            if player_stats['health'] >= 100 and old_hp < 100:
+                messages.append("Du fühlst dich wieder vollständig erholt.")
+            elif player_stats['health'] > old_hp:
+                messages.append("Deine Wunden heilen langsam.")
+    
+    # --- STÄRKE RECOVERY (langsam) ---
+    if player_stats['hunger'] < 40 and player_stats['strength'] < 100:
+        if game_moves % 8 == 0:
+            player_stats['strength'] = min(100, player_stats['strength'] + 1)
+    
+    return messages
+
+# Score-Werte, Parser-System, Verb-Listen und Responses importiert aus config.py
+def spawn_chance():
+    if rng.gameplay.random() < 0.15:  # 15% statt 50% – weniger Zombie-Spam
+        return True
+    return False
+
+def zombie_respawn_ready(room_key):
+    """True wenn in room_key noch kein Zombie getötet wurde oder der Cooldown abgelaufen ist."""
+    last_kill = zombie_kill_times.get(room_key)
+    return last_kill is None or get_ticks() - last_kill >= ZOMBIE_RESPAWN_COOLDOWN * 1000
+
+# weapons, food_items, enemies importiert aus config.py
+
+current_enemy = None
+
+# Prolog Text
+PROLOG_TEXT = """"...Quarantäne-Protokoll aktiviert... alle Bürger..."
+Das Radio knackt. Draußen: Chaos. Schreie. Brennende Autos.
+
+Du bist Albert Wesker Cristal. Die Welt geht unter.
+
+Der Bunker ist drei Blocks entfernt. Du rennst. Die Stahltür öffnet sich.
+Du wirfst dich hinein. Die Tür schließt sich laut hinter dir.
+
+
+Stille. Dunkelheit. Du atmest schwer.
+
+
+Ein Tropfen. Du bist nicht allein.
+
+Etwas bewegt sich an der Decke. Es lässt sich fallen - SCHMATZ.
+
+Im grünen Notlicht siehst du es:
+Graue Haut. Schwarze Adern. Tentakel aus dem Mund.
+
+Ein Toxoplasma-Zombie. Es rennt mit Hunger auf dich zu.
+
+[Drücke ENTER]"""
+
+rooms = {
+    'start': {#Intro
+        'name': 'Bunker - Eingangshalle',
+        'description': 'Die schwere Stahltür ist verschlossen. Schwaches Notlicht erhellt den Raum grünlich. Ein Feuerlöscher hängt an der Wand. Auf dem Boden liegt eine Zeitung.',
+        'exits': {},
+        'items': ['feuerlöscher', 'zeitung'],
+        'enemy': 'zombie',
+        'first_visit': True
+    },
+    'corridor': {
+        'name': 'Korridor',
+        'description': 'Ein langer Korridor. Blutspuren an den Wänden. Du hörst Tropfen. Im OSTEN ist eine Tür. Im WESTEN auch. SÜDEN führt zurück.',
+        'exits': {'süden': 'start', 'osten': 'laboratory', 'westen': 'storage'},
+        'items': ['pistole', 'taschenlampe'],
+        'enemy': None
+    },
+    'storage': {
+        'name': 'Lagerraum',
+        'description': 'Regale umgestürzt. Konserven und Vorräte verstreut. Eine Werkbank steht in der Ecke. Hinter einem umgestürzten Regal siehst du einen TUNNEL der nach NORDEN führt.',
+        'exits': {'osten': 'corridor', 'norden': 'tunnel'},
+        'items': ['medkit', 'batterien', 'küchenmesser', 'konserven']
+    },
+    'laboratory': {
+        'name': 'Labor',
+        'description': 'Zerbrochene Reagenzgläser. Tote Ratten in Käfigen. Ein Computer flackert schwach.',
+        'exits': {'westen': 'corridor'},
+        'items': ['schlüssel', 'ak', 'notizen']
+    },
+    'tunnel': {
+        'name': 'Unterirdischer Tunnel',
+        'description': 'Ein enger, dunkler Tunnel. Die Wände sind feucht. Du siehst schwaches Licht am Ende. Der Tunnel führt nach NORDEN weiter. SÜDEN führt zurück zum Lagerraum.',
+        'exits': {'süden': 'storage', 'norden': 'spawn'},
+        'items': [],
+        'trigger_timeskip': True
+    },
+    'spawn': {
+        'name': 'Versteck - Außenbereich',
+        'description': 'Ein verlassenes Haus. Überwuchert von Efeu, aber intakt. Dein neues Zuhause für die nächste Zeit.',
+        'exits': {},
+        'items': [],
+        'is_safehouse': True
+    },
+    'schlafzimmer': {#Spawn haus 
+        'name': 'Schlafzimmer',
+        'description': 'Dein Schlafzimmer. Das Bett steht NORDÖSTLICH in der Ecke, der Nachttisch links daneben. Die Garderobe ist SÜDÖSTLICH. WESTLICH steht ein Schreibtisch mit einem Schrank daneben. Der Ausgang ist im SÜDEN.',
+        'exits': {'süden': 'flur'},
+        'items': ['tagebuch', 'kleidung'],
+        'first_visit_bedroom': False
+    },
+    'flur': {#Spawn haus 
+        'name': 'Flur',
+        'description': 'Ein schmaler Flur. Im NORDEN ist das Schlafzimmer. Im SÜDEN ist das Badezimmer. Nach OSTEN geht es weiter.',
+        'exits': {'norden': 'schlafzimmer', 'süden': 'badezimmer', 'osten': 'eingangsbereich'},
+        'items': [],
+        'in_development': False
+    },
+    'badezimmer': { #Spawn haus 
+        'name': 'Badezimmer',
+        'description': 'Du stehst im badezimmer, die Badewanne kaputt mit blut resten dran, spiegel zerschplittert und der Medizin schrank offen und leergeräumt.',
+        'exits': {'norden': 'flur'},
+        'items': [],
+        'in_development': False
+    },
+    'eingangsbereich': {#Spawn haus 
+        'name': 'Eingangsbereich',
+        'description': 'Der Eingangsbereich des Hauses. Im SÜDEN ist die Vordertür. Nach NORDEN geht es in den Wohnbereich. Im WESTEN ist der Flur.',
+        'exits': {'süden': 'vordertuer', 'norden': 'wohnbereich', 'westen': 'flur','osten': 'wohnzimmer'},
+        'items': [],
+        'in_development': False
+    },
+    'wohnzimmer': {#Spawn haus 
+        'name': 'Wohnzimmer',
+        'description': 'Im wohnzimmer angekommen siehst du eine Couch mit einem Tisch in der Mitte sowie einem geschrotteten Fernseher auf dem Tv-schrank.',
+        'exits': {'westen': 'eingangsbereich'},
+        'items': [],
+        'in_development': False
+    },
+    'vordertuer': {#Spawn haus 
+        'name': 'Vordertür',
+        'description': 'Du stehst an der Vordertür deines Verstecks. NORDEN führt zurück ins Haus. SÜDEN führt nach draußen.',
+        'exits': {'norden': 'eingangsbereich', 'süden': 'suedlich_haus'},
+        'items': [],
+        'in_development': False
+    },
+    'schlafzimmer2': {#Spawn haus 
+        'name': 'Schlafzimmer 2',
+        'description': 'Im Zweiten Schlafzimmer drin sticht dir der eklige Geruch von Verwesung in die Nase, du siehst die leiche eines zombies in der ecke am verrotten mit einer Axt noch im Oberkörper drinne. Gerade aus ist ein Bett mit einem Nachtschrank daneben, weiter links ist ein schrank und in der linken ecke ist noch ein offener kleiderschrank. Im NORDWESTEN ist der Wohnbereich.',
+        'exits': {'nordwesten': 'wohnbereich'},
+        'items': ['axt'],
+        'in_development': False
+    },
+     'kueche': {#Spawn haus 
+        'name': 'Küche',
+        'description': 'Du stehst in der küche, alle wandschränke sind offen, kaputte teller auf dem boden',
+        'exits': {'westen': 'wohnbereich'},
+        'items': ['dosenfleisch', 'crackers'],
+        'in_development': False  
+     },
+     'wohnbereich': {#Spawn haus 
+        'name': 'Wohnbereich',
+        'description': 'Der zentrale Wohnbereich. Im SÜDOSTEN ist das zweite Schlafzimmer. Nach OSTEN geht es in die Küche. Im NORDEN führen Treppen nach unten. Nach SÜDEN ist der Eingangsbereich.',
+        'exits': {'südosten': 'schlafzimmer2', 'osten': 'kueche', 'norden': 'treppen', 'süden': 'eingangsbereich'},
+        'items': [],
+        'enemy': 'zombie',
+        'in_development': False,
+        'zombie_spawn': True
+    }, 
+    'treppen': {#Spawn haus 
+        'name': 'Treppen',
+        'description': 'Die Treppen führen nach unten in den keller, nur ein dimmes licht ist von oben zu sehen.',
+        'exits': {'süden': 'wohnbereich', 'runter': 'keller'},
+        'items': [],
+        'in_development': False
+    },
+    'keller': {#Spawn haus 
+        'name': 'Keller',
+        'description': 'Du bist im keller, in der rechten ecke steht ein Heizkessel, in der unteren linken ecke ist ein kaputter trockner sowie eine kaputter kaputte waschmaschine. Im süden liegt eine Tür zum Lager Raum und rechts von der Tür steht ein Kabinett',
+        'exits': {'süden': 'lagerraum', 'hoch': 'treppen'},
+        'items': [],
+        'in_development': False
+    },
+    'lagerraum': {#Spawn haus 
+        'name': 'Lager Raum',
+        'description': 'Im lagerraum dirnnen stehen 3 Schwerlastregale mit weiterem dosen essen und wasser, ein bett steht in der rechten ecke. Im norden gehts in den ',
+        'exits': {'norden': 'keller'},
+        'items': ['wasser', 'konserven', 'rucksack'],
+        'in_development': False
+    },
+    'suedlich_haus': {#Stadt
+        'name': 'Südliche Straße',
+        'description': 'Eine verwüstete Straße. Kaputte Autos und getrocknetes Blut überall. Im NORDEN ist dein Versteck. Nach WESTEN führt eine Weggabelung. Im SÜDEN steht ein Haus. Nach OSTEN geht die Straße weiter.',
+        'exits': {'norden': 'vordertuer', 'westen': 'westliche_haus_gabelung', 'süden': 'haus1', 'osten': 'oestlich_weggabelung'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': False
+    
+    },
+    'westliche_haus_gabelung': {  # Sub-street near Spawn
+        'name': 'Westliche Weggabelung',
+        'description': 'Eine Weggabelung. Verrostete Straßenschilder zeigen in alle Richtungen. Im OSTEN die südliche Straße. Nach NORDEN die nordwestliche Weggabelung. Im SÜDEN das Krankenhaus.',
+        # Removed westen → westlich_krankenhaus_erweiterung (deprecated). Western district
+        # (Maze/Friedhof/etc.) is now reached via Puente Juanchito.
+        'exits': {'osten': 'suedlich_haus', 'norden': 'nord_westliche_weggabelung', 'süden': 'krankenhaus_straße'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_straße': {#Krankenhaus
+        'name': 'Krankenhaus Straße',
+        'description': 'Du stehst auf der Straße vor dem Krankenhaus. Im NORDEN führt die Straße zur westlichen Weggabelung. Im WESTEN ist der Eingang zum Krankenhaus. Nach SÜDEN geht es zur Nordostecke des Home-Depot-Geländes. Über einen Schleichweg im NORDWESTEN (an der Hospital-Westseite vorbei) erreicht man die Hacienda Straße.',
+        'exits': {'norden': 'westliche_haus_gabelung', 'westen': 'krankenhaus_eingang', 'süden': 'home_depot_ne', 'nordwesten': 'hacienda_straße'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': False
+    },
+    'krankenhaus_eingang': {#Krankenhaus
+        'name': 'Krankenhaus Eingang',
+        'description': 'Kaputte Glastüren stehen offen. Aus dem Inneren des Krankenhauses hörst du Zombies schreien. Im OSTEN führt der Weg zurück auf die Straße.',
+        'exits': {'osten': 'krankenhaus_straße', 'Westen': 'krankenhaus_wartebereich'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_wartebereich': {#Krankenhaus
+        'name': 'Krankenhaus - Wartebereich',
+        'description': 'Im Wartebereich drinnen sind mehrere bänke umgeworfen sowie ein paar Stühle, Im westen gehts tiefer ins Gebäude rein, im Norden ist ein behandlungszimmer.',
+        'exits': {'osten': 'krankenhaus_eingang', 'Westen': 'krankenhaus_flur','Norden':'krankenhaus_krankenzimmer'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_krankenzimmer': {#Krankenhaus
+        'name': 'Krankenhaus - Behandlungsraum',
+        'description': 'Drinnen stehen betten und umgeworfene liegen, alle schränke und regale sind offen und leer.',
+        'exits': {'Süden': 'krankenhaus_wartebereich'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur': {#Krankenhaus
+        'name': 'Krankenhaus - Flur',
+        'description': 'Der Flur verbindet den Wartebereich mit der Rezeption, leere schränke und regale sind auf dem weg.',
+        'exits': {'osten': 'krankenhaus_wartebereich','Süden':'krankenhaus_Rezeption' },
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_Rezeption': {#Krankenhaus
+        'name': 'Krankenhaus - Rezeption',
+        'description': 'In der Rezeption sind weitere bänke und schränke, 2 PCs sind immernoch am stehen aber sind unbenutzbar, im Westen führt es tiefer ins Gebäude rein.',
+        'exits': {'Norden': 'krankenhaus_Flur','westen': 'krankenhaus_flur_osten'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur_osten': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Osten',
+        'description': 'Im Flur führt ein weg richtung Norden und Westen, du kannst durch Fenster sehen die in den Innenhof zeigen.',
+        'exits': {'Norden': 'krankenhaus_flur_nord_ost','westen': 'krankenhaus_flur_süden','osten': 'krankenhaus_Rezeption'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur_Süden': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Süden',
+        'description': 'Der Flur ist am ende barriekadiert und führt nicht weiter, noch dazu ist eine Doppeltür zugestellt mit einer Roten Schrift drauf "DONT OPEN DEAD INSIDE".',
+        'exits': {'Norden': 'krankenhaus_flur_nord_ost','westen': 'krankenhaus_flur_süden','osten': 'krankenhaus_Rezeption'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur_nord_ost': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Nord-Ost',
+        'description': 'Weiter oben im Flur siehst du weitere Türen die Barriekadiert sind mit keinem weg hinein, im Westen geht der Flur weiter.',
+        'exits': {'Westen': 'krankenhaus_flur_norden','Süden': 'krankenhaus_flur_osten'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur_norden': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Norden',
+        'description': 'Der Flur ist relativ eng durch die Tür barrikaden, im süden ist der Gang abgeblockt und führt nicht weiter, aber im Westen geht es weiter in eine Laborrezeption.',
+        'exits': {'Westen': 'krankenhaus_labor_rezeption','osten': 'krankenhaus_flur_nord_ost'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_labor_rezeption': {#Krankenhaus
+        'name': 'Krankenhaus - Labor Rezeption',
+        'description': 'Ein Tresen mit einem PC drauf, sonst nur weitere Bänke. Im Westen ist eine Tür ins Labor, nur öffnungsbar durch eine Schlüsselkarte.',
+        'exits': {'Westen': 'krankenhaus_labor','osten': 'krankenhaus_flur_norden','Süden': 'krankenhaus_zwischen_flur'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_Labor': {#Krankenhaus
+        'name': 'Krankenhaus - Labor',
+        'description': 'Mehrere Microskope, reagenzgläser und dokumente liegen verwüsted herrum, schränke offen, unter einem schrank sind spuren als wäre er öffters verrückt worden.',
+        'exits': {'osten': 'krankenhaus_labor_rezeption','Süden':'krankenhaus_geheim_treppe'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_geheim_treppe': {#Krankenhaus
+        'name': 'Krankenhaus - Labor Treppe',
+        'description': 'Eine Treppe die Tief runter führt in einen anderen Bereich.Ein Numpad an der Wand um die Tür zu öffnen',
+        'exits': {'Norden': 'krankenhaus_Labor'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_empfang': {#Geheimlabor
+        'name': 'Geheimlabor - Empfang',
+        'description': 'Der Empfang nur Leicht verwüsted im Gegensatz zu dem Im krankenhaus.Im Süden Liegt ein Abstellraum und im Osten eine Tür die nur durch ein Sicherheitsarmband öffnungsbar erscheint',
+        'exits': {'Süden': 'gl_lagerraum', 'Osten': 'gl_sicherheits_flur'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_lagerraum': {#Geheimlabor
+        'name': 'Geheimlabor - Abstellraum',
+        'description': 'Ein kleiner abstellraum indem sich kleine Schränke befinden.',
+        'exits': {'Norden':'gl_empfang'},
+        'items': ['keycard_armband_lvl1'],
+        'in_development': False
+    }, 
+    'gl_sicherheits_flur': {#Geheimlabor
+        'name': 'Geheimlabor - Sicherheits Flur',
+        'description': 'Im Flur wird man desinfiziert um eine kontaminierung vorzubeugen.',
+        'exits': {'Westen':'gl_empfang','Osten': 'gl_sicherheits_lvl1_flur'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_sicherheits_lvl1_flur': {#Geheimlabor
+        'name': 'Geheimlabor - Sicherheit lvl1 Flur',
+        'description': 'Ein Gang wo man zu den Schlafsaal und kafeteria hinkommt.',
+        'exits': {'Norden':'gl_Schlafsaal','Osten': 'gl_kafeteria','Süden': 'gl_sicherheits_lvl2_flur','westen':'gl_sicherheits_flur'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_schlafsaal': {#Geheimlabor
+        'name': 'Geheimlabor - Schlafsaal',
+        'description': 'Der Hausungs ort für manche Mitarbeiter, geimeinde Räume zum Schlafen, die liegen im Osten, Westen und Norden.',
+        'exits': {'Norden':'gl_schlafzimmer1','Westen': ' gl_schlafzimmer2','Osten': 'gl_schlafzimmer3','Süden': 'gl_sicherheits_lvl1_flur'},
+        'items': [],
+        'in_development': False
+    }, 
+    'gl_schlafzimmer1': {#Geheimlabor
+        'name': 'Geheimlabor - Schlafzimmer 1',
+        'description': 'Mehrere Betten in einem Raum für die Hausung von Mitarbeitern.',
+        'exits': {'Süden': 'gl_schlafsaal'},
+        'items': [],
+        'in_development': False
+    }, 
+    'gl_schlafzimmer2': {#Geheimlabor
+        'name': 'Geheimlabor - Schlafzimmer 2',
+        'description': 'In diesem Raum sind 2 Betten beide mit nem Nachtschrank.',
+        'exits': {'Osten': 'gl_schlafsaal'},
+        'items': [],
+        'in_development': False
+    }, 
+    'gl_schlafzimmer3': {#Geheimlabor
+        'name': 'Geheimlabor - Schlafzimmer 3',
+        'description': 'Ein Paar betten sind in diesem Raum, es sieht so aus als würdest du mit einem bett an den Lüftungsschacht in der Decke ankommen.',
+        'exits': {'Westen': 'gl_schlafsaal', 'Osten': 'gl_küche'},
+        'items': ['keycard_armband_lvl2'],
+        'zombie_spawn': True,
+        'in_development': False
+    },
+    'gl_kafeteria': {#Geheimlabor
+        'name': 'Geheimlabor - Kafeteria',
+        'description': 'Der Essensbereich, mehrere tische mit stühlen zum Essen für die Mitarbeiter.',
+        'exits': {'Osten': 'gl_küche','Süden': 'gl_sicherheits_lvl1_flur'},
+        'items': [],
+        'in_development': False
+    }, 
+    'gl_küche': {#Geheimlabor
+        'name': 'Geheimlabor - Küche',
+        'description': 'Edelstahl und fliesierte Wände. Hier stehen ein paar Öfen, schränke und Kühlschränke im Raum. In der mitte ist ein platz zur zubereitung vom Essen, an der Decke dadüber ist ein Lüftungs schacht welcher aussieht als käme man damit ins Schlafzimmer 3.',
+        'exits': {'Westen': 'gl_kafeteria', 'hoch': 'gl_schlafzimmer3'},
+        'items': [],
+        'in_development': False
+    }, 
+    'gl_sicherheits_lvl2_flur': {#Geheimlabor
+        'name': 'Geheimlabor - Sicherheit lvl2 Flur',
+        'description': 'Von diesem Flur aus Kommt man zu wichtigeren teilen des Geheimlabors. Im Süden ein Biolabor, Im Osten ein Presentationsraum und im Westen ein Labor was der Untersuchung gilt.',
+        'exits': {'Norden':'gl_sicherheits_lvl1_flur','Osten': 'gl_presentationsraum','Westen':'gl_labor','Süden':'gl_bio_labor'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_labor': {#Geheimlabor
+        'name': 'Geheimlabor - Labor',
+        'description': 'Im Raum sind viele tische und Stühle mit PCs die der Untersuchung von Viralen infektionen dienen, Im Süden liegt eine Tür.',
+        'exits': {'Osten': 'gl_sicherheits_lvl2_flur','Süden':'gl_labor_flur','westen':'gl_testlb_flur'},
+        'items': ['Akten'],
+        'in_development': False
+    },
+    'gl_labor_flur': {#Geheimlabor
+        'name': 'Geheimlabor - Labor Flur',
+        'description': 'Eine verbindung zwischen dem Labor und Drogen Test Labor.',
+        'exits': {'Norden': 'gl_Labor','Süden':'gl_drogen_test_labor'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_drogen_test_labor': {#Geheimlabor
+        'name': 'Geheimlabor - Drogen Test Labor',
+        'description': 'Maschienen stehen auf Tischen, hier werden Viren getestet und weiter untersucht mit dokumentationen dadrüber. Im Westen eine verbindung zum Test Labor',
+        'exits': {'Norden': 'gl_labor_flur','Westen':'gl_test_labor'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_test_labor': {#Geheimlabor
+        'name': 'Geheimlabor - Test Labor',
+        'description': 'Verschiedene Test Röhren zur aufenthaltung von Bio-waffen sowie PCs wo tests an denen ausgeführt wurden.',
+        'exits': {'Süden': 'gl_boss_raum','Osten':'gl_test_labor'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_boss_raum': {#Geheimlabor
+        'name': 'Geheimlabor - Boss Raum',
+        'description': 'Der Raum Komplett verwüsted, nicht mehr erkennbar für was der Raum einst einen Nutzen hatte.',
+        'exits': {'Norden': 'gl_test_labor'},
+        'enemy': 'geheimlabor_boss',
+        'items': [],
+        'in_development': False
+    },
+    'gl_büro': {#Geheimlabor
+        'name': 'Geheimlabor - Büro',
+        'description': 'Regale mit papieren und Ordnern über diese anlage und ausgaben sowie einnahmen. Detailreiche beschreibungen von den Infektionen.',
+        'exits': {'Westen': 'gl_boss_raum','Norden':'gl_bio_labor_flur'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_bio_labor_flur': {#Geheimlabor
+        'name': 'Geheimlabor - Bio-Labor Flur',
+        'description': 'Eine verbindung vom Bio Labor ins Büro.',
+        'exits': {'Süden': 'gl_büro','Norden':'gl_bio_labor'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_bio_labor': {#Geheimlabor
+        'name': 'Geheimlabor - Bio-Labor',
+        'description': 'Ein Operationstisch in der Mitte vom Raum mit einem Computer in der Ecke.',
+        'exits': {'Süden': 'gl_bio_labor_flur','Norden':'gl_sicherheits_lvl2_flur'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_presentationsraum': {#Geheimlabor
+        'name': 'Geheimlabor - Presentationsraum',
+        'description': 'Ein Kaputter Beamer hängt an der Decke sowie eine zerrissene leinwand beim Podium mit mehreren Stühlen in der Mitte des Raumes, im Süden führt ein gang weiter.',
+        'exits': {'Süden': 'gl_server_flur','Westen':'gl_sicherheits_lvl2_flur'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_server_flur': {#Geheimlabor
+        'name': 'Geheimlabor - Server-Flur',
+        'description': 'Dieser Flur führt zu den Servern vom Labor, Im Westen liegt die Tür dazu.',
+        'exits': {'Norden': 'gl_presentationsraum','Westen':'gl_server_raum'},
+        'items': [],
+        'in_development': False
+    },
+    'gl_server_raum': {#Geheimlabor
+        'name': 'Geheimlabor - Server Raum',
+        'description': 'Eine Menge an Servern aufgestellt mit einem PC in der Ecke.',
+        'exits': {'Osten': 'gl_server_flur'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_zwischen_flur': {#Krankenhaus
+        'name': 'Krankenhaus - Zwischenflur',
+        'description': 'Liegen stehen Im Flur, der Weg leicht geblockt.',
+        'exits': {'Norden': 'krankenhaus_labor_rezeption','Süden': 'krankenhaus_preperations_raum'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_preperations_raum': {#Krankenhaus
+        'name': 'Krankenhaus - Vorbereitungs Raum',
+        'description': 'Klamotten verteilt auf dem Boden mit Blutigen spuren verteilt Im Raum. Im süden der OP raum und im Osten ein Flur.',
+        'exits': {'Süden': 'krankenhaus_OP_raum', 'osten': 'krankenhaus_flur_süd_westen'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_OP_raum': {#Krankenhaus
+        'name': 'Krankenhaus - Operations Raum',
+        'description': 'Dicke schränke die für die Kalthaltung von Medikamenten dienten, In der Mitte einen Operations Tisch sowie technische geräte.',
+        'exits': {'Norden': 'krankenhaus_preperations_raum'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur_süd_westen': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Süd-Westen',
+        'description': 'Ein flur. Im Osten ist der Weg abgeblockt, Im norden ist ein durchgangsflur und im Süden ist ein Treppenhaus welches in die Etage dadrüber führt.',
+        'exits': {'Norden': 'krankenhaus_flur_westen','Süden': 'krankenhaus_treppenhaus_flur', 'Westen': 'krankenhaus_preperations_raum'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur_westen': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Westen',
+        'description': 'Der weg führt weiter nach norden, weitere Fenster die in den Innenhof zeigen.',
+        'exits': {'Norden': 'krankenhaus_flur_nord-westen_1','Süden': 'krankenhaus_flur_süd_westen'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur_nord_westen_1': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Nord-Westen',
+        'description': 'Weitere Liegen stehen hier, eine tür im Norden die weiter durch führt.',
+        'exits': {'Norden': 'krankenhaus_flur_nord-westen_2','Süden': 'krankenhaus_flur_westen'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur_nord_westen_2': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Nord-Westen-2',
+        'description': 'Der weitere weg Abgeblockt, eine Kiste steht hier.',
+        'exits': {'Süden': 'krankenhaus_flur_nord_westen_1'},
+        'items': ['Kiste'],
+        'in_development': False
+    },
+    'krankenhaus_treppenhaus_flur': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Treppenhaus',
+        'description': 'Ein Kleiner vorbereich vor den Treppen, der Fahrstuhl unten vollgestellt mit liegen und betten, der einzige weg hoch sind die Treppen.',
+        'exits': {'Süden': 'krankenhaus_Treppe','Osten':'krankenhaus_kaputter_aufzug','Norden': 'krankenhaus_flur_süd_westen'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_Treppe': {#Krankenhaus
+        'name': 'Krankenhaus - Treppe F1',
+        'description': 'Diese Treppen Führen in die Nächste Etage nach oben.',
+        'exits': {'hoch': 'krankenhaus_Treppe_F2','Norden': 'krankenhaus_treppenhaus_flur'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_Treppe_F2': {#Krankenhaus
+        'name': 'Krankenhaus - Treppe F2',
+        'description': 'Die Treppen führen nach unten in die erste Etage.',
+        'exits': {'runter': 'krankenhaus_Treppe_F1','Norden': 'krankenhaus_treppenhaus_flur_f2'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_treppenhaus_flur_f2': {#Krankenhaus
+        'name': 'Krankenhaus - Treppehaus F2',
+        'description': 'Der Fahrstuhl oben vollgestellt mit betten und Liegen nur ein weg richtung Norden der einen Weiter führt.',
+        'exits': {'Süden': 'krankenhaus_Treppe_F2','Norden': 'krankenhaus_flur_westen_f2'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur_westen_f2': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Westen-F2',
+        'description': 'Eine Glaswand die Runter zum Innenhof zeigt, ein weg abgeblockt, in der mitte des Ganges führt einer auf die Andere seite des Krankenhauses, ganz am ende des Ganges geht es im Westen zu einem Aufnahmeraum und Im Osten zu einem anliegenden Flur.',
+        'exits': {'Norden': 'krankenhaus_flur_norden_f2','Osten': 'krankenhaus_flur_mitte_f2'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur_norden_f2': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Norden-F2',
+        'description': 'Der Flur führt im Norden zu dem Mitarbeiter Raum, im westen ein Raum mit aufgebrochener tür.',
+        'exits': {'Westen': 'krankenhaus_aufnahmeraum','Norden': 'krankenhaus_mitarbeiter_flur','Süden': 'krankenhaus_flur_westen_f2'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_aufnahmeraum': {#Krankenhaus
+        'name': 'Krankenhaus - Aufnahme ',
+        'description': 'Viele Akten von Patienten und verschiedene bilder in regalen.',
+        'exits': {'Osten': 'krankenhaus_flur_norden_f2'},
+        'items': [''],
+        'in_development': False
+    },
+    'krankenhaus_flur_mitte_f2': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Mitte',
+        'description': 'Der Gang ist direkt über dem Innenhof, fenster durch die man hinunter schauen kann, im Osten liegt die Schwesterstation.',
+        'exits': {'Osten': 'krankenhaus_schwesterstation','Süden': 'krankenhaus_flur_osten_f2','Westen': 'krankenhaus_flur_westen_f2'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_mitarbeiter_flur': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Norden-F2',
+        'description': 'Ein schmaler flur, fenster in der Decke, der Mitarbeiterraum direkt gerade aus.',
+        'exits': {'Norden': 'krankenhaus_mitarbeiter_raum','Süden': 'krankenhaus_flur_norden_f2'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_mitarbeiter_raum': {#Krankenhaus
+        'name': 'Krankenhaus - Mitarbeiter Raum',
+        'description': 'Tische und stühle zum sitzen, eine kafemaschiene sowie ofen und kühlschrank im Raum, im Westen sind noch die Schließfächer der Mitarbeiter.',
+        'exits': {'Westen': 'krankenhaus_schließfach_raum','Süden': 'krankenhaus_mitarbeiter_flur'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_schließfach_raum': {#Krankenhaus
+        'name': 'Krankenhaus - Schließfach Raum',
+        'description': 'Schließfächer bedecken die Wände, manche scheinen auch noch auf zu sein. In einem offenen Schließfach liegt ein Pistolenmagazin – wohl vom Sicherheitsdienst.',
+        'exits': {'Osten': 'krankenhaus_mitarbeiter_raum'},
+        'items': ['pistolen_munition'],
+        'in_development': False
+    },
+    'krankenhaus_schwesterstation': {#Krankenhaus
+        'name': 'Krankenhaus - Schwesternstation',
+        'description': 'Im Raum sind bänke, tische und stühle, die Küche abgeblockt ohne weg mehr hin, Im norden eine doppeltür zu einem krankenzimmer und im Süden führt der Gang zum wäscheraum.',
+        'exits': {'Norden': 'krankenhaus_krankenzimmer','Süden': 'krankenhaus_waschraum_flur'},
+        'items': ['Wichtiges Dokument'],
+        'in_development': False
+    },
+    'krankenhaus_krankenzimmer': {#Krankenhaus
+        'name': 'Krankenhaus - Krankenzimmer',
+        'description': 'Mehrere Krankenbetten und vorhänge für etwas privatsphäre unter den Patienten.',
+        'exits': {'Süden': 'krankenhaus_schwesterstation'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_waschraum_flur': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Waschraum Osten',
+        'description': 'Fenster zeigen nach drausen auf die staßen, der flur mit blut gezeichnet, Im Westen führt der Gang weiter.',
+        'exits': {'Westen': 'krankenhaus_waschraum_flur_süden','Norden': 'krankenhaus_schwesterstation'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_waschraum_flur_süden': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Waschraum Süden',
+        'description': 'Im Norden gehts in den waschraum.',
+        'exits': {'Osten': 'krankenhaus_waschraum_flur','Norden': 'krankenhaus_waschraum'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_waschraum': {#Krankenhaus
+        'name': 'Krankenhaus - Waschraum',
+        'description': 'Waschmaschienen bestücken die Wände, verschiedene körbe mit noch dreckiger und gewaschener wäsche auf dem Boden,.',
+        'exits': {'Süden': 'krankenhaus_waschraum_flur_süden','Norden': 'krankenhaus_flur_osten_f2','Osten':'krankenhaus_behandlungs_raum'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur_süden_f2': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Süden F2',
+        'description': 'Das Ende des Flurs abgetrennt und verbarikadiert.',
+        'exits': {'Osten': 'krankenhaus_flur_osten_f2'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_flur_osten_f2': {#Krankenhaus
+        'name': 'Krankenhaus - Flur: Osten F2',
+        'description': 'Eine verbindung zum waschraum und der Mitte des krankenhauses.',
+        'exits': {'Osten': 'krankenhaus_flur__f2','Süden': 'krankenhaus_waschraum','Westen':'krankenhaus_flur_süden_f2'},
+        'items': [],
+        'in_development': False
+    },
+    'krankenhaus_behandlungs_raum': {#Krankenhaus
+        'name': 'Krankenhaus - Behandlungsraum',
+        'description': 'Die Betten total verschoben, schränke offen und tische umgeworfen auf dem Boden.',
+        'exits': {'Westen':'krankenhaus_waschraum'},
+        'items': [],
+        'in_development': False
+    },
+    'östliche_straße': {#stadt
+        'name': 'Östliche Straße',
+        'description': 'Kaputte Autos und Blutspuren bedecken die Straße. Im NORDEN liegt die nordöstliche Weggabelung. Im OSTEN steht ein verlassenes Haus. Nach SÜDEN geht es zur östlichen Weggabelung.',
+        'exits': {'norden': 'nord_östliche_weggabelung', 'osten': 'haus2', 'süden': 'oestlich_weggabelung'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': False
+    },
+    'nord_westliche_weggabelung': {#Stadt Norden
+        'name': 'Nord Westliche Weggabelung',
+        'description': 'Eine Weggabelung im nördlichen Teil der Stadt. Im WESTEN führt die Straße zur Bibliothek. Nach OSTEN geht es zur nordöstlichen Weggabelung. Im SÜDEN liegt die westliche Hausgabelung.',
+        'exits': {'osten': 'nord_östliche_weggabelung', 'westen': 'bibliothek_straße', 'süden': 'westliche_haus_gabelung'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'bibliothek_straße': {  # Sub-street near Library
+        'name': 'Bibliothek Straße',
+        'description': 'Eine ruhige Straße. Im NORDOSTEN siehst du den Eingang zur Bibliothek. Im OSTEN führt der Weg zurück zur nordwestlichen Weggabelung.',
+        'exits': {'norden': 'bibliothek_eingang', 'osten': 'nord_westliche_weggabelung'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'bibliothek_eingang': {  # Idea-Map: Library (R1C3)
+        'name': 'Bibliothek Eingang',
+        'description': 'Du stehst vor den Türen der Bibliothek. Leises Knarzen ist von drinnen zu hören.',
+        'exits': {'norden': 'bibliothek_1.1', 'süden': 'krankenhaus_eingang'},
+        'items': [],
+        'in_development': False
+    },
+    'bibliothek_1.1': {#Bibliothek
+        'name': 'Bibliothek 1',
+        'description': 'Der Tresen leer, schränke umgeworfen, Im Westen sieht es so aus als ginge es weiter sowie auch in richtung Osten',
+        'exits': {'süden': 'bibliothek_eingang', 'westen': 'bibliothek_1.2', 'osten': 'bibliothek_2'},
+        'items': [],
+        'in_development': False
+    },
+    'bibliothek_1.2': {#Bibliothek
+        'name': 'Bibliothek ',
+        'description': 'Sackgasse, umgefallene schränke blocken den weg',
+        'exits': {'osten': 'bibliothek_1.1'},
+        'items': ['Stück Papier'],
+        'in_development': False
+    },
+    'bibliothek_2': {#Bibliothek
+        'name': 'Bibliothek ',
+        'description': 'Keine Regale im weg, nur bücher verteilt auf dem Boden sowie getrocknetes blut',
+        'exits': {'norden': 'bibliothek_3', 'westen': 'bibliothek_1.1'},
+        'items': [],
+        'in_development': False
+    },
+    'bibliothek_3': {#Bibliothek
+        'name': 'Bibliothek',
+        'description': 'Ein staubiger Lesebereich. Im NORDEN versperrt ein schweres BÜCHERREGAL den Durchgang. Wenn du dich dagegenstemmst, könntest du es vielleicht zur Seite SCHIEBEN.',
+        'exits': {'süden': 'bibliothek_2'},
+        'items': [],
+        'in_development': False
+    },
+    'bibliothek_4': {#Bibliothek
+        'name': 'Bibliothek',
+        'description': 'Hinter dem verschobenen Bücherregal öffnet sich ein weiterer Bereich der Bibliothek. Eine alte KISTE steht in der Ecke.',
+        'exits': {'westen': 'bibliothek_5'},
+        'items': ['kiste'],
+        'in_development': False
+    },
+    'bibliothek_5': {#Bibliothek
+        'name': 'Bibliothek',
+        'description': 'Kein durchgang direkt im Westen, jedoch im Süden sieht es so aus als könnte man dadurch',
+        'exits': {'süden': 'bibliothek_6', 'osten': 'bibliothek_4'},
+        'items': [],
+        'enemy': 'zombie',
+        'in_development': False
+    },
+    'bibliothek_6': {#Bibliothek
+        'name': 'Bibliothek 1',
+        'description': 'Der Weg führt hinter dem Tresen entlang',
+        'exits': {'westen': 'bibliothek_7', 'norden': 'bibliothek_5'},
+        'items': [],
+        'in_development': False
+    },
+    'bibliothek_7': {#Bibliothek
+        'name': 'Bibliothek 1',
+        'description': 'Weiterhin schränke und bücher auf dem Boden',
+        'exits': {'osten': 'bibliothek_6', 'norden': 'bibliothek_8'},
+        'items': [],
+        'in_development': False
+    },
+    'bibliothek_8': {#Bibliothek
+        'name': 'Bibliothek 1',
+        'description': 'Das Ende des Ganges, die Tür abgeblockt, In der Wand neben der Tür wurde "Tür Geschlossen halten" reingeritzt, schreie und kratzen sind von hinter der Tür hörbar',
+        'exits': {'süden': 'bibliothek_7'},
+        'items': ['kampfmesser'],
+        'in_development': False
+    },
+    'nord_östliche_weggabelung': {#Stadt Norden
+        'name': 'Nord Östliche Weggabelung',
+        'description': 'Eine breite Weggabelung. Im NORDEN führt die Straße weiter. Im WESTEN liegt die nordwestliche Weggabelung. Nach SÜDEN geht es zur östlichen Straße. Im OSTEN siehst du den Parkplatz von Walmart.',
+        'exits': {'norden': 'norden_straße', 'westen': 'nord_westliche_weggabelung', 'süden': 'östliche_straße', 'osten': 'parkplatz'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': False
+    },
+    'parkplatz': {#Walmart
+        'name': 'Parkplatz',
+        'description': 'Du stehst auf dem Parkplatz von Walmart, es stehen viele kaputte autos, manche davon auch umgekippt. Richtung westen  und im süden gehst zur weggabelung zurück',
+        'exits': {'westen': 'norden_straße', 'süden': 'nord_östliche_weggabelung', 'norden': 'walmart_eingang', 'nordosten': 'noerdlich_walmart_straße' },
+        'items': [],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': False
+    },
+    'walmart_eingang': {#Walmart
+        'name': 'Walmart Eingang',
+        'description': 'Die Schiebetüren aus glas sind kaputt, boden voller scherben, die kannst im Walmart zombies durch Regale sehen.',
+        'exits': {'süden': 'parkplatz', 'norden': 'walmart_1'},
+        'items': [],
+        'in_development': False
+    },
+    'walmart_1': {#Walmart
+        'name': 'Walmart',
+        'description': 'Du stehst im walmart, die siehst viele umgefallene Regale, und viele Artikel liegen auf dem Boden. Im Westen bemerkst du einen durchgang.',
+        'exits': {'süden': 'parkplatz', 'westen': 'walmart_2'},
+        'items': [],
+        'in_development': True
+    },
+    'walmart_2': {#Walmart
+        'name': 'Walmart',
+        'description': 'Du stehst in der unteren westlichen ecke des walmarts, weiterhin nur umgefallene Regale in sicht. Es sieht so aus als könntest du i richtung Norden weiter gehen.',
+        'exits': {'norden': 'walmart_3','osten': 'walmart_3'},
+        'items': [],
+        'in_development': True
+    },
+    'walmart_3': {#Walmart
+        'name': 'Walmart',
+        'description': 'Weitere Regale am stehen, gerade aus wird dein weg von umgefallenen regalen blockiert, du siehst einen durchgang in richtung Osten.',
+        'exits': {'süden': 'walmart_2', 'osten': 'walmart_4'},
+        'items': ['schokoriegel', 'energieriegel'],
+        'in_development': True
+    },
+    'walmart_4': {#Walmart
+        'name': 'Walmart',
+        'description': 'Weiter drinne im Walmart siehst du weiter hin nur umgefallene Regale. Der weg führt weiter nur nach Norden.',
+        'exits': {'Norden': 'walmart_5', 'westen': 'walmart_3'},
+        'items': [],
+        'in_development': True
+    },
+    'walmart_5': {#Walmart
+        'name': 'Walmart',
+        'description': 'In der Mitte vom Walmart hast du eine halbwegs gute sicht durch den Laden, in der Südöstlichen ecke des Ladens siehst du etwas liegen.',
+        'exits': {'norden': 'walmart_6', 'westen': 'walmart_4'},
+        'items': [],
+        'enemy': 'zombie',
+        'in_development': True,
+        'zombie_spawn': True
+    },
+    'walmart_6': {#Walmart
+        'name': 'Walmart',
+        'description': 'Der weg nach osten ist nun abgeblockt von Regalen. Dafür ist im Westen nun der weg frei.',
+        'exits': {'westen': 'walmart_7', 'süden': 'walmart_5'},
+        'items': [],
+        'in_development': True
+    },
+    'walmart_7': {#Walmart
+        'name': 'Walmart',
+        'description': 'Verrottete lebensmittel auf dem Boden sowie frisches blut komplett verteilt, weirere regale liegen auf dem Boden, Im norden sieht es so aus als wäre genug platz zum durch gehen',
+        'exits': {'norden': 'walmart_8', 'osten': 'walmart_6'},
+        'items': [],
+        'in_development': True
+    },
+    'walmart_8': {#Walmart
+        'name': 'Walmart',
+        'description': 'Mehr schränke, mehr verrottete lebensmittel, leere flaschen und leere verpackungen, selbst hier ist alles noch verwüstet, im Norden führt es in die Nordwestliche ecke des Ladens',
+        'exits': {'norden': 'walmart_9', 'süden': 'walmart_7'},
+        'items': [],
+        'in_development': True
+    },
+    'walmart_9': {#Walmart
+        'name': 'Walmart',
+        'description': 'Die Tür in der Ecke auch abgeblockt und zu, richtung süden ist der gesammte gang frei, aber eng und mehr vermüllung auf dem Boden',
+        'exits': {'osten': 'walmart_10', 'süden': 'walmart_8'},
+        'items': [],
+        'enemy': 'zombie',
+        'in_development': True,
+        'zombie_spawn': True
+    },
+    'walmart_10': {#Walmart
+        'name': 'Walmart',
+        'description': 'Nun in der Nordöstlichen ecke des Ladens, der Westliche gang fast komplett frei, bisschen eng aber man kommt durch',
+        'exits': {'süden': 'walmart_11', 'westen': 'walmart_9'},
+        'items': [],
+        'in_development': True
+    },
+    'walmart_11': {#Walmart
+        'name': 'Walmart',
+        'description': 'Der gang führt fast in die Südöstliche ecke des ladens, weiter richtung süden liegen ein paar sachen rum villeicht findet sich dadrin etwas, oder westen wo es aussieht als käme man weiter',
+        'exits': {'westen': 'walmart_12.1', 'norden': 'walmart_10', 'süden': 'walmart_12.2'},
+        'items': [],
+        'in_development': True
+    },
+    'walmart_12.1': {#Walmart
+        'name': 'Walmart',
+        'description': 'Ein weiteres regal liegt auf dem boden, mehr müll verteilt.',
+        'exits': {'süden': 'walmart_13', 'westen': 'walmart_11'},
+        'items': [],
+        'in_development': True
+    },
+    'walmart_12.2': {#Walmart
+        'name': 'Walmart',
+        'description': 'Rucksäcke zerfläddert und verteilt, ein paar nützliche sachen könnten da noch liegen.',
+        'exits': {'norden': 'walmart_11'},
+        'items': ['Zettel','küchenmesser','Medikit'],
+        'in_development': True
+    },
+    'walmart_13': {#Walmart
+        'name': 'Walmart',
+        'description': 'Der Durchgang wird immer enger, man passt kaum noch durch, immernoch der selbe modrige geruch zu riechen wie im gesamten laden',
+        'exits': {'westen': 'walmart_14', 'norden': 'walmart_12.1'},
+        'items': [],
+        'in_development': True
+    },
+    'walmart_14': {#Walmart
+        'name': 'Walmart',
+        'description': 'Alles abgeblockt, kein weiterer durchgang oder noch platz zum durch quetschen.',
+        'exits': {'süden': 'walmart_13'},
+        'items': ['Baseball Schläger', 'Pistole', 'pistolen_munition'],
+        'in_development': True
+    },
+    'norden_straße': {#Stadt Norden
+        'name': 'Norden Straße',
+        'description': 'Eine Straße im Norden der Stadt. Im WESTEN steht ein Haus mit offenen Türen. Im OSTEN liegt der Parkplatz von Walmart. Nach SÜDEN geht es zurück zur Weggabelung.',
+        'exits': {'westen': 'haus_3_eingang', 'süden': 'nord_östliche_weggabelung', 'osten': 'parkplatz'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'haus_3_eingang': {#Haus3
+        'name': 'eingang',
+        'description': 'Die Haustür leich auf, von innen ist es still.',
+        'exits': {'westen': 'haus_3_v'},
+        'items': [],
+        'in_development': True
+    },
+    'haus_3_v': {#Haus3
+        'name': 'Haus 3 vordertür',
+        'description': 'Innen drinnen sind nur getrocknete blut spuren, ein paar schränke hier und da und scherben sind auf dem boden verteilt.',
+        'exits': {'osten': 'haus_3_eingang', 'norden': 'wohnzimmer_h3', 'süden': 'bedroom_2', 'westen': 'haus_3_wohnbereich'},
+        'items': [],
+        'in_development': True
+    },
+    'haus_3_wohnbereich': {#Haus3
+        'name': 'Wohnbereich',
+        'description': 'Der Boden immernoch verdreckt und mit scherben verteilt, von hier aus ist jeder raum erreichbar.',
+        'exits': {'osten': 'haus_3_v', 'norden': 'küche_h3', 'süden': 'bathroom_3', 'westen': 'bedroom_3'},
+        'items': ['gehstock'],
+        'in_development': True
+    },
+    'wohnzimmer_h3': {#Haus3
+        'name': 'Wohnzimmer',
+        'description': 'Das sofa ist noch halb in tackt, der Kamin sieht auch schon sein langer zeit nicht mehr genutzt worden zu sein. Alle schränke auch geplündert, nichts nützliches mehr zu finden.',
+        'exits': {'süden': 'haus_3_wohnbereich'},
+        'items': [],
+        'in_development': True
+    },
+    'küche_h3': {#Haus3
+        'name': 'Küche',
+        'description': 'Vergammeltes essen auf dem Boden, scherben und einen kapputen tisch sowie kaputte stühle.',
+        'exits': {'osten': 'haus_3_wohnbereich'},
+        'items': ['apfel'],
+        'in_development': True
+    },
+    'bathroom_3': {#Haus3
+        'name': 'Badezimmer',
+        'description': 'Die Badewanne kaputt, die dusche eingeschlagen, toilette überlaufen und auch der Medizien schrank leer geplündert.',
+        'exits': {'norden': 'haus_3_wohnbereich'},
+        'items': [],
+        'in_development': True
+    },
+    'bedroom_3': {#Haus3
+        'name': 'Schlafzimmer',
+        'description': 'Im Raum ist alles kaputt oder nicht mehr nutzbar.',
+        'exits': {'osten': 'haus_3_wohnbereich'},
+        'items': [],
+        'in_development': True
+    },
+    'oestlich_weggabelung': {#Stadt
+        'name': 'Östliche Weggabelung',
+        'description': 'Kaputte Autos und Blutspuren liegen auf der Straße. Im NORDEN ist die östliche Straße. Nach WESTEN geht es zur südlichen Straße. Im OSTEN liegt ein verwilderter Park. Nach SÜDEN führt die Park Straße.',
+        'exits': {'norden': 'östliche_straße', 'westen': 'suedlich_haus', 'süd_osten': 'park', 'süden': 'park_straße'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'park_straße': {#Stadt
+        'name': 'Park Straße',
+        'description': (
+            'Eine Straße entlang des Parks. Im NORDEN liegt die östliche Weggabelung. '
+            'Im OSTEN öffnet sich eine enge Gasse zwischen den Gebäuden. '
+            'Nach SÜDEN führt der Weg zur Skyscraper Weggabelung.'
+        ),
+        'exits': {'norden': 'oestlich_weggabelung', 'osten': 'gasse', 'süden': 'skyscraper_weggabelung'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'skyscraper_weggabelung': {#Stadt
+        'name': 'Skyscraper Weggabelung',
+        'description': 'Ein Hochhaus ragt über dir in den Himmel. Im NORDEN ist die Park Straße. Nach WESTEN führt die Straße zur Pizzeria. Im OSTEN liegt die Skyscraper Straße. Nach SÜDEN führt der Weg zur westlichen Weggabelung am zweiten Hochhaus.',
+        'exits': {'norden': 'park_straße', 'westen': 'straße_pizzeria', 'osten': 'skyscraper_straße', 'süden': 'skyscraper2_weggabelung_west'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'skyscraper_straße': {#Stadt
+        'name': 'Skyscraper Straße',
+        'description': 'Eine gerade Straße entlang des Hochhauses. Nach WESTEN liegt die Skyscraper Weggabelung. Im OSTEN die südöstliche Skyscraper Weggabelung. Im NORDWESTEN klafft eine eingestürzte Wand – dahinter liegt der Eingang zu Skyscraper 1.',
+        'exits': {'westen': 'skyscraper_weggabelung', 'nordwesten': 'skyscraper_1', 'süden': 'tower_straße_west'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'tower_straße_west': {#Stadt
+        'name': 'Tower Straße West',
+        'description': (
+            'Westseite des Tower-Bereichs. Im NORDEN liegt die Skyscraper Straße. '
+            'Nach SÜDEN führt der Weg zur Tower Straße SW. '
+            'Im WESTEN siehst du eine zerbrochene Glastür — der Eingang zu Skyscraper 2.'
+        ),
+        'exits': {'norden': 'skyscraper_straße', 'süden': 'tower_straße_sw', 'westen': 'skyscraper_2_eingang'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'tower_straße_sw': {#Stadt
+        'name': 'Tower Straße SW',
+        'description': 'Südwestlicher Abschnitt der Tower-Straße. Im NORDEN ist die Tower Straße West. Nach WESTEN geht es zur Feuerwehr Straße SE.',
+        'exits': {'norden': 'tower_straße_west', 'westen': 'feuerwehr_straße_se'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'skyscraper_1': {#Skyscraper1
+        'name': 'Skyscraper 1 – Eingestürzte Wand',
+        'description': (
+            'Durch eine große Bresche in der Außenmauer bist du ins Erdgeschoss eingedrungen. '
+            'Betonbrocken und Staub bedecken den Boden. Eisenstangen ragen aus dem Mauerwerk. '
+            'Im Inneren liegt die Lobby des Hochhauses. Nach NORDEN geht es hinein. '
+            'Nach SÜDOSTEN führt der Weg zurück auf die Skyscraper Straße.'
+        ),
+        'exits': {'südosten': 'skyscraper_straße', 'norden': 'skyscraper_1_lobby'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'skyscraper_1_lobby': {#Skyscraper1
+        'name': 'Skyscraper 1 – Lobby',
+        'description': (
+            'Die Lobby des Hochhauses. Ein langer Rezeptionstresen aus Marmor zieht sich quer durch den Raum — '
+            'hinter ihm liegt ein umgestürzter Drehstuhl. Zerbrochenes Glas knirscht unter deinen Schritten. '
+            'An der Nordwand führt eine Treppe nach oben, aber sie ist mit schweren Stahlträgern verbarrikadiert — '
+            'kein Durchkommen. '
+            'Nach SÜDEN führt die Bresche zurück nach draußen.'
+        ),
+        'exits': {'süden': 'skyscraper_1'},
+        'items': ['ak_munition'],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': True
+    },
+
+    # ── SKYSCRAPER 2 ────────────────────────────────────────────────
+    'skyscraper_2_eingang': {#Skyscraper2
+        'name': 'Skyscraper 2 – Empfang',
+        'description': (
+            'Du schiebst die zerbrochene Glastür auf und betrittst die Eingangshalle. '
+            'Glasscherben knirschen unter deinen Füßen. '
+            'Ein massiver Empfangstresen aus dunklem Holz steht gegenüber — '
+            'dahinter liegt ein umgekippter Stuhl, Papiere bedecken den Boden. '
+            'An der WESTLICHEN Wand führt eine Tür in den Mitarbeiterbereich. '
+            'Nach OSTEN geht es zurück auf die Straße.'
+        ),
+        'exits': {'osten': 'tower_straße_west', 'westen': 'skyscraper_2_mitarbeiter'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': True
+    },
+    'skyscraper_2_mitarbeiter': {#Skyscraper2
+        'name': 'Skyscraper 2 – Mitarbeiterraum',
+        'description': (
+            'Ein kleiner Mitarbeiterraum hinter dem Empfang. '
+            'In der Ecke steht ein alter Kühlschrank — die Tür steht offen, innen riecht es muffig. '
+            'Ein Schreibtisch mit aufgeklapptem Laptop nimmt die andere Wand ein, '
+            'der Bildschirm schwarz und tot. '
+            'Nach OSTEN geht es zurück zum Empfang.'
+        ),
+        'exits': {'osten': 'skyscraper_2_eingang'},
+        'items': ['dosenfleisch', 'wasser'],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+
+    'skyscraper2_weggabelung_west': {#Stadt
+        'name': 'Skyscraper 2 – westliche Weggabelung',
+        'description': 'Vor einem zweiten Hochhaus teilt sich der Weg. Im NORDEN die Skyscraper Weggabelung. Nach WESTEN die Feuerwehrstraße.',
+        'exits': {'norden': 'skyscraper_weggabelung', 'westen': 'feuerwehrstraße', 'süden': 'feuerwehr_straße_se'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'feuerwehrstraße': {#Stadt
+        'name': 'Feuerwehrstraße',
+        'description': 'An der Seite steht eine verlassene Feuerwache. Im OSTEN die Weggabelung am zweiten Hochhaus. Nach WESTEN die Ostseite des großen Baumarkt-Geländes.',
+        'exits': {'osten': 'skyscraper2_weggabelung_west', 'westen': 'home_depot_east', 'süden': 'feuerwehr_straße_se'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'feuerwehr_straße_se': {#Stadt
+        'name': 'Feuerwehr Straße SE',
+        'description': 'Südöstlicher Straßenabschnitt bei der Feuerwache. Im NORDEN liegt die Feuerwehrstraße. Nach OSTEN führt die Tower Straße SW.',
+        'exits': {'norden': 'skyscraper2_weggabelung_west', 'osten': 'tower_straße_sw', 'westen': 'casino_east'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'casino_east': {#Stadt
+        'name': 'Casino East (Storage Units North)',
+        'description': 'Der östliche Rand des Casino-Blocks bei den nördlichen Lagereinheiten. Im OSTEN liegt die Feuerwehr Straße SE. Nach SÜDEN geht es zur Casino SE.',
+        'exits': {'osten': 'feuerwehr_straße_se', 'norden': 'home_depot_se', 'süden': 'casino_se'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'casino_se': {#Stadt
+        'name': 'Casino SE',
+        'description': 'Südöstliche Ecke am Casino. Im NORDEN liegt Casino East. Nach WESTEN führt die Straße zur Casino SW. Im SÜDEN öffnet sich das Land zu einer rauhen Gebirgslandschaft.',
+        'exits': {'norden': 'casino_east', 'westen': 'casino_sw', 'süden': 'berglandschaft'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'casino_sw': {#Stadt
+        'name': 'Casino SW',
+        'description': 'Südwestlicher Straßenabschnitt am Casino. Im OSTEN liegt der Eingang des Casinos. Nach NORDEN geht es zum Home Depot Süden.',
+        'exits': {'osten': 'casino_eingang', 'norden': 'home_depot_south'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'casino_eingang': {#Casino
+        'name': 'Casino – Eingang',
+        'description': (
+            'Die schweren Glastüren des Casinos stehen weit offen. Splitterndes Glas knirscht unter deinen Stiefeln. '
+            'Im Foyer hängen noch vereinzelte Lüster – einer schwingt leicht, als wäre gerade jemand vorbeigerannt. '
+            'Im WESTEN liegt die Straße. Im OSTEN geht es weiter an der Außenseite entlang. '
+            'Im NORDEN betritt man die Spielhalle.'
+        ),
+        'exits': {'westen': 'casino_sw', 'osten': 'casino_se', 'norden': 'casino_spielhalle'},
+        'items': ['schlüssel'],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': False
+    },
+    'casino_spielhalle': {#Casino
+        'name': 'Casino – Spielhalle',
+        'description': (
+            'Der riesige Hauptsaal des Casinos. Roulette-Tische liegen umgekippt, Spielautomaten sind zerschlagen, '
+            'Münzen und Jetons bedecken den blutbefleckten Teppich. Die Bar ist im WESTEN. '
+            'Im OSTEN liegt ein bewachter Hinterbereich. Im SÜDEN kommt man wieder zum Eingang.'
+        ),
+        'exits': {'süden': 'casino_eingang', 'westen': 'casino_bar', 'osten': 'casino_hinterzimmer'},
+        'items': ['pistole', 'pistolen_munition'],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': True
+    },
+    'casino_bar': {#Casino
+        'name': 'Casino – Bar',
+        'description': (
+            'Die Casinobar. Zerbrochene Flaschen, umgekippte Barhocker. Hinter der Theke liegen noch '
+            'ein paar ungeöffnete Konserven und eine Wasserflasche. Die Spielhalle ist im OSTEN.'
+        ),
+        'exits': {'osten': 'casino_spielhalle'},
+        'items': ['konserven', 'wasser', 'schokoriegel'],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'casino_hinterzimmer': {#Casino
+        'name': 'Casino – Hinterzimmer',
+        'description': (
+            'Ein abgesicherter Bereich hinter der Spielhalle. Stahlschränke sind aufgebrochen, '
+            'Papiergeld verstreut sich wertlos auf dem Boden. In einer Ecke liegt ein versteckter Rucksack. '
+            'Im WESTEN ist die Spielhalle. Im NORDEN geht es zum Tresorraum.'
+        ),
+        'exits': {'westen': 'casino_spielhalle', 'norden': 'casino_tresor'},
+        'items': ['rucksack', 'medkit'],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': True
+    },
+    'casino_tresor': {#Casino
+        'name': 'Casino – Tresorraum',
+        'description': (
+            'Der Tresorraum des Casinos. Die massive Stahltür steht halb offen – jemand war vor dir hier. '
+            'Leere Kassetten, zerrissene Geldbündel. Aber an der Wand lehnt noch eine AK-47 '
+            'und auf einem Regal liegt ein Medikit. Im SÜDEN zurück ins Hinterzimmer.'
+        ),
+        'exits': {'süden': 'casino_hinterzimmer'},
+        'items': ['ak', 'medkit', 'ak_munition', 'ak_munition'],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': True
+    },
+    'home_depot_east': {#Stadt
+        'name': 'Home Depot – Osten',
+        'description': 'Der östliche Rand des abgesperrten Parkplatzes. Im OSTEN die Feuerwehrstraße. Nach NORDEN die Nordostecke. Nach SÜDEN die Südostecke.',
+        'exits': {'osten': 'feuerwehrstraße', 'norden': 'home_depot_ne', 'süden': 'home_depot_se'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'home_depot_se': {#Stadt
+        'name': 'Home Depot – Südosten',
+        'description': 'Ecke am Zaun des Geländes. Im NORDEN der östliche Rand. Nach WESTEN weiter entlang der Südseite.',
+        'exits': {'norden': 'home_depot_east', 'westen': 'home_depot_south'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'home_depot_south': {#Stadt
+        'name': 'Home Depot – Süden',
+        'description': 'Die Südseite des Parkplatzes. Im OSTEN die Südostecke. Nach WESTEN zur Südwestecke. Im SÜDEN liegt das Casino.',
+        'exits': {'osten': 'home_depot_se', 'westen': 'home_depot_sw', 'süden': 'casino_sw'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'home_depot_sw': {#Stadt
+        'name': 'Home Depot – Südwesten',
+        'description': 'Südwestecke des Geländes. Im OSTEN die Südkante. Nach NORDEN die Westseite.',
+        'exits': {'osten': 'home_depot_south', 'norden': 'home_depot_west'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'home_depot_west': {#Stadt
+        'name': 'Home Depot – Westen',
+        'description': 'Längs der Westseite des Parkplatzes. Im SÜDEN die Südwestecke. Nach NORDEN zur Nordwestecke.',
+        'exits': {'süden': 'home_depot_sw', 'norden': 'home_depot_nw'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'home_depot_nw': {#Stadt
+        'name': 'Home Depot - Nordwesten',
+        'description': 'Nordwestecke des Umrings. Im SÜDEN die Westseite. Im OSTEN die Nordseite.',
+        'exits': {'süden': 'home_depot_west', 'osten': 'home_depot_north'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'home_depot_north': {#Stadt
+        'name': 'Home Depot – Norden',
+        'description': 'Die Nordseite vorm ehemaligen Home Depot. Im WESTEN die Nordwestecke. Im OSTEN die Nordostecke.',
+        'exits': {'westen': 'home_depot_nw', 'osten': 'home_depot_ne'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'home_depot_ne': {#Stadt
+        'name': 'Home Depot – Nordosten',
+        'description': 'Nordostecke am Zaun. Im WESTEN die Nordseite. Im SÜDEN der östliche Rand. Im OSTEN zur Straße vor der Pizzeria. Nach NORDEN führt die Straße zur Krankenhaus Straße.',
+        'exits': {'westen': 'home_depot_north', 'süden': 'home_depot_east', 'osten': 'straße_pizzeria', 'norden': 'krankenhaus_straße'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'haus1': {#Haus1
+        'name': 'Haus 1',
+        'description': 'Du stehst vor der Haustür vom Haus doch sie lässt sich nicht öffnen.',
+        'exits': {'norden': 'suedlich_haus', 'osten': 'haus1_vordertür'},
+        'items': [],
+        'in_development': True
+    },
+    'haus1_vordertür': {#Haus1
+        'name': 'Haus 1 - Vordertür',
+        'description': 'Du stehst im Eingangsbereich von Haus 1. Es riecht muffig und der Boden knarzt unter deinen Füßen.',
+        'exits': {'westen': 'haus1'},
+        'items': [],
+        'in_development': True
+    },
+    'haus1_Flur': {#Haus1
+        'name': 'Haus 1 - Flur',
+        'description': 'Der flur voll mit dreck und kapputen holz sachen sowie verschiedene türen.',
+        'exits': {'Norden': 'haus1_vordertür', 'Süden': 'haus1_wohnzimmer', 'Osten': 'haus1_Flur2'},
+        'items': [],
+        'in_development': True
+    },
+    'haus1_Flur2': {#Haus1
+        'name': 'Haus 1 - Flur2',
+        'description': 'Der Flür führt weiter hinein, ins haus, im Westen ist ein schlafzimmer, im Osten noch mehr flur mit mehreren Türen.Im Westen ist das ende des Flurs aber an der decke ist eine dachbodentür.',
+        'exits': {'Süden': 'haus1_dachbodentür', 'Osten': 'haus1_Flur3', 'Westen': 'haus1_schlafzimmer2'},
+        'items': [],
+        'in_development': True
+    },
+    'haus1_dachbodentür': {#Haus1
+        'name': 'Haus 1 - Dachbodeneingang',
+        'description': 'Nun direkt unter der dachbodentür, du kommst nicht ganz von selbst dran.',
+        'exits': {'Norden': 'haus1_Flur', 'Hoch': 'haus1_dachboden'},
+        'items': [],
+        'in_development': True
+    },
+    'haus1_dachboden': {#Haus1
+        'name': 'Haus 1 - Dachboden',
+        'description': 'Der Dachboden voll mit boxen und alten Möbeln. Alles verstaubt und dreckig.',
+        'exits': {'Runter': 'haus1_dachbodentür'},
+        'items': [],
+        'in_development': True
+    },
+    'haus1_wohnzimmer': {#Haus1
+        'name': 'Haus 1 - Wohnzimmer',
+        'description': 'Kappute gläser, dreckige couch, nicht nützliches in diesem raum.',
+        'exits': {'Norden': 'haus1_Flur'},
+        'items': [],
+        'in_development': True
+    },
+    'haus1_schlafzimmer2': {#Haus1
+        'name': 'Haus 1 - Schlafzimmer 2',
+        'description': 'Das Bett umgeworfen, schrank leer, der Raum schon längst ausgeplündert.',
+        'exits': {'Osten': 'haus1_Flur2'},
+        'items': [],
+        'in_development': True
+    },
+    'haus1_schlafzimmer': {#Haus1
+        'name': 'Haus 1 - Schlafzimmer',
+        'description': 'Alles dreckig und verstaubt, vieles gibt es hier nicht, aber ein kleiner nachtschrank neben dem bett.',
+        'exits': {'Süden': 'haus1_Flur3'},
+        'items': [],
+        'in_development': True
+    },
+    'haus1_badezimmer': {#Haus1
+        'name': 'Haus 1 - Badezimmer',
+        'description': 'Verdreckt mit scherben, alles kaputt, nichts heiles mehr, villeicht findet sich hier noch etwas in einem schrank.',
+        'exits': {'Westen': 'haus1_Flur3'},
+        'items': ['Medikit'],
+        'in_development': True
+    },
+    'haus1_küche': {#Haus1
+        'name': 'Haus 1 - Küche',
+        'description': 'Das ganze besteck leer geräumt, kühlschrank leer, teller kaputt, nichts mehr da im Raum.',
+        'exits': {'Norden': 'haus1_Flur3'},
+        'items': [],
+        'in_development': True
+    },
+    'haus1_Flur3': {#Haus1
+        'name': 'Haus 1 - Flur3',
+        'description': 'Du stehst im Eingangsbereich von Haus 1. Es riecht muffig und der Boden knarzt unter deinen Füßen.',
+        'exits': {'Norden': 'haus1_schlafzimmer', 'Westen': 'haus1_Flur2', 'Süden': 'haus1_küche', 'Osten': 'haus1_badezimmer'},
+        'items': [],
+        'in_development': True
+    },
+    'haus2': { #House 2
+        'name': 'Haus 2',
+        'description': 'Du stehst vor einem verlassenen Haus. Die Tür ist verriegelt, durch die zerbrochenen Fenster siehst du nur Dunkelheit. Im WESTEN führt die östliche Straße zurück zum Spawn-Bereich. Im OSTEN führt der Weg zum Wasserpark.',
+        'exits': {'westen': '', 'osten': ''},
+        'items': [],
+        'in_development': True
+    },
+    'straße_pizzeria': {#Stadt
+        'name': 'Straße Pizzeria',
+        'description': (
+            'Eine Straße vor einer alten Pizzeria. Das verblasste Schild schwankt im Wind. '
+            'Im NORDEN siehst du das schwere Eingangstor der Polizeistation. '
+            'Im OSTEN geht es zur Skyscraper Weggabelung. '
+            'Nach WESTEN führt der Weg an die Ostseite des Home-Depot-Umrings.'
+        ),
+        'exits': {'osten': 'skyscraper_weggabelung', 'westen': 'home_depot_ne', 'norden': 'polizei_umkleide'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': False
+    },
+    
+    'park': {#Stadt
+        'name': 'Park',
+        'description': 'Ein verwilderter Park. Überwucherte Bänke und ein rostiger Spielplatz. Die Natur holt sich alles zurück. Im WESTEN liegt die östliche Weggabelung. Nach NORDEN führt die Park Straße.',
+        'exits': {'westen': 'oestlich_weggabelung', 'norden': 'park_straße'},
+        'items': [],
+        'in_development': True,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+
+    # ── GASSE & COFFEESHOP ─────────────────────────────────────────
+    'gasse': {#Stadt
+        'name': 'Gasse',
+        'description': (
+            'Eine enge, dunkle Gasse zwischen zwei Gebäuden. '
+            'Mülltonnen stehen an den Wänden, Graffiti bedeckt den alten Beton. '
+            'Im WESTEN liegt die Park Straße. Nach SÜDEN führt die Gasse tiefer hinein.'
+        ),
+        'exits': {'westen': 'park_straße', 'süden': 'gasse_ende'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': False
+    },
+    'gasse_ende': {#Stadt
+        'name': 'Gassenende',
+        'description': (
+            'Das Ende der Gasse. Eine verwitterte Backsteinwand versperrt den Weg nach Süden. '
+            'Eine schwere, mit Graffiti besprühte Holztür liegt im WESTEN — '
+            'ein verblasstes Kaffeetassen-Logo ist noch zu erkennen. Die Tür ist verschlossen. '
+            'Unter einer umgekippten Mülltonne liegt etwas im Dreck. '
+            'Nach NORDEN führt die Gasse zurück.'
+        ),
+        'exits': {'norden': 'gasse'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'coffeeshop': {#Coffeeshop
+        'name': 'Coffeeshop',
+        'description': (
+            'Du betrittst den verlassenen Coffeeshop. Der Geruch von altem Kaffee hängt noch schwach in der Luft. '
+            'Umgeworfene Stühle und Tische stehen kreuz und quer. Hinter dem Tresen steht eine verrostete Espressomaschine. '
+            'Die Vitrine ist aufgebrochen und leer geplündert — bis auf ein paar vergessene Schokoriegel. '
+            'In der hinteren Ecke sitzt ein großer, bärtiger Mann auf dem Boden — er starrt dich mit aufgerissenen Augen an. '
+            'Die Tür im OSTEN führt zurück in die Gasse.'
+        ),
+        'exits': {'osten': 'gasse_ende'},
+        'items': ['schokoriegel', 'wasser', 'energieriegel'],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+
+    # ── POLIZEISTATION ──────────────────────────────────────────────
+    'polizei_umkleide': {#Polizeistation
+        'name': 'Polizeistation – Umkleideraum',
+        'description': (
+            'Du betrittst die Polizeistation durch die schwere Stahltür im Süden. '
+            'Der Umkleideraum riecht nach Rost und altem Leder. '
+            'An den Wänden stehen aufgebrochene Metallspinde – die meisten leer geplündert. '
+            'Einige Stühle und Bänke liegen umgeworfen auf dem Boden. '
+            'Nach NORDEN führen zwei Türen ins Hauptbüro.'
+        ),
+        'exits': {'süden': 'straße_pizzeria', 'norden': 'polizei_hauptbuero'},
+        'items': ['medkit', 'konserven'],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': True
+    },
+    'polizei_hauptbuero': {#Polizeistation
+        'name': 'Polizeistation – Hauptbüro',
+        'description': (
+            'Das Hauptbüro ist weitläufig. Acht Schreibtische stehen in zwei Reihen – '
+            'Akten, zerbrochene Monitore und umgekippte Kaffeebecher bedecken sie. '
+            'Schubladen wurden aufgerissen und geleert. '
+            'An der Wand hängt noch ein verblasstes Fahndungsplakat. '
+            'Im SÜDEN liegen die Umkleidekabinen. Nach OSTEN führt eine Tür zum Waffenraum.'
+        ),
+        'exits': {'süden': 'polizei_umkleide', 'osten': 'polizei_waffenraum'},
+        'items': ['crackers', 'wasser'],
+        'in_development': False,
+        'spawn_chance': True,
+        'zombie_spawn': True
+    },
+    'polizei_waffenraum': {#Polizeistation
+        'name': 'Polizeistation – Waffenraum',
+        'description': (
+            'Hinter einer schweren Stahltür liegt der Waffenraum. '
+            'Drei massive Waffenregale aus Stahl stehen an den Wänden – alle leer. '
+            'Wer auch immer hier war, hat alles mitgenommen. '
+            'Auf dem Boden liegt zerbrochenes Glas von einer Vitrine. '
+            'Versteckt unter einem umgefallenen Regal findest du noch eine einsame Pistole. '
+            'Nach WESTEN geht es zurück ins Hauptbüro.'
+        ),
+        'exits': {'westen': 'polizei_hauptbuero'},
+        'items': ['pistole', 'pistolen_munition', 'pistolen_munition', 'ak_munition'],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+
+    # ========================
+    # NEUES GEBIET: Gebirgslandschaft → Fluss → Walddorf → Labyrinth → Friedhof
+    # ========================
+    'berglandschaft': {
+        'name': 'Gebirgslandschaft',
+        'description': (
+            'Du stehst am Rand einer zerklüfteten Gebirgslandschaft. '
+            'Graue Felsmassive ragen in den verhangenen Himmel. Schroffe Klippen fallen zu beiden Seiten ab, '
+            'und der Wind pfeift kalt durch die Felspalten. '
+            'Ein schmaler, steiniger Pfad schlängelt sich nach WESTEN hinunter Richtung Tal — '
+            'ein mindestens einstündiger Marsch. '
+            'Im NORDEN liegt das Casino.'
+        ),
+        'exits': {'norden': 'casino_se', 'westen': 'fluss'},
+        'travel_time_exits': {'westen': 1},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'fluss': {
+        'name': 'Fluss',
+        'description': (
+            'Ein breiter, träge fließender Fluss durchzieht das Tal. '
+            'Das Wasser ist dunkelbraun und undurchsichtig — man sieht nicht, was darunter lauert. '
+            'Das Ufer ist schlammig und riecht nach feuchtem Holz und Verwesung. '
+            'Am Ufer liegt ein verwittertes BOOT, das an einem Pflock festgemacht ist. '
+            'Es sieht noch seetüchtig aus. Schnitzereien an der Bordwand zeigen einen Weg '
+            'flussabwärts — etwa zwei Stunden Fahrt. '
+            'Der Weg nach OSTEN führt zurück zur Gebirgslandschaft. '
+            'Tippe "nutze boot", um das Boot flussabwärts zu nehmen.'
+        ),
+        'exits': {'osten': 'berglandschaft'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'walddorf_straße': {
+        'name': 'Walddorf-Dorfstraße – Süden',
+        'description': (
+            'Der Fluss hat dich hierher gebracht — an den südlichen Rand eines Dorfes, '
+            'das die Welt vergessen zu haben scheint. '
+            'Eine moosbedeckte Straße zieht sich zwischen uralten Bäumen nach NORDEN, '
+            'ihre Äste verflechten sich hoch oben zu einem lückenlosen Blätterdach. '
+            'Was immer hier einmal gelebt hat, lebt hier nicht mehr. '
+            'Und doch hat man das Gefühl, beobachtet zu werden. '
+            'Im WESTEN führt eine ausgetretene Steintreppe in die Tiefe, '
+            'zu einem unterirdischen Eingang. '
+            'Im OSTEN erhebt sich eine alte Steinmauer — dahinter liegt ein Labyrinth.'
+        ),
+        'exits': {'westen': 'sex_dungeon', 'osten': 'labyrinth_eingang', 'norden': 'walddorf_straße_mitte'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'walddorf_straße_mitte': {
+        'name': 'Walddorf-Dorfstraße – Mitte',
+        'description': (
+            'Die Straße verbreitert sich hier ein wenig, als hätte das Dorf einmal '
+            'einen Dorfplatz gehabt — ein Echo von Gemeinschaft, das längst verhallt ist. '
+            'Verrottete Holzbänke stehen schief im Gras, überwachsen von Efeu. '
+            'Eine Wetterfahne auf einem der Häuser dreht sich, obwohl kein Wind weht. '
+            'Im WESTEN verschwindet ein kaum sichtbarer Trampelpfad zwischen den Stämmen — '
+            'jemand geht diesen Weg noch, oder ging ihn einmal sehr oft. '
+            'Im NORDEN zieht sich die Straße weiter ins Dunkel. '
+            'Im SÜDEN liegt das südliche Ende des Dorfes.'
+        ),
+        'exits': {'süden': 'walddorf_straße', 'norden': 'walddorf_straße_nord', 'westen': 'waldhaus'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'walddorf_straße_nord': {
+        'name': 'Walddorf-Dorfstraße – Norden',
+        'description': (
+            'Die Straße endet hier — abrupt, als hätte jemand die Welt einfach '
+            'aufgehört weiterzubauen. '
+            'Das letzte Haus links hat keine Tür mehr; im Inneren bewegt sich nichts, '
+            'aber es riecht nach frischem Rauch. '
+            'Die Bäume stehen dichter als je zuvor, ihre Stämme so alt und breit, '
+            'dass sie wie Säulen einer untergegangenen Kathedrale wirken. '
+            'Dazwischen, im WESTEN, flimmert etwas — ein Licht, das keine Farbe hat, '
+            'die du benennen könntest. Die Luft dort schmeckt nach Honig und Verwesung. '
+            'Im SÜDEN liegt die Mitte des Dorfes.'
+        ),
+        'exits': {'süden': 'walddorf_straße_mitte', 'westen': 'märchen'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'waldhaus': {
+        'name': 'Das Waldhaus',
+        'description': (
+            'Tief im Wald, weit weg vom Trampelpfad, steht dieses Haus — '
+            'als wäre es aus dem Boden gewachsen. '
+            'Die Wände sind aus unbehauenem Stein, überzogen von schwarzem Moos, '
+            'und die Fensterläden hängen schief. '
+            'Eine Gartentür aus Eisen steht offen. Auf dem Türrahmen klebt Wachs '
+            'von hundert erloschenen Kerzen. '
+            'Drinnen hängt der Duft von Kräutern und Holzfeuer. '
+            'Emilia und ihre Großmutter Helene leben hier. '
+            'Der Rückweg nach OSTEN führt zur Dorfstraße.'
+        ),
+        'exits': {'osten': 'walddorf_straße_mitte'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'märchen': {
+        'name': 'Das Märchen',
+        'description': (
+            'Du trittst durch das Flimmern — und die Welt hört auf, die Welt zu sein. '
+            'Der Boden unter dir ist weiches Moos in einem Grün, '
+            'das in der Natur nicht vorkommt. '
+            'Bäume tragen Früchte, die leuchten. Schmetterlinge so groß wie Hände '
+            'sitzen reglos auf Blüten aus Kristall. '
+            'Irgendwo spielt jemand eine Melodie auf einem Instrument, '
+            'das du nicht kennst — sie klingt vertraut, wie ein Kindheitstraum '
+            'den du nie hattest. '
+            'Und doch: Die Stille darunter ist absolut. '
+            'Wenn du lange genug stillhältst, wirst du sie hören. '
+            'Der Ausweg zurück nach OSTEN flimmert in der Ferne.'
+        ),
+        'exits': {'osten': 'walddorf_straße_nord'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+
+    'sex_dungeon': {
+        'name': 'Sex Dungeon',
+        'description': (
+            'Eine feuchte, schlecht beleuchtete Kammer, tief in den Fels gehauen. '
+            'Verwitterte Fesselvorrichtungen hängen an den Wänden, Ketten rosten in den Ecken. '
+            'Der Boden ist kalt und nass. Ein beißender Geruch nach Moder, '
+            'Schimmel und etwas Unaussprechlichem liegt in der Luft. '
+            'In den Wänden sind Namen eingekratzt — viele Namen. '
+            'Und dann siehst du sie. '
+            'Aus dem Schatten löst sich eine Gestalt — weiblich einmal, jetzt etwas anderes. '
+            'Die ZOMBIE-HURE. Ihr Körper ist eine Wand aus verfaultem Fleisch und brutaler Kraft. '
+            'Kugeln, Klingen, Schläge — alles prallt von ihr ab wie von Beton. '
+            'Nur eine Stelle ist schwach: der enge TANGA, der sich tief in ihren Körper gräbt. '
+            'Ein gezielter Tangazieher könnte sie außer Gefecht setzen. '
+            'Tippe: "ziehe tanga" um die Schwachstelle auszunutzen. '
+            'Die einzige Möglichkeit raus ist nach OSTEN.'
+        ),
+        'exits': {'osten': 'walddorf_straße'},
+        'items': [],
+        'enemy': 'zombie_hure',
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'labyrinth_eingang': {
+        'name': 'Labyrinth – Eingang',
+        'description': (
+            'Ein verwittertes Steintor markiert den Eingang des Labyrinths. '
+            'Efeu überwuchert die alten Mauern, und moosige Steine bedecken den Boden. '
+            'Ein verblasstes Schild warnt: "Kehr um — oder verliere dich für immer." '
+            'Der Weg nach WESTEN führt zurück zur Dorfstraße. '
+            'Nach NORDEN beginnen die Gänge des Labyrinths.'
+        ),
+        'exits': {'westen': 'walddorf_straße', 'norden': 'labyrinth_gang1'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'labyrinth_gang1': {
+        'name': 'Labyrinth – Erster Gang',
+        'description': (
+            'Hohe Steinmauern erheben sich zu beiden Seiten. '
+            'Fackeln an den Wänden brennen mit einem blassen, kalten Licht. '
+            'Der Gang gabelt sich: Nach NORDEN liegt Dunkelheit, '
+            'im OSTEN führt ein schmalerer Pfad ab. '
+            'Im SÜDEN ist der Eingang.'
+        ),
+        'exits': {'süden': 'labyrinth_eingang', 'norden': 'labyrinth_kreuzung', 'osten': 'labyrinth_sackgasse1'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'labyrinth_sackgasse1': {
+        'name': 'Labyrinth – Sackgasse',
+        'description': (
+            'Die Mauern verengen sich zu einer engen Sackgasse. '
+            'An der Steinwand hat jemand mit einem Nagel geritzt: "NICHT HIER." '
+            'Getrocknetes Blut klebt am Boden. '
+            'Du musst zurück nach WESTEN.'
+        ),
+        'exits': {'westen': 'labyrinth_gang1'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'labyrinth_kreuzung': {
+        'name': 'Labyrinth – Kreuzung',
+        'description': (
+            'Du stehst an einer Kreuzung im Herzen des Labyrinths. '
+            'Vier Richtungen, eine richtige. Im WESTEN klingt der Gang hohl wie eine Kammer. '
+            'Im OSTEN führt ein schmaler Pfad weiter. '
+            'Im SÜDEN ist der Gang zurück.'
+        ),
+        'exits': {'süden': 'labyrinth_gang1', 'westen': 'labyrinth_sackgasse2', 'osten': 'labyrinth_gang2'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'labyrinth_sackgasse2': {
+        'name': 'Labyrinth – Zweite Sackgasse',
+        'description': (
+            'Ein feuchter, niedriger Tunnel endet abrupt vor einer blinden Mauer. '
+            'Knochen liegen verstreut am Boden — jemand kam hierher und fand keinen Weg zurück. '
+            'Ein faustgroßes Loch in der Wand blickt in absolute Schwärze. '
+            'Du wendest dich um und gehst nach OSTEN.'
+        ),
+        'exits': {'osten': 'labyrinth_kreuzung'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'labyrinth_gang2': {
+        'name': 'Labyrinth – Letzter Gang',
+        'description': (
+            'Der Gang wird breiter, die Mauern weichen zurück. '
+            'Kaltes graues Licht sickert von NORDEN herein — du spürst frische Luft. '
+            'Das Labyrinth liegt fast hinter dir. '
+            'Nach WESTEN ist die Kreuzung. Nach NORDEN liegt der Ausgang.'
+        ),
+        'exits': {'westen': 'labyrinth_kreuzung', 'norden': 'labyrinth_ausgang'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'labyrinth_ausgang': {
+        'name': 'Labyrinth – Ausgang',
+        'description': (
+            'Du hast das Labyrinth durchquert. '
+            'Das alte Steintor im NORDEN steht einen Spalt offen — '
+            'dahinter liegt ein stiller, überwucherter Friedhof. '
+            'Hinter dir im SÜDEN liegt das Dunkel der Gänge.'
+        ),
+        'exits': {'süden': 'labyrinth_gang2', 'norden': 'friedhof'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+    'friedhof': {
+        'name': 'Friedhof',
+        'description': (
+            'Du stehst auf einem alten, verlassenen Friedhof. '
+            'Verwitterte Grabsteine ragen aus dem hohen Gras, einige von ihnen '
+            'frisch aufgewühlt — als hätte etwas von innen gegraben. '
+            'Eine abgestorbene Eiche ragt in der Mitte des Friedhofs auf, '
+            'ihre nackten Äste greifen wie Klauen in den Himmel. '
+            'Die Stille hier ist anders als anderswo — schwerer, erwartungsvoller. '
+            'Im SÜDEN liegt der Ausgang des Labyrinths.'
+        ),
+        'description_aftermath': (
+            'Der Friedhof ist nicht mehr derselbe. '
+            'Schwarzer Schleim verklebt das Gras, durchzogen von etwas das nach '
+            'verbranntem Fleisch und Öl riecht. '
+            'Reste des Verschlingers schmelzen langsam in die Erde zurück, als wären '
+            'sie nie da gewesen — oder als wollte die Welt es vergessen lassen. '
+            'Am Fuß der alten Eiche: eine Blutlache. Christophers. '
+            'Und daneben, in der weichen Erde: zwei Fußabdrücke. '
+            'Zu lang. Zu schmal. Nicht menschlich. '
+            'Sie führen nach Norden — und verlieren sich im Dunkel. '
+            'Im SÜDEN liegt der Ausgang des Labyrinths.'
+        ),
+        'exits': {'süden': 'labyrinth_ausgang'},
+        'items': [],
+        'in_development': False,
+        'spawn_chance': False,
+        'zombie_spawn': False
+    },
+
+}
+
+# ========================
+# HIERARCHICAL CONTAINER SYSTEM
+# ========================
+# Architecture: World → Building → Floor → Room → Objects
+# All movement between rooms passes through Discrete Transition Nodes.
+
+BUILDING_HIERARCHY = {
+    'bunker': {
+        'name': 'Bunker',
+        'floors': {
+            'main': ['start', 'corridor', 'laboratory', 'storage', 'tunnel'],
+        },
+    },
+    'versteck': {
+        'name': 'Versteck (Safehouse)',
+        'floors': {
+            'erdgeschoss': ['spawn', 'schlafzimmer', 'flur', 'badezimmer',
+                           'eingangsbereich', 'wohnzimmer', 'wohnbereich',
+                           'schlafzimmer2', 'kueche', 'vordertuer', 'treppen'],
+            'keller': ['keller', 'lagerraum'],
+        },
+    },
+    'stadt': {
+        'name': 'Stadt',
+        'floors': {
+            'straßen': ['suedlich_haus', 'westliche_haus_gabelung',
+                       'oestlich_weggabelung', 'nord_westliche_weggabelung',
+                       'nord_östliche_weggabelung', 'östliche_straße',
+                       'norden_straße', 'park_straße', 'skyscraper_weggabelung',
+                       'skyscraper_straße',
+                       'tower_straße_west', 'tower_straße_sw',
+                       'süd_östliche_skyscraper_weggabelung',
+                       'skyscraper2_weggabelung_west',
+                       'feuerwehrstraße',
+                       'feuerwehr_straße_se',
+                       
+                       'home_depot_east', 'home_depot_se', 'home_depot_south',
+                       'home_depot_sw', 'home_depot_west', 'home_depot_nw',
+                       'home_depot_north', 'home_depot_ne',
+                       'straße_pizzeria'],
+        },
+    },
+    'krankenhaus': {
+        'name': 'Krankenhaus',
+        'floors': {
+            'main': ['krankenhaus_straße', 'krankenhaus_eingang','krankenhaus_wartebereich'],
+        },
+    },
+    'bibliothek': {
+        'name': 'Bibliothek',
+        'floors': {
+            'main': ['bibliothek_straße', 'bibliothek_eingang',
+                    'bibliothek_1.1', 'bibliothek_1.2', 'bibliothek_2',
+                    'bibliothek_3', 'bibliothek_4', 'bibliothek_5',
+                    'bibliothek_6', 'bibliothek_7', 'bibliothek_8'],
+        },
+    },
+    'walmart': {
+        'name': 'Walmart',
+        'floors': {
+            'main': ['parkplatz', 'walmart_eingang', 'walmart_1', 'walmart_2',
+                    'walmart_3', 'walmart_4', 'walmart_5', 'walmart_6',
+                    'walmart_7', 'walmart_8', 'walmart_9', 'walmart_10',
+                    'walmart_11', 'walmart_12.1', 'walmart_12.2',
+                    'walmart_13', 'walmart_14'],
+        },
+    },
+    'haus1': {
+        'name': 'Haus 1',
+        'floors': {'main': ['haus1', 'haus1_vordertür']},
+    },
+    'haus2': {
+        'name': 'Haus 2',
+        'floors': {'main': ['haus2']},
+    },
+    'haus3': {
+        'name': 'Haus 3',
+        'floors': {
+            'main': ['haus_3_eingang', 'haus_3_v', 'haus_3_wohnbereich',
+                    'wohnzimmer_h3', 'küche_h3', 'bathroom_3', 'bedroom_3',
+                    'bedroom_2'],
+        },
+    },
+    'park': {
+        'name': 'Park',
+        'floors': {'main': ['park']},
+    },
+    'polizeistation': {
+        'name': 'Polizeistation',
+        'floors': {
+            'main': [
+                'polizei_umkleide',
+                'polizei_hauptbuero',
+                'polizei_waffenraum',
+            ],
+        },
+    },
+    'casino': {
+        'name': 'Casino',
+        'floors': {
+            'straßen': ['casino_east', 'casino_se', 'casino_sw'],
+            'innen': ['casino_eingang', 'casino_spielhalle', 'casino_bar',
+                      'casino_hinterzimmer', 'casino_tresor'],
+        },
+    },
+    'coffeeshop': {
+        'name': 'Coffeeshop',
+        'floors': {
+            'main': ['gasse', 'gasse_ende', 'coffeeshop'],
+        },
+    },
+    'skyscraper1': {
+        'name': 'Skyscraper 1',
+        'floors': {
+            'erdgeschoss': [
+                'skyscraper_1',
+                'skyscraper_1_lobby',
+            ],
+        },
+    },
+    'skyscraper2': {
+        'name': 'Skyscraper 2',
+        'floors': {
+            'erdgeschoss': [
+                'skyscraper_2_eingang',
+                'skyscraper_2_mitarbeiter',
+            ],
+        },
+    },
+}
+
+# Reverse lookup: room_key → (building_key, floor_key)
+_room_to_container = {}
+for _bk, _bd in BUILDING_HIERARCHY.items():
+    for _fk, _fr in _bd['floors'].items():
+        for _rk in _fr:
+            _room_to_container[_rk] = (_bk, _fk)
+
+# ===== TRANSITIONS (abgeleitet aus exits) =====
+# Für Bewegung gilt nur noch rooms[room]['exits'].
+# Diese Liste existiert nur für die Karten-/Edge-Anzeige.
+def _normalize_direction(value):
+    if not isinstance(value, str):
+        return ""
+    return value.strip().lower()
+
+# Kleingeschriebene Raum-Keys → Original-Key (erster Treffer, wie die frühere Schleife)
+_room_keys_lower = {}
+for _rk in rooms:
+    _room_keys_lower.setdefault(_rk.lower(), _rk)
+
+def _resolve_room_key(value):
+    """Resolve target room keys tolerant against small naming mismatches."""
+    if not isinstance(value, str):
+        return None
+    candidate = value.strip()
+    if not candidate:
+        return None
+    if candidate in rooms:
+        return candidate
+    lowered = candidate.lower()
+    if lowered in _room_keys_lower:
+        return _room_keys_lower[lowered]
+    normalized = candidate.replace("-", "_")
+    if normalized in rooms:
+        return normalized
+    return _room_keys_lower.get(normalized.lower())
+
+def sanitize_room_exits():
+    """Normalisiert exits: Richtungen klein, Zielräume auf gültige Keys auflösen."""
+    fixed = 0
+    removed = 0
+    for _room_key, _room_data in rooms.items():
+        _raw_exits = _room_data.get('exits', {})
+        if not isinstance(_raw_exits, dict):
+            _room_data['exits'] = {}
+            removed += 1
+            continue
+
+        _new_exits = {}
+        for _dir, _target in _raw_exits.items():
+            _norm_dir = _normalize_direction(_dir)
+            _resolved_target = _resolve_room_key(_target)
+            if not _norm_dir or not _resolved_target:
+                removed += 1
+                continue
+            _new_exits[_norm_dir] = _resolved_target
+            if _norm_dir != _dir or _resolved_target != _target:
+                fixed += 1
+
+        _room_data['exits'] = _new_exits
+
+    if fixed or removed:
+        print(f"[MAP] Exits bereinigt: {fixed} korrigiert, {removed} entfernt")
+
+def rebuild_transitions_from_exits():
+    """Baut TRANSITIONS komplett aus dem Raumgraphen neu auf. Einzelne
+    geänderte Räume gehen günstiger über refresh_exits()."""
+    TRANSITIONS.build(ROOM_GRAPH)
+    return TRANSITIONS
+
+sanitize_room_exits()
+
+# Kompilierter Graph für Bewegung und Ausgangslisten (siehe room_graph.py)
+ROOM_GRAPH = RoomGraph(_resolve_room_key, _normalize_direction)
+ROOM_GRAPH.compile(rooms)
+TRANSITIONS = EdgeIndex()
+rebuild_transitions_from_exits()
+
+def refresh_exits(*room_keys):
+    """Nach jeder Änderung an rooms[...]['exits'] aufrufen: übernimmt die
+    Räume in den Raumgraphen und ersetzt nur deren Kanten in TRANSITIONS."""
+    for rk in room_keys:
+        if rk in rooms:
+            ROOM_GRAPH.sync_room(rk, rooms[rk])
+            TRANSITIONS.sync_room(rk, ROOM_GRAPH.exits(rk))
+
+def get_room_context(room_key):
+    """Returns (building_key, building_name, floor_key) for a room"""
+    ctx = _room_to_container.get(room_key)
+    if ctx:
+        bldg = BUILDING_HIERARCHY[ctx[0]]
+        return (ctx[0], bldg['name'], ctx[1])
+    return ('unbekannt', 'Unbekannt', 'unbekannt')
+
+def get_transitions_from(room_key):
+    """Returns list of (direction, target_room, transition) from this room."""
+    return [(d, target, {'locked': False}) for d, target in ROOM_GRAPH.exits(room_key)]
+
+def try_transition(room_key, direction):
+    """Attempt to move from room_key in direction. Returns (success, target, transition, message)."""
+    target = ROOM_GRAPH.target(room_key, direction)
+    if target:
+        return (True, target, {'locked': False, 'trigger': None}, None)
+    return (False, None, None, 'Du kannst nicht in diese Richtung gehen.')
+
+def unlock_transition(transition_id):
+    """Aktualisiert dynamische Übergänge nach Puzzle-Fortschritt."""
+    if transition_id in ('bib_3_4', 'bibliothek_3_4'):
+        apply_bibliothek_bookshelf_state()
+    elif transition_id == 'krankenhaus_geheim_treppe':
+        apply_krankenhaus_geheimlabor_state()
+    elif transition_id == 'coffeeshop_tür':
+        apply_coffeeshop_tür_state()
+    return None
+
+def apply_coffeeshop_tür_state():
+    """Synchronisiert den WESTEN-Exit zwischen gasse_ende <-> coffeeshop
+    mit dem Flag `coffeeshop_tür_auf`."""
+    ende = rooms.get('gasse_ende')
+    shop = rooms.get('coffeeshop')
+    if not ende or not shop:
+        return
+    if coffeeshop_tür_auf:
+        ende.setdefault('exits', {})['westen'] = 'coffeeshop'
+        shop.setdefault('exits', {})['osten'] = 'gasse_ende'
+        ende['description'] = (
+            'Das Ende der Gasse. Die schwere Holztür im WESTEN steht offen — '
+            'dahinter liegt der verlassene Coffeeshop. '
+            'Nach NORDEN führt die Gasse zurück.'
+        )
+    else:
+        ende.get('exits', {}).pop('westen', None)
+        shop.get('exits', {}).pop('osten', None)
+        ende['description'] = (
+            'Das Ende der Gasse. Eine verwitterte Backsteinwand versperrt den Weg nach Süden. '
+            'Eine schwere, mit Graffiti besprühte Holztür liegt im WESTEN — '
+            'ein verblasstes Kaffeetassen-Logo ist noch zu erkennen. Die Tür ist verschlossen. '
+            'Unter einer umgekippten Mülltonne liegt etwas im Dreck. '
+            'Nach NORDEN führt die Gasse zurück.'
+        )
+    refresh_exits('gasse_ende', 'coffeeshop')
+
+
+def apply_bibliothek_bookshelf_state():
+    """Synchronisiert die Exits zwischen bibliothek_3 <-> bibliothek_4 mit
+    dem Flag `bibliothek_4_schrank_geschoben`.
+
+    Solange das Bücherregal nicht geschoben ist, fehlen die Norden/Süden-
+    Übergänge. Nach dem Schieben werden sie hinzugefügt und Raumgraph
+    sowie Karte (TRANSITIONS) aktualisiert.
+    """
+    b3 = rooms.get('bibliothek_3')
+    b4 = rooms.get('bibliothek_4')
+    if not b3 or not b4:
+        return
+    if bibliothek_4_schrank_geschoben:
+        b3.setdefault('exits', {})['norden'] = 'bibliothek_4'
+        b4.setdefault('exits', {})['süden'] = 'bibliothek_3'
+        b3['description'] = (
+            'Ein staubiger Lesebereich. Das schwere Bücherregal steht jetzt '
+            'zur Seite geschoben — der Weg nach NORDEN ist frei.'
+        )
+    else:
+        b3.get('exits', {}).pop('norden', None)
+        b4.get('exits', {}).pop('süden', None)
+        b3['description'] = (
+            'Ein staubiger Lesebereich. Im NORDEN versperrt ein schweres '
+            'BÜCHERREGAL den Durchgang. Wenn du dich dagegenstemmst, '
+            'könntest du es vielleicht zur Seite SCHIEBEN.'
+        )
+    refresh_exits('bibliothek_3', 'bibliothek_4')
+
+
+def apply_krankenhaus_geheimlabor_state():
+    """Synchronisiert runter/hoch zwischen krankenhaus_geheim_treppe und gl_empfang
+    mit dem Flag `numpad_nutzen`."""
+    treppe = rooms.get('krankenhaus_geheim_treppe')
+    empfang = rooms.get('gl_empfang')
+    if not treppe or not empfang:
+        return
+    if numpad_nutzen:
+        treppe.setdefault('exits', {})['runter'] = 'gl_empfang'
+        empfang.setdefault('exits', {})['hoch'] = 'krankenhaus_geheim_treppe'
+        treppe['description'] = (
+            'Hinter dem geöffneten Nummern-Pad führt eine Treppe nach unten '
+            'ins Geheimlabor. Im NORDEN gelangst du zurück ins Labor.'
+        )
+    else:
+        treppe.get('exits', {}).pop('runter', None)
+        empfang.get('exits', {}).pop('hoch', None)
+        if krankenhaus_schrank_geschoben:
+            treppe['description'] = (
+                'Hinter dem zur Seite geschobenen Schrank ist eine Tür mit '
+                'einem Nummern-Pad. Ein kleines Fenster zeigt eine Treppe nach unten. '
+                'Im NORDEN führt der Weg zurück ins Labor.'
+            )
+        else:
+            treppe['description'] = (
+                'Eine enge Treppe. Im NORDEN führt der Weg zurück ins Labor.'
+            )
+    refresh_exits('krankenhaus_geheim_treppe', 'gl_empfang')
+
+
+# ========================
+# AUSGANGSZUSTAND DER WELT
+# ========================
+# Snapshot direkt nach dem Laden — reset_world() stellt ihn wieder her,
+# damit headless Läufe (Engine.new_game) immer in derselben Welt starten.
+_WORLD_FLAGS = (
+    'bibliothek_4_schrank_geschoben', 'haus1_tür_auf', 'haus1_dachbodentür_auf',
+    'haus1_dachboden_box_geschoben', 'nachtschrank_auf', 'safe_auf_haus1',
+    'safe_durchsucht_haus1', 'numpad_awaiting_code', 'krankenhaus_schrank_geschoben',
+    'numpad_nutzen', 'coffeeshop_tür_auf', 'gasse_ende_untersucht',
+    'christopher_getroffen', 'christopher_dialog_index', 'emilia_getroffen',
+    'emilia_dialog_index', 'helene_dialog_index', 'friedhof_boss_intro_gezeigt',
+    'friedhof_event_abgeschlossen', 'christopher_verletzt',
+    'skyscraper1_rezeption_untersucht', 'credits_pending',
+)
+# Flag-abhängige Ausgänge wie bei jedem Spielstart herstellen, damit der
+# Snapshot (und damit die Basis der Spielstand-Deltas) ihnen entspricht.
+apply_bibliothek_bookshelf_state()
+apply_krankenhaus_geheimlabor_state()
+apply_coffeeshop_tür_state()
+_PRISTINE_FLAGS = {name: globals()[name] for name in _WORLD_FLAGS}
+_PRISTINE_WORLD = copy.deepcopy((rooms, enemies, weapons, player_stats))
+_SESSION_FLAGS = ('numpad_awaiting_code', 'credits_pending')  # gehören nicht in den Spielstand
+_SAVED_FLAGS = tuple(name for name in _WORLD_FLAGS if name not in _SESSION_FLAGS)
+
+
+def _world_fingerprint():
+    """Kurzer Hash des Ausgangszustands (Raum-Items, Ausgänge, Behälter,
+    Ladungen, Flags). Spielstände speichern nur die Abweichungen davon."""
+    baseline = {
+        'rooms': {rk: [rd.get('items', []), rd.get('exits', {})] for rk, rd in _PRISTINE_WORLD[0].items()},
+        'containers': sorted(ik for ik, idef in ITEM_DEFS.items() if idef.is_container),
+        'charges': {ik: idef.max_charge for ik, idef in ITEM_DEFS.items() if idef.max_charge >= 0},
+        'flags': {name: _PRISTINE_FLAGS[name] for name in _SAVED_FLAGS},
+    }
+    raw = json.dumps(baseline, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+SAVE_VERSION = 2  # 1 = komplette Welt, 2 = Deltas zum Ausgangszustand
+_BASELINE_FINGERPRINT = _world_fingerprint()
+
+
+def reset_world():
+    """Setzt Räume, Gegner, Waffen, Spielerwerte und Puzzle-Flags auf den
+    Ausgangszustand zurück. Die Dicts werden in-place ersetzt, damit
+    command_handlers & config weiterhin dieselben Objekte sehen."""
+    global scored_items, scored_kills
+    for live, pristine in zip((rooms, enemies, weapons, player_stats), _PRISTINE_WORLD):
+        live.clear()
+        live.update(copy.deepcopy(pristine))
+    ROOM_GRAPH.compile(rooms)
+    rebuild_transitions_from_exits()
+    globals().update(_PRISTINE_FLAGS)
+    scored_items = set()
+    scored_kills = set()
+    apply_bibliothek_bookshelf_state()
+    apply_krankenhaus_geheimlabor_state()
+    apply_coffeeshop_tür_state()
+
+@_input_entry('n')
+def start_game(seed=None):
+    """Neues Spiel. seed=None → nächster Seed der Kette (rng.advance())."""
+    global current_room, player_inventory, prolog_shown, prolog_lines, prolog_line_index, visited_rooms, zombie_kill_times
+    global game_score, game_moves, view_mode, visited_rooms_desc, game_start_ticks, pending_ambiguity
+    global bibliothek_4_schrank_geschoben, krankenhaus_schrank_geschoben, numpad_nutzen
+    global christopher_getroffen, christopher_dialog_index
+    global emilia_getroffen, emilia_dialog_index, helene_dialog_index
+    game_history.clear()
+    current_room = 'start'
+    player_inventory = ['fäuste']
+    prolog_shown = False
+    prolog_line_index = 0
+    visited_rooms = {'start'}  # Start-Raum als besucht markieren
+    visited_rooms_desc = set()
+    zombie_kill_times = {}  # Respawn-Cooldowns zurücksetzen
+    game_score = 0
+    game_moves = 0
+    view_mode = 'verbose'
+    pending_ambiguity = None
+    game_start_ticks = get_ticks()
+    _reseed(seed)
+    # Reset hidden stats
+    player_stats['health'] = 100
+    player_stats['strength'] = 100
+    player_stats['hunger'] = 0
+    player_stats['turns_since_last_meal'] = 0
+    player_stats['last_recovery_turn'] = 0
+    player_stats['equipped_weapon'] = None
+    player_stats['weapon_type'] = None
+    player_stats['in_combat'] = False
+    # Container-Inhalte zurücksetzen
+    for idef in ITEM_DEFS.values():
+        if idef.is_container:
+            idef.contents = []
+            idef.is_open = False
+        # Reset light charges
+        if idef.max_charge >= 0:
+            idef.charge = idef.max_charge
+
+    # Puzzle-Flags für neuen Spielstart zurücksetzen, damit z.B. das
+    # Bücherregal in der Bibliothek den Durchgang wieder blockiert.
+    bibliothek_4_schrank_geschoben = False
+    apply_bibliothek_bookshelf_state()
+    krankenhaus_schrank_geschoben = False
+    numpad_nutzen = False
+    apply_krankenhaus_geheimlabor_state()
+    coffeeshop_tür_auf = False
+    gasse_ende_untersucht = False
+    apply_coffeeshop_tür_state()
+    christopher_getroffen = False
+    christopher_dialog_index = 0
+    emilia_getroffen = False
+    emilia_dialog_index = 0
+    helene_dialog_index = 0
+    friedhof_boss_intro_gezeigt = False
+    friedhof_event_abgeschlossen = False
+    christopher_verletzt = False
+
+    # Menü-Musik stoppen, Ambient-Musik starten
+    start_ambient_music()
+
+    # Prolog in Zeilen aufteilen
+    prolog_lines = [line for line in PROLOG_TEXT.split('\n') if line.strip() or line == '']
+    
+    # Prolog-Text sofort anzeigen (process_command übernimmt die Logik)
+    process_command("")
+
+@_input_entry('m')
+def load_game_from_menu(slot=DEFAULT_SLOT):
+    """Lädt einen gespeicherten Spielstand direkt aus dem Hauptmenü.
+    Gibt True zurück wenn ein Spielstand geladen wurde."""
+    global prolog_shown, prolog_lines, prolog_line_index, pending_ambiguity
+    
+    _flush_saves()
+    path = save_slots().path(slot)
+    if not os.path.exists(path):
+        return False  # Kein Spielstand vorhanden
+    
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        _record('l', data, slot)  # Replay braucht den geladenen Stand, nicht die Datei
+    except Exception:
+        return False  # Fehler beim Laden → nichts tun
+    
+    prolog_shown = True  # Prolog überspringen, direkt ins Spiel
+    prolog_lines = []
+    prolog_line_index = 0
+    pending_ambiguity = None
+    game_history.clear()
+    
+    # Menü-Musik stoppen, Ambient-Musik starten
+    start_ambient_music()
+
+    # Spielstand laden (gleiche Logik wie restore_game)
+    notes = _apply_save_data(data)
+    
+    add_to_history("Spielstand geladen.")
+    for note in notes:
+        add_to_history(note)
+    add_to_history("")
+    describe_room()
+    return True
+def wrap_text(text, max_chars):
+    """Bricht Text an Wortgrenzen um (Word-Wrapping)"""
+    if len(text) <= max_chars:
+        return [text]
+    
+    lines = []
+    words = text.split(' ')
+    current_line = ""
+    
+    for word in words:
+        # Wenn das Wort selbst zu lang ist, hart umbrechen
+        while len(word) > max_chars:
+            if current_line:
+                lines.append(current_line)
+                current_line = ""
+            lines.append(word[:max_chars-1] + "-")
+            word = word[max_chars-1:]
+        
+        # Prüfe ob Wort noch in aktuelle Zeile passt
+        if current_line:
+            test_line = current_line + " " + word
+        else:
+            test_line = word
+        
+        if len(test_line) <= max_chars:
+            current_line = test_line
+        else:
+            # Zeile voll, neue Zeile beginnen
+            if current_line:
+                lines.append(current_line)
+            current_line = word
+    
+    # Letzte Zeile hinzufügen
+    if current_line:
+        lines.append(current_line)
+    
+    return lines if lines else [""]
+
+def wrap_paragraph(text, max_chars):
+    """Physische Zeilen eines Absatzes (leerer Absatz = eine Leerzeile)."""
+    if not text or text.strip() == "":
+        return [""]
+    return wrap_text(text, max_chars)
+
+def add_to_history(text, color=None):
+    """Fügt Text als logischen Absatz (text, color) zur Spielhistorie hinzu.
+
+    Der Absatz landet in output_queue; das Frontend übernimmt ihn (beim
+    pygame-Frontend per Typewriter-Effekt) nach game_history. Umgebrochen
+    wird erst beim Anzeigen, passend zur aktuellen Fensterbreite
+    (wrap_paragraph).
+
+    color=None → automatische Erkennung anhand Textmuster:
+      '>>> ...' = COLOR_DANGER, '=== ...' = COLOR_SYSTEM,
+      '> ...'   = COLOR_PLAYER, sonst = COLOR_NORMAL
+    """
+    if color is None:
+        stripped = text.strip() if text else ""
+        if stripped.startswith(">>>"):
+            color = COLOR_DANGER
+        elif stripped.startswith("===") or (stripped and all(c == '=' for c in stripped)):
+            color = COLOR_SYSTEM
+        elif stripped.startswith("> "):
+            color = COLOR_PLAYER
+        else:
+            color = COLOR_NORMAL
+
+    output_queue.append((text if text and text.strip() else "", color))
+    _frontend.on_output()
+
+
+@_input_entry('i')
+def submit_input(text):
+    """Verarbeitet eine Eingabezeile wie das Terminal: mehrere Befehle durch
+    Komma getrennt, jeder wird als '> befehl' ins Protokoll geschrieben."""
+    for sub_cmd in text.split(','):
+        sub_cmd = sub_cmd.strip()
+        if sub_cmd:
+            add_to_history(f"> {sub_cmd}")
+            process_command(sub_cmd)
+
+def move_direction(direction):
+    """Bewege Spieler in eine Richtung (via rooms['exits'])."""
+    global current_room
+    
+    # Try to find and use a transition node
+    success, target, transition, msg = try_transition(current_room, direction)
+    
+    if not success:
+        # Locked or no exit in that direction
+        if msg:
+            for line in msg.split('\n'):
+                add_to_history(line)
+        add_to_history("")
+        return
+    
+    # Timeskip-Trigger jetzt direkt über Raum/Route statt Transition-Objekt
+    if rooms.get(current_room, {}).get('trigger_timeskip') and target == 'spawn':
+        trigger_two_year_timeskip()
+        return
+
+    # Reisezeit-Trigger: bestimmte Ausgänge kosten Stunden (z.B. Bergpfad)
+    travel_time = rooms.get(current_room, {}).get('travel_time_exits', {}).get(_normalize_direction(direction))
+    if travel_time:
+        _trigger_travel_time(direction, target, travel_time)
+        return
+
+    # 50% Zombie-Spawn in target rooms with spawn_chance (mit 5-Min-Cooldown)
+    next_room = rooms.get(target)
+    if next_room and next_room.get('spawn_chance') and spawn_chance():
+        if zombie_respawn_ready(target):
+            enemies['zombie']['health'] = enemies['zombie']['max_health']
+            next_room['enemy'] = 'zombie'
+            next_room['zombie_spawn'] = True
+    
+    # Zombie-Sound beim Raumwechsel ausblenden (auch wenn Zombie noch lebt)
+    fade_zombie_sounds()
+    stop_combat_sounds()
+    # Kampfstatus zurücksetzen wenn Spieler den Kampf flieht
+    player_stats['in_combat'] = False
+    # Kampfmusik → Ambient wenn Spieler den Kampf flieht oder Zombie ignoriert
+    stop_combat_resume_ambient()
+
+    # Move player
+    current_room = target
+    visited_rooms.add(current_room)
+    add_to_history(f"Du gehst nach {direction.upper()}...")
+    if player_stats.get('companion') == 'christopher':
+        add_to_history("Christopher folgt dir.")
+    if player_stats.get('emilia_following'):
+        add_to_history("Emilia folgt dir.")
+    if player_stats.get('helene_following'):
+        add_to_history("Helene folgt dir, langsam aber stetig.")
+    add_to_history("")
+    describe_room()
+
+def _trigger_travel_time(direction, target, hours):
+    """Narrativer Übergang für lange Reisen (Stunden-Marsch oder Fahrt)."""
+    global current_room
+    stop_zombie_sounds()
+    stop_combat_sounds()
+    player_stats['in_combat'] = False
+    stop_combat_resume_ambient()
+    fade_zombie_sounds()
+
+    add_to_history("")
+    add_to_history(f"Du gehst nach {direction.upper()}...")
+    add_to_history("")
+
+    if hours == 1:
+        add_to_history("Der Pfad ist beschwerlich. Steine rollen unter deinen Füßen weg.")
+        add_to_history("Du kletterst über Geröll, schiebst dich durch enge Felspassagen.")
+        add_to_history("Der Wind peitscht kalt von den Gipfeln herab.")
+        add_to_history("")
+        add_to_history("        ... NACH EINER STUNDE ...")
+        add_to_history("")
+        add_to_history("Das Tal öffnet sich vor dir. Du hörst Wasser.")
+    elif hours == 2:
+        add_to_history("Du stößt das Boot vom Ufer, greifst die Ruder.")
+        add_to_history("Der Fluss trägt dich ruhig dahin. Bäume gleiten vorbei.")
+        add_to_history("Das Rauschen des Wassers übertönt alles andere.")
+        add_to_history("")
+        add_to_history("        ... NACH ZWEI STUNDEN ...")
+        add_to_history("")
+        add_to_history("Das Ufer weicht zurück. Du legst an einem fremden Dorf an.")
+    else:
+        add_to_history(f"Nach etwa {hours} Stunde(n) erreichst du dein Ziel.")
+
+    add_to_history("")
+    current_room = target
+    visited_rooms.add(current_room)
+    describe_room()
+
+
+def trigger_two_year_timeskip():
+    """Triggert den 2-Jahres-Zeitsprung zum Spawn-Haus"""
+    global current_room
+    
+    add_to_history("")
+    add_to_history("Du kriechst durch den Tunnel...")
+    add_to_history("")
+    add_to_history("Am Ende siehst du Tageslicht. Ein verlassenes Haus.")
+    add_to_history("")
+    add_to_history("Du trittst hinaus. Frische Luft. Stille.")
+    add_to_history("")
+    add_to_history("Albert atmet tief durch.")
+    add_to_history("")
+    add_to_history("\"Endlich... raus aus diesem Alptraum.\"")
+    add_to_history("")
+    add_to_history("\"Ich brauche eine Pause. Eine lange Pause.\"")
+    add_to_history("")
+    add_to_history("Du verriegelst die Türen. Sammelst Vorräte.")
+    add_to_history("Das Haus wird dein Versteck.")
+    add_to_history("")
+    add_to_history("=" * 40)
+    add_to_history("")
+    add_to_history("        ... 2 JAHRE SPÄTER ...")
+    add_to_history("")
+    add_to_history("=" * 40)
+    add_to_history("")
+    add_to_history("")
+    add_to_history("")
+    add_to_history("Du öffnest langsam die Augen.")
+    add_to_history("")
+    add_to_history("Du hiefst dich von der Matratze auf die auf dem Boden des Lagerraum im Keller liegt.")
+    add_to_history("Geweckt vom geräusch eines Zombies der in der Nacht rein kam.")
+    add_to_history("")
+    
+    # Sounds stoppen beim Teleport
+    stop_zombie_sounds()
+    stop_combat_sounds()
+    stop_combat_resume_ambient()
+
+    # Teleportiere zum Lagerraum
+    current_room = 'lagerraum'
+    visited_rooms.add('lagerraum')  # Neuen Raum als besucht markieren
+    
+    add_to_history("")
+    describe_room()
+
+def describe_room():
+    """Beschreibt den aktuellen Raum"""
+    global game_score, christopher_getroffen, emilia_getroffen, friedhof_boss_intro_gezeigt
+    room = rooms[current_room]
+    
+    # Score für neuen Raum
+    if current_room not in visited_rooms_desc:
+        add_score('new_room')
+    
+    # Erste Begegnung mit Zombie im Startroom
+    if current_room == 'start' and room.get('first_visit'):
+        play_random_zombie_sound()
+        add_to_history("")
+        add_to_history("Der Zombie taumelt auf dich zu!")
+        add_to_history("Tentakel zucken aus seinem Mund.")
+        add_to_history("")
+        room['first_visit'] = False
+        player_stats['in_combat'] = True
+        start_combat_music()
+        return
+    
+    # View Mode Logik
+    if view_mode == 'superbrief':
+        add_to_history(f"> {room['name']}")
+    elif view_mode == 'brief' and current_room in visited_rooms_desc:
+        add_to_history(f"> {room['name']}")
+    else:
+        add_to_history(f"> {room['name']}")
+        # Friedhof: Aftermath-Beschreibung nach dem Boss-Event
+        if current_room == 'friedhof' and friedhof_event_abgeschlossen and room.get('description_aftermath'):
+            add_to_history(room['description_aftermath'])
+        else:
+            add_to_history(room['description'])
+    
+    visited_rooms_desc.add(current_room)
+    
+    # Exits anzeigen
+    transitions = get_transitions_from(current_room)
+    if transitions:
+        exit_dirs = [d.capitalize() for d, tgt, t in transitions if not t.get('locked')]
+        locked_dirs = [d.capitalize() + " (Verschlossen)" for d, tgt, t in transitions if t.get('locked')]
+        all_exits = exit_dirs + locked_dirs
+        add_to_history(f"Ausgänge: {', '.join(all_exits)}")
+    
+    if room.get('items'):
+        add_to_history(f"Du siehst: {', '.join(room['items'])}")
+    
+    if current_room == 'wohnbereich' and room.get('zombie_spawn'):
+        if zombie_respawn_ready(current_room):
+            enemies['zombie']['health'] = enemies['zombie']['max_health']
+            play_random_zombie_sound()
+            add_to_history("")
+            add_to_history("Der Zombie taumelt auf dich zu!")
+            add_to_history("Tentakel zucken aus seinem Mund.")
+            add_to_history("")
+            room['zombie_spawn'] = False
+            player_stats['in_combat'] = True
+            start_combat_music()
+            return
+        else:
+            room['zombie_spawn'] = False
+    
+    if current_room == 'walmart_5' and room.get('zombie_spawn'):
+        if zombie_respawn_ready(current_room):
+            enemies['zombie']['health'] = enemies['zombie']['max_health']
+            play_random_zombie_sound()
+            add_to_history("")
+            add_to_history("Der Zombie taumelt auf dich zu!")
+            add_to_history("Tentakel zucken aus seinem Mund.")
+            add_to_history("")
+            room['zombie_spawn'] = False
+            player_stats['in_combat'] = True
+            start_combat_music()
+            return
+        else:
+            room['zombie_spawn'] = False
+
+    if current_room == 'walmart_9' and room.get('zombie_spawn'):
+        if zombie_respawn_ready(current_room):
+            enemies['zombie']['health'] = enemies['zombie']['max_health']
+            play_random_zombie_sound()
+            add_to_history("")
+            add_to_history("Der Zombie taumelt auf dich zu!")
+            add_to_history("Tentakel zucken aus seinem Mund.")
+            add_to_history("")
+            room['zombie_spawn'] = False
+            player_stats['in_combat'] = True
+            start_combat_music()
+            return
+        else:
+            room['zombie_spawn'] = False
+    # Christopher Thomson — Erstbegegnung im Coffeeshop
+    if current_room == 'coffeeshop' and not christopher_getroffen:
+        christopher_getroffen = True
+        add_to_history("")
+        add_to_history("─" * 50)
+        add_to_history("Als du die Tür öffnest, hörst du ein scharfes Luftholen.")
+        add_to_history("")
+        add_to_history('Ein großer Mann — Mitte dreißig, zerzauster Bart, schmutzige Arbeitskleidung —')
+        add_to_history('springt hinter einem umgeworfenen Tisch hervor.')
+        add_to_history('In seiner Hand zittert eine abgebrochene Flasche.')
+        add_to_history("")
+        add_to_history('"Nicht bewegen! Ich— ich bin nicht infiziert, ich schwöre es!"')
+        add_to_history("")
+        add_to_history('Seine Augen huschen nervös zur Tür, dann zurück zu dir.')
+        add_to_history('Sekunden vergehen. Dann lässt er langsam die Flasche sinken.')
+        add_to_history("")
+        add_to_history('"Gott sei Dank... du bist echt. Du bist... nicht wie die anderen."')
+        add_to_history('Er lehnt sich gegen die Wand und schließt kurz die Augen.')
+        add_to_history('"Ich bin Christopher. Christopher Thomson. Ich bin seit zwei Jahren hier draußen."')
+        add_to_history("")
+        add_to_history('Er sieht erschöpft aus — aber lebendig.')
+        add_to_history("─" * 50)
+        add_to_history("")
+        add_to_history('[Tipp: Tippe "hallo christopher" oder "rede mit christopher" um mit ihm zu reden.]')
+        add_to_history("")
+
+    # Emilia & Helene Albrecht — Erstbegegnung im Waldhaus
+    if current_room == 'waldhaus' and not emilia_getroffen:
+        emilia_getroffen = True
+        add_to_history("")
+        add_to_history("─" * 50)
+        add_to_history("Die alte Holztür schwingt auf. Ein Duft von Kräutern und Bienenwachs.")
+        add_to_history("")
+        add_to_history("Aus dem Schatten — eine Bewegung. Schnell, kontrolliert.")
+        add_to_history("")
+        add_to_history("Eine junge Frau tritt ins Licht. Etwa Mitte zwanzig, dunkles Haar,")
+        add_to_history("ruhige Augen. In ihrer Hand ein kleiner Holzknüppel — sie hält ihn")
+        add_to_history("locker, aber bereit.")
+        add_to_history("")
+        add_to_history("Sie mustert euch — dich, dann Christopher, falls er dabei ist.")
+        add_to_history("Sekunden vergehen.")
+        add_to_history("")
+        add_to_history("Dann atmet sie langsam aus und senkt den Knüppel.")
+        add_to_history("")
+        add_to_history('"Ihr seid nicht infiziert."')
+        add_to_history('Es klingt wie eine Feststellung, nicht wie eine Frage.')
+        add_to_history("")
+        add_to_history('"Emilia. Emilia Albrecht."')
+        add_to_history('Ein kurzes, knappes Nicken.')
+        add_to_history("")
+        if player_stats.get('companion') == 'christopher':
+            add_to_history('Hinter dir hörst du Christopher leise einhalten.')
+            add_to_history('Als Emilia ihn ansieht, räuspert er sich — einen Tick zu laut.')
+            add_to_history('"Christopher Thomson", sagt er. Eine Spur zu förmlich.')
+            add_to_history("")
+        add_to_history('Etwas in dir wird seltsam ruhig.')
+        add_to_history("")
+        add_to_history('Aus einem Nebenraum dringt eine ältere, warme Stimme:')
+        add_to_history('"Emilia? Wer ist da?"')
+        add_to_history("")
+        add_to_history('"Überlebende, Oma. Keine Gefahr."')
+        add_to_history('Sie sagt es leise, aber bestimmt.')
+        add_to_history("")
+        add_to_history("─" * 50)
+        add_to_history("")
+        add_to_history('[Tipp: "rede mit emilia" oder "rede mit helene" um mit ihnen zu reden.]')
+        add_to_history('[Tipp: "untersuche emilia" oder "untersuche helene" für eine Beschreibung.]')
+        add_to_history("")
+
+    # Friedhof Aftermath-Beschreibung überschreiben
+    if current_room == 'friedhof' and friedhof_event_abgeschlossen:
+        visited_rooms_desc.discard('friedhof')
+
+    # Friedhof Boss — Der Verschlinger taucht zum ersten Mal auf
+    if current_room == 'friedhof' and not friedhof_boss_intro_gezeigt and not friedhof_event_abgeschlossen:
+        friedhof_boss_intro_gezeigt = True
+        add_to_history("")
+        add_to_history("═" * 50)
+        add_to_history("")
+        add_to_history("Die Erde bricht auf.")
+        add_to_history("")
+        add_to_history("Nicht langsam. Nicht mit Vorwarnung.")
+        add_to_history("Ein Ruck — und der Boden unter dem alten Eichenbaum")
+        add_to_history("explodiert nach oben, schwarze Erde und zersplitterte")
+        add_to_history("Grabsteine schleudern in alle Richtungen.")
+        add_to_history("")
+        add_to_history("Was aufsteigt ist drei Meter groß. Dann vier.")
+        add_to_history("")
+        add_to_history("Es ist schwarz. Nicht dunkel — schwarz wie Teer,")
+        add_to_history("wie Öl das im Mondlicht schimmert. Seine Oberfläche")
+        add_to_history("bewegt sich — pulsiert — als wäre das, was es ist,")
+        add_to_history("noch nicht ganz fertig damit, Form zu werden.")
+        add_to_history("Tendrilen schlingen sich aus seiner Masse heraus,")
+        add_to_history("kosten die Luft, ziehen sich wieder zurück.")
+        add_to_history("")
+        add_to_history("Keine Augen. Nur ein aufgerissenes Maul, randvoll")
+        add_to_history("mit Zähnen die keine Zähne sein sollten — zu viele,")
+        add_to_history("zu groß, in Winkeln die keine Anatomie erlaubt.")
+        add_to_history("")
+        add_to_history("Und dann — die Stimmen.")
+        add_to_history("")
+        add_to_history("Aus seiner Brust. Gedämpft, verzerrt, gebrochen:")
+        add_to_history("Menschliche Stimmen. Dutzende davon. Alle gleichzeitig.")
+        add_to_history("Alle schreien.")
+        add_to_history("")
+        add_to_history("Der Verschlinger.")
+        add_to_history("")
+        add_to_history("═" * 50)
+        add_to_history("")
+        add_to_history('[Greife an: "greife an" / "töte verschlinger" / "schlag verschlinger"]')
+        add_to_history('[WARNUNG: Alleine ist dieser Kampf nicht zu gewinnen.]')
+        add_to_history("")
+        start_combat_music()
+        player_stats['in_combat'] = True
+        return
+
+    # Gegner im Raum?
+    if room.get('enemy'):
+        enemy_key = room['enemy']
+        enemy = enemies.get(enemy_key)
+        if enemy and enemy['health'] > 0:
+            if enemy_key in ('zombie', 'infizierter'):
+                play_random_zombie_sound()
+            add_to_history("")
+            add_to_history(f">>> {enemy['name']} ist hier! <<<")
+            add_to_history(f"Zustand: {get_enemy_health_description(enemy['health'], enemy['max_health'])}")
+            player_stats['in_combat'] = True
+            start_combat_music()
+    
+    add_to_history("")
+
+
+# === CLASSIC MECHANICS: Helper-Funktionen ===
+
+def add_score(action_key, amount=None, context=None):
+    """Zork-style Punkte vergeben. context = item_key oder room_key für Dedup."""
+    global game_score
+    # Dedup: jedes Item gibt nur einmal Punkte
+    if action_key == 'item_pickup' and context:
+        if context in scored_items:
+            return
+        scored_items.add(context)
+    # Dedup: erster Zombie-Kill pro Raum gibt Punkte, Respawns nicht
+    if action_key == 'zombie_kill' and context:
+        if context in scored_kills:
+            return
+        scored_kills.add(context)
+    pts = amount if amount is not None else SCORE_VALUES.get(action_key, 0)
+    if pts > 0:
+        game_score += pts
+
+def format_elapsed_time():
+    """Formatiert verstrichene Pygame-Ticks als HH:MM:SS."""
+    if game_start_ticks == 0:
+        return "00:00:00"
+    elapsed_ms = get_ticks() - game_start_ticks
+    total_secs = elapsed_ms // 1000
+    h = total_secs // 3600
+    m = (total_secs % 3600) // 60
+    s = total_secs % 60
+    return f"{h:02d}:{m:02d}:{s:02d}"
+
+def _world_delta():
+    """Abweichungen der Welt vom Ausgangszustand (_PRISTINE_WORLD & Co.)."""
+    pristine_rooms = _PRISTINE_WORLD[0]
+    room_items = {}
+    room_exits = {}
+    for rk, rd in rooms.items():
+        base = pristine_rooms.get(rk, {})
+        items = rd.get('items', [])
+        if items != base.get('items', []):
+            room_items[rk] = items[:]
+        exits = rd.get('exits', {})
+        if exits != base.get('exits', {}):
+            room_exits[rk] = dict(exits)
+    containers = {}
+    charges = {}
+    for ik, idef in ITEM_DEFS.items():
+        if idef.is_container and (idef.contents or idef.is_open):
+            containers[ik] = {'contents': idef.contents[:], 'is_open': idef.is_open}
+        if idef.max_charge >= 0 and idef.charge != idef.max_charge:
+            charges[ik] = idef.charge
+    flags = {}
+    for name in _SAVED_FLAGS:
+        value = globals()[name]
+        if value != _PRISTINE_FLAGS[name]:
+            flags[name] = value
+    return {
+        'room_items': room_items,
+        'room_exits': room_exits,
+        'containers': containers,
+        'item_charges': charges,
+        'flags': flags,
+    }
+
+def _apply_world_delta(delta):
+    """Setzt Raum-Items, Ausgänge, Behälter, Ladungen und Flags auf
+    Ausgangszustand + delta (siehe _world_delta).
+
+    → Keys aus delta, die es in dieser Spielversion nicht mehr gibt; sie
+      werden verworfen statt still ignoriert
+    """
+    pristine_rooms = _PRISTINE_WORLD[0]
+    room_items = delta.get('room_items', {})
+    room_exits = delta.get('room_exits', {})
+    containers = delta.get('containers', {})
+    charges = delta.get('item_charges', {})
+    flags = delta.get('flags', {})
+    conflicts = sorted(
+        {rk for rk in (*room_items, *room_exits) if rk not in pristine_rooms}
+        | {ik for ik in containers if ik not in ITEM_DEFS or not ITEM_DEFS[ik].is_container}
+        | {ik for ik in charges if ik not in ITEM_DEFS or ITEM_DEFS[ik].max_charge < 0}
+        | {name for name in flags if name not in _SAVED_FLAGS})
+    changed_exits = []
+    for rk, rd in rooms.items():
+        base = pristine_rooms.get(rk)
+        if base is None:
+            continue
+        rd['items'] = list(room_items.get(rk, base.get('items', [])))
+        exits = room_exits.get(rk, base.get('exits', {}))
+        if rd.get('exits', {}) != exits:
+            rd['exits'] = dict(exits)
+            changed_exits.append(rk)
+    refresh_exits(*changed_exits)
+    for ik, idef in ITEM_DEFS.items():
+        if idef.is_container:
+            cstate = containers.get(ik, {})
+            idef.contents = list(cstate.get('contents', []))
+            idef.is_open = cstate.get('is_open', False)
+        if idef.max_charge >= 0:
+            idef.charge = charges.get(ik, idef.max_charge)
+    globals().update({name: flags.get(name, _PRISTINE_FLAGS[name]) for name in _SAVED_FLAGS})
+    return conflicts
+
+def _apply_legacy_world(data):
+    """Spielstand-Version 1: vollständige Item-Listen und Flags auf oberster Ebene."""
+    for rk, items_list in data.get('room_items', {}).items():
+        if rk in rooms:
+            rooms[rk]['items'] = items_list
+    for ik, cstate in data.get('container_states', {}).items():
+        if ik in ITEM_DEFS and ITEM_DEFS[ik].is_container:
+            ITEM_DEFS[ik].contents = cstate.get('contents', [])
+            ITEM_DEFS[ik].is_open = cstate.get('is_open', False)
+    for ik, charge_val in data.get('item_charges', {}).items():
+        if ik in ITEM_DEFS:
+            ITEM_DEFS[ik].charge = charge_val
+    globals().update({name: data.get(name, _PRISTINE_FLAGS[name]) for name in _SAVED_FLAGS})
+
+def _apply_save_data(data):
+    """Gemeinsame Lade-Logik von restore_game und load_game_from_menu.
+
+    → Hinweise für den Spieler (Spielstand aus einer anderen Spielversion)
+    """
+    global current_room, game_score, game_moves, view_mode, game_start_ticks
+    global scored_items, scored_kills
+    current_room = data['current_room']
+    player_inventory.clear()
+    player_inventory.extend(data['player_inventory'])
+    player_stats.update(data['player_stats'])
+    game_score = data.get('game_score', 0)
+    game_moves = data.get('game_moves', 0)
+    view_mode = data.get('view_mode', 'verbose')
+    visited_rooms.clear()
+    visited_rooms.update(data.get('visited_rooms', []))
+    visited_rooms_desc.clear()
+    visited_rooms_desc.update(data.get('visited_rooms_desc', []))
+    notes = []
+    if 'delta' in data:
+        # Version 2 — Deltas greifen per Key; was es nicht mehr gibt, wird gemeldet
+        if data.get('baseline') != _BASELINE_FINGERPRINT:
+            notes.append("Hinweis: Der Spielstand stammt aus einer anderen Spielversion.")
+        conflicts = _apply_world_delta(data['delta'])
+        if conflicts:
+            notes.append("Verworfen, weil es sie nicht mehr gibt: " + ', '.join(conflicts))
+    else:
+        _apply_legacy_world(data)
+    # Puzzle-Übergänge anhand der geladenen Flags rekonstruieren.
+    apply_bibliothek_bookshelf_state()
+    apply_krankenhaus_geheimlabor_state()
+    apply_coffeeshop_tür_state()
+    elapsed = data.get('elapsed_ms', 0)
+    game_start_ticks = get_ticks() - elapsed
+    scored_items = set(data.get('scored_items', []))
+    scored_kills = set(data.get('scored_kills', []))
+    _reseed(data.get('rng_seed'))  # Alter Spielstand ohne Seed → nächster der Kette
+    return notes
+
+def save_game(slot=DEFAULT_SLOT, autosave=False):
+    """Speichert den Spielstand als JSON: Spielerzustand + Abweichungen der
+    Welt vom Ausgangszustand (Größe wächst mit dem Spielfortschritt, nicht
+    mit der Karte). Geschrieben wird atomar, mit SaveWriter im Hintergrund.
+
+    autosave=True lässt die Seed-Kette unberührt — ein Autosave verändert
+    den Spielverlauf nicht (Laden setzt auf den aktuellen Seed)."""
+    slots = save_slots()
+    save_data = {
+        'save_version': SAVE_VERSION,
+        'baseline': _BASELINE_FINGERPRINT,
+        'current_room': current_room,
+        'player_inventory': player_inventory[:],
+        'player_stats': dict(player_stats),
+        'game_score': game_score,
+        'game_moves': game_moves,
+        'view_mode': view_mode,
+        'visited_rooms': list(visited_rooms),
+        'visited_rooms_desc': list(visited_rooms_desc),
+        'elapsed_ms': get_ticks() - game_start_ticks,
+        'delta': _world_delta(),
+        'scored_items': list(scored_items),
+        'scored_kills': list(scored_kills),
+        'terminal_color': _frontend.get_terminal_color(),
+        'rng_seed': rng.seed if autosave else _reseed(),  # Weiterspielen = Laden + Weiterspielen
+    }
+    meta = {
+        'room': current_room,
+        'room_name': rooms[current_room].get('name', current_room),
+        'score': game_score,
+        'moves': game_moves,
+        'elapsed_ms': save_data['elapsed_ms'],
+        'timestamp': wall_time().isoformat(timespec='milliseconds'),
+    }
+    path = slots.path(slot)
+    index = (slots.index_path, slots.record(slot, meta))  # Cache sofort aktuell
+    if _save_writer is not None:
+        # Serialisieren + Schreiben im Worker, die Meldung kommt über report_save_result
+        _save_writer.submit(path, save_data, index)
+        return
+    try:
+        write_atomic(path, save_data)
+        write_atomic(*index)
+        error = None
+    except Exception as e:
+        error = e
+    report_save_result(error, path)
+
+def autosave():
+    """Speichert still in den freien bzw. ältesten Autosave-Slot (keiner → nichts)."""
+    slot = save_slots().next_autosave()
+    if slot is not None:
+        save_game(slot, autosave=True)
+
+def report_save_result(error, path):
+    """Meldung zu einem fertig geschriebenen Spielstand (error=None → Erfolg)."""
+    slots = save_slots()
+    slot = slots.slot_for(path)
+    if error is not None:
+        slots.refresh()  # Cache wieder an die Dateien angleichen
+        add_to_history(f"Fehler beim Speichern: {error}")
+    elif slot in slots.autosaves:
+        return  # Autosaves laufen still
+    else:
+        add_to_history(f"Spiel gespeichert (Slot {slot}).")
+    add_to_history("")
+
+def restore_game(slot=DEFAULT_SLOT):
+    """Lädt einen gespeicherten Spielstand."""
+    _flush_saves()
+    try:
+        with open(save_slots().path(slot), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        _record('l', data, slot)  # Replay braucht den geladenen Stand, nicht die Datei
+    except FileNotFoundError:
+        add_to_history("Kein Spielstand gefunden.")
+        add_to_history("")
+        return
+    except Exception as e:
+        add_to_history(f"Fehler beim Laden: {e}")
+        add_to_history("")
+        return
+    notes = _apply_save_data(data)
+    _frontend.apply_terminal_theme(data.get('terminal_color', _frontend.get_terminal_color()))
+    game_history.clear()
+    add_to_history("Spielstand geladen.")
+    for note in notes:
+        add_to_history(note)
+    add_to_history("")
+    describe_room()
+
+def handle_container_open(container_key):
+    """Öffne einen Container."""
+    idef = ITEM_DEFS.get(container_key)
+    if not idef or not idef.is_container:
+        add_to_history(f"'{get_item_name(container_key)}' ist kein Behälter.")
+        add_to_history("")
+        return
+    if container_key not in player_inventory and container_key not in rooms[current_room].get('items', []):
+        add_to_history(f"Du siehst hier keinen '{get_item_name(container_key)}'.")
+        add_to_history("")
+        return
+    if idef.is_open:
+        add_to_history(f"{get_item_name(container_key)} ist bereits offen.")
+    else:
+        idef.is_open = True
+        add_to_history(f"Du öffnest {get_item_name(container_key)}.")
+        if idef.contents:
+            names = [get_item_name(k) for k in idef.contents]
+            add_to_history(f"Darin: {', '.join(names)}")
+        else:
+            add_to_history("Es ist leer.")
+    add_to_history("")
+
+def handle_container_close(container_key):
+    """Schließe einen Container."""
+    idef = ITEM_DEFS.get(container_key)
+    if not idef or not idef.is_container:
+        add_to_history(f"'{get_item_name(container_key)}' ist kein Behälter.")
+        add_to_history("")
+        return
+    if not idef.is_open:
+        add_to_history(f"{get_item_name(container_key)} ist bereits geschlossen.")
+    else:
+        idef.is_open = False
+        add_to_history(f"Du schließt {get_item_name(container_key)}.")
+    add_to_history("")
+
+def handle_put_in(item_key, container_key):
+    """Lege Item in Container (mit Implicit Take)."""
+    global game_score
+    idef_c = ITEM_DEFS.get(container_key)
+    if not idef_c or not idef_c.is_container:
+        add_to_history(f"'{get_item_name(container_key)}' ist kein Behälter.")
+        add_to_history("")
+        return
+    if not idef_c.is_open:
+        add_to_history(f"{get_item_name(container_key)} ist geschlossen. Öffne ihn zuerst.")
+        add_to_history("")
+        return
+    # Check nesting: item itself cannot be a container with contents inside another container
+    idef_item = ITEM_DEFS.get(item_key)
+    if idef_item and idef_item.is_container and idef_item.contents:
+        add_to_history("Du kannst keinen gefüllten Behälter in einen anderen legen.")
+        add_to_history("")
+        return
+    # Check if container is nested inside another container
+    for other_key, other_def in ITEM_DEFS.items():
+        if other_def.is_container and container_key in other_def.contents:
+            add_to_history("Du kannst nicht hineingreifen – der Behälter ist zu tief verschachtelt.")
+            add_to_history("")
+            return
+    # Implicit Take: if item is in room but not in inventory, take it first
+    room = rooms[current_room]
+    if item_key not in player_inventory:
+        if item_key in room.get('items', []):
+            room['items'].remove(item_key)
+            player_inventory.append(item_key)
+            add_to_history(f"(Zuerst genommen: {get_item_name(item_key)})")
+            add_score('item_pickup', context=item_key)
+        else:
+            add_to_history(f"Du hast kein '{get_item_name(item_key)}'.")
+            add_to_history("")
+            return
+    if len(idef_c.contents) >= idef_c.capacity:
+        add_to_history(f"{get_item_name(container_key)} ist voll.")
+        add_to_history("")
+        return
+    player_inventory.remove(item_key)
+    idef_c.contents.append(item_key)
+    add_to_history(f"Du legst {get_item_name(item_key)} in {get_item_name(container_key)}.")
+    add_to_history("")
+
+def handle_take_from(item_key, container_key):
+    """Nimm Item aus Container."""
+    idef_c = ITEM_DEFS.get(container_key)
+    if not idef_c or not idef_c.is_container:
+        add_to_history(f"'{get_item_name(container_key)}' ist kein Behälter.")
+        add_to_history("")
+        return
+    if not idef_c.is_open:
+        add_to_history(f"{get_item_name(container_key)} ist geschlossen.")
+        add_to_history("")
+        return
+    # Check nesting depth
+    for other_key, other_def in ITEM_DEFS.items():
+        if other_def.is_container and container_key in other_def.contents:
+            add_to_history("Du kannst nicht hineingreifen – zu tief verschachtelt.")
+            add_to_history("")
+            return
+    if item_key not in idef_c.contents:
+        add_to_history(f"'{get_item_name(item_key)}' ist nicht in {get_item_name(container_key)}.")
+        add_to_history("")
+        return
+    idef_c.contents.remove(item_key)
+    player_inventory.append(item_key)
+    add_to_history(f"Du nimmst {get_item_name(item_key)} aus {get_item_name(container_key)}.")
+    add_score('item_pickup', context=item_key)
+    add_to_history("")
+
+def handle_look_in(container_key):
+    """Schaue in einen Container."""
+    idef = ITEM_DEFS.get(container_key)
+    if not idef or not idef.is_container:
+        add_to_history(f"'{get_item_name(container_key)}' ist kein Behälter.")
+        add_to_history("")
+        return
+    if not idef.is_open and not idef.is_transparent:
+        add_to_history(f"{get_item_name(container_key)} ist geschlossen.")
+        add_to_history("")
+        return
+    if idef.contents:
+        names = [get_item_name(k) for k in idef.contents]
+        add_to_history(f"In {get_item_name(container_key)}: {', '.join(names)}")
+    else:
+        add_to_history(f"{get_item_name(container_key)} ist leer.")
+    add_to_history("")
+
+# ========================
+# WORT-AUFLÖSUNG (Präfix-Index)
+# ========================
+# Statisches Vokabular (Item- und Waffen-IDs) wird einmal indiziert.
+# Raum-Items und Inventar außerhalb davon liegen in einem Overlay, das
+# bei jedem Befehl nur um die Differenz zum letzten Stand ergänzt wird.
+_static_words = PrefixIndex(set(ITEM_DEFS) | set(weapons))
+_overlay_words = PrefixIndex()
+_overlay_keys = set()
+_overlay_snapshot = None    # (room_key, room_items, inventory) der letzten Synchronisierung
+
+
+def _sync_word_overlay(room_items):
+    """Gleicht das Overlay mit aktuellem Raum + Inventar ab (nur Änderungen)."""
+    global _overlay_keys, _overlay_snapshot
+    snapshot = (current_room, tuple(room_items), tuple(player_inventory))
+    if snapshot == _overlay_snapshot:
+        return
+    _overlay_snapshot = snapshot
+    wanted = {k for k in snapshot[1] + snapshot[2] if k not in _static_words}
+    for key in _overlay_keys - wanted:
+        _overlay_words.discard(key)
+    for key in wanted - _overlay_keys:
+        _overlay_words.add(key)
+    _overlay_keys = wanted
+
+
+def word_candidates(prefix, room_items=()):
+    """Alle bekannten IDs mit diesem Präfix, nach Relevanz sortiert
+    (Raum vor Inventar vor Rest, kürzeste Ergänzung zuerst)."""
+    matches = _static_words.with_prefix(prefix) + _overlay_words.with_prefix(prefix)
+    return rank_candidates(matches, room_items, player_inventory)
+
+
+def resolve_word(w, room_items):
+    """Löst ein Eingabewort auf eine ID auf (volle ID, Verb oder eindeutiger Präfix)."""
+    # Vollständige interne ID hat immer Vorrang (egal wie lang).
+    if w in _static_words or w in _overlay_words:
+        return w
+    # Bekannte Verben und Richtungsabkürzungen NIEMALS durch Präfix-Matching
+    # ersetzen — sonst wird z.B. 'w' zu 'wasser' und 'n' zu 'notizen'.
+    if w in KNOWN_VERBS:
+        return w
+    matches = word_candidates(w, room_items)
+    if len(matches) == 1:
+        return matches[0]
+    in_room = [k for k in matches if k in room_items]
+    if len(in_room) == 1:
+        return in_room[0]
+    in_inv = [k for k in matches if k in player_inventory]
+    if len(in_inv) == 1:
+        return in_inv[0]
+    return w
+
+@_input_entry('c')
+def process_command(command):
+    """Verarbeitet Spielerbefehle — dispatcht an command_handlers.py"""
+    global current_room, prolog_shown, prolog_line_index, command_history, history_index
+    global pending_ambiguity, game_moves, view_mode, game_score
+    
+    # Füge Command zur History hinzu (außer im Prolog)
+    if prolog_shown and command.strip():
+        command_history.append(command)
+        if len(command_history) > 50:
+            command_history.pop(0)
+    
+    history_index = -1
+    
+    # Prolog-Modus
+    if not prolog_shown:
+        if prolog_line_index < len(prolog_lines):
+            end_index = min(prolog_line_index + 3, len(prolog_lines))
+            for i in range(prolog_line_index, end_index):
+                add_to_history(prolog_lines[i])
+            prolog_line_index = end_index
+            if prolog_line_index >= len(prolog_lines):
+                prolog_shown = True
+                add_to_history("")
+                add_to_history("=== TERMINAL AKTIVIERT ===")
+                add_to_history("")
+                describe_room()
+        return
+    
+    cmd = command.lower().strip()
+    raw_cmd = cmd  # Rohbefehl vor der Wort-Auflösung — für Godmode-Teleport und ähnliches
+
+    # === Wort-Auflösung (KEIN Längen-Limit) ===
+    # Verben, Kommandos und IDs werden in voller Länge ausgewertet — es wird
+    # NICHTS mehr nach dem 9. Zeichen abgeschnitten. Zusammengesetzte deutsche
+    # Verben und lange IDs bleiben dadurch vollständig erhalten.
+    # Tippt der Spieler einen eindeutigen Präfix einer langen ID, wird er aufgelöst.
+    raw_words = cmd.split()
+    room = rooms.get(current_room, {})
+    room_items = room.get('items', [])
+    _sync_word_overlay(room_items)
+    # Präfix-Auflösung über das KOMPLETTE eingegebene Wort (nicht nur 9 Zeichen).
+    words = [resolve_word(w, room_items) for w in raw_words]
+    cmd = ' '.join(words)
+
+    # === Ambiguity Resolution ===
+    if pending_ambiguity is not None:
+        choice = cmd.strip()
+        candidates = pending_ambiguity['candidates']
+        matched = [c for c in candidates if c.startswith(choice) or choice in c]
+        if len(matched) == 1:
+            resolved_cmd = f"{pending_ambiguity['action']} {matched[0]}"
+            pending_ambiguity = None
+            process_command(resolved_cmd)
+            return
+        elif choice.isdigit() and 1 <= int(choice) <= len(candidates):
+            resolved_cmd = f"{pending_ambiguity['action']} {candidates[int(choice)-1]}"
+            pending_ambiguity = None
+            process_command(resolved_cmd)
+            return
+        else:
+            add_to_history("Abgebrochen.")
+            add_to_history("")
+            pending_ambiguity = None
+            return
+
+    # Zähle Züge
+    counted = bool(cmd and prolog_shown)
+    if counted:
+        game_moves += 1
+        tick_msgs = tick_hidden_systems()
+        for _tmsg in tick_msgs:
+            add_to_history(_tmsg)
+
+    # === DISPATCHER — Verb-Tabelle in command_handlers.py ===
+    command_handlers.dispatch(cmd, raw_cmd, words)
+
+    if (counted and _autosave_interval and game_moves % _autosave_interval == 0
+            and not player_stats.get('in_combat') and player_stats['health'] > 0):
+        autosave()
+
+def equip_weapon(weapon_key):
+    """Rüste eine Waffe aus"""
+    if weapon_key not in weapons:
+        add_to_history(f"'{weapon_key}' ist keine gültige Waffe.")
+        add_to_history("")
+        return
+    
+    if weapon_key not in player_inventory:
+        add_to_history(f"Du hast '{weapon_key}' nicht im Inventar.")
+        add_to_history("")
+        return
+    
+    weapon = weapons[weapon_key]
+    player_stats['equipped_weapon'] = weapon_key
+    player_stats['weapon_type'] = weapon['type']
+    
+    add_to_history(f"Du rüstest {weapon['name']} aus.")
+    
+    if weapon['type'] == 'ranged':
+        add_to_history(f"Munition: {weapon.get('ammo', 0)}")
+        add_to_history("Bereit zum Feuern. Nutze: schieße auf [ziel]")
+    else:
+        add_to_history("Bereit für Nahkampf. Nutze: stich auf [ziel]")
+    
+    add_to_history("")
+
+def enemy_target_matches(t, enemy_key, enemy):
+    """Tolerante Ziel-Erkennung für Kampfbefehle.
+
+    Akzeptiert:
+    - exakten Schlüssel (z.B. 'geheimlabor_boss')
+    - Vollnamen (z.B. 'mutierter labor leiter')
+    - einzelne Namens-Wörter (z.B. 'leiter', 'labor', 'mutierter')
+    - durch Bindestrich verbundene Teilnamen (z.B. 'labor-leiter')
+    - beliebige Präfixe der Namens-Tokens (z.B. 'labor-lei')
+    """
+    t = t.lower().strip()
+    if not t:
+        return False
+    full = enemy['name'].lower().replace('-', ' ')
+    name_words = full.split()
+    all_tokens = [enemy_key] + name_words
+
+    if t == enemy_key or t == full or t in name_words:
+        return True
+
+    # Zerlege Ziel in Tokens (Leerzeichen und Bindestriche als Trenner)
+    target_tokens = [tok for tok in t.replace('-', ' ').split() if tok]
+    if not target_tokens:
+        return False
+
+    def _token_ok(tok):
+        if tok in all_tokens:
+            return True
+        # Präfix-Match: mindestens 3 Zeichen (tolerante Teil-Eingaben)
+        if len(tok) >= 3 and any(w.startswith(tok) for w in all_tokens):
+            return True
+        return False
+
+    return all(_token_ok(tok) for tok in target_tokens)
+
+
+def ranged_attack(target):
+    """Fernkampf mit Schusswaffen"""
+    if not player_stats['equipped_weapon']:
+        add_to_history("Du hast keine Waffe ausgerüstet!")
+        add_to_history("")
+        return
+    
+    weapon_key = player_stats['equipped_weapon']
+    weapon = weapons[weapon_key]
+    
+    if weapon['type'] != 'ranged':
+        add_to_history(f"{weapon['name']} ist keine Fernkampfwaffe!")
+        add_to_history("")
+        return
+    
+    if weapon.get('ammo', 0) <= 0:
+        add_to_history("Keine Munition mehr!")
+        add_to_history("")
+        return
+    
+    # Finde Gegner im Raum
+    room = rooms[current_room]
+    enemy_in_room = room.get('enemy', None)
+    
+    if not enemy_in_room:
+        add_to_history("Hier gibt es kein Ziel zum Angreifen!")
+        add_to_history("")
+        return
+    
+    enemy = enemies.get(enemy_in_room, None)
+    if not enemy or enemy['health'] <= 0:
+        add_to_history("Fehler: Gegner nicht gefunden.")
+        add_to_history("")
+        return
+    
+    # Ziel-Validierung: target muss zum Gegner passen
+    if not enemy_target_matches(target, enemy_in_room, enemy):
+        add_to_history(f"Hier ist kein '{target}'. Hier ist: {enemy['name']}")
+        add_to_history("")
+        return
+
+    # Schuss trifft immer (kein Zufall, keine Trefferchance)
+    add_to_history(f"Du legst die {weapon['name']} an...")
+
+    weapon['ammo'] -= 1
+    play_random_gun_sound()
+    add_to_history("Der Schuss kracht!")
+
+    resolve_attack(weapon, enemy, enemy_in_room)
+
+    add_to_history("")
+
+
+def resolve_attack(weapon, enemy, target):
+    """Wendet sofort deterministischen Waffenschaden an (kein Minigame, kein Wuerfel).
+
+    Schaden = oberer Wert der Waffen-Range. Bei besiegtem Gegner uebernimmt
+    _resolve_enemy_defeat, ansonsten schlaegt der Gegner direkt zurueck."""
+    room = rooms[current_room]
+
+    if player_stats.get('godmode'):
+        damage = enemy['health'] + 1
+        add_to_history("[GODMODE] Ein einziger vernichtender Treffer!")
+    else:
+        damage = weapon['damage'][1]
+
+    # Zombie-Hure ist gegen alle Waffen nahezu immun
+    if enemy.get('immune_to_weapons') and not player_stats.get('godmode'):
+        damage = 1
+        add_to_history("Dein Angriff prallt wirkungslos ab!")
+        add_to_history("Ihr Fleisch ist wie Beton. Normale Waffen richten hier nichts aus.")
+        add_to_history("Vielleicht gibt es eine andere Schwachstelle...")
+
+    # Emilia's Liebeskraft — Schadens-Bonus wenn sie folgt
+    elif player_stats.get('emilia_following') and not player_stats.get('godmode'):
+        love_bonus = 10
+        damage += love_bonus
+        add_to_history(f"Emilias Nähe treibt dich an. +{love_bonus} Schaden!")
+
+    enemy['health'] -= damage
+    if not enemy.get('immune_to_weapons') or player_stats.get('godmode'):
+        add_to_history(get_enemy_damage_reaction(damage, enemy['health'], enemy['max_health']))
+    add_to_history(f"Zustand: {get_enemy_health_description(enemy['health'], enemy['max_health'])}")
+
+    if enemy['health'] <= 0:
+        if target == 'zombie_hure':
+            # Zombie-Hure stirbt nur durch Tangazieher — godmode-Ausnahme
+            _resolve_enemy_defeat(enemy, target, room)
+        else:
+            _resolve_enemy_defeat(enemy, target, room)
+    else:
+        enemy_counterattack(enemy, target)
+
+
+def enemy_counterattack(enemy, enemy_key=None):
+    """Gegner greift deterministisch zurück (kein Ausweich-Minigame).
+
+    Schaden = unterer Wert der Gegner-Range, direkt angewandt."""
+    if player_stats.get('godmode'):
+        add_to_history("[GODMODE] Der Angriff prallt wirkungslos ab.")
+        add_to_history("")
+        return
+
+    base_damage = enemy['damage'][0]
+
+    base_damage = _companion_intercept(base_damage)
+
+    if enemy_key is None:
+        enemy_key = rooms[current_room].get('enemy', 'zombie')
+
+    if player_stats.get('weapon_type') == 'ranged':
+        play_random_zombie_sound()
+    else:
+        play_random_punch_sound()
+
+    add_to_history(f"{enemy['name']} greift an!")
+    add_to_history(get_damage_reaction(base_damage, player_stats['health'] - base_damage))
+    player_stats['health'] -= base_damage
+
+    # Helene's Kräuterheilung — mildert Schaden im Kampf wenn sie folgt
+    if player_stats.get('helene_following') and not player_stats.get('godmode') and player_stats['health'] > 0:
+        helene_heal = 8
+        player_stats['health'] = min(100, player_stats['health'] + helene_heal)
+        add_to_history(f"Helene versorgt dich sofort. +{helene_heal} HP")
+
+    add_to_history("")
+    if player_stats['health'] <= 0:
+        _handle_player_death()
+
+def melee_attack(target):
+    """Nahkampf mit Stichwaffen"""
+    if not player_stats['equipped_weapon']:
+        add_to_history("Du hast keine Waffe ausgerüstet!")
+        add_to_history("")
+        return
+    
+    weapon_key = player_stats['equipped_weapon']
+    weapon = weapons[weapon_key]
+    
+    if weapon['type'] != 'melee':
+        add_to_history(f"{weapon['name']} ist keine Nahkampfwaffe!")
+        add_to_history("")
+        return
+    
+    # Finde Gegner im Raum
+    room = rooms[current_room]
+    enemy_in_room = room.get('enemy', None)
+    
+    if not enemy_in_room:
+        add_to_history("Hier gibt es kein Ziel zum Angreifen!")
+        add_to_history("")
+        return
+    
+    enemy = enemies.get(enemy_in_room, None)
+    if not enemy or enemy['health'] <= 0:
+        add_to_history("Der Gegner wurde bereits besiegt.")
+        add_to_history("")
+        return
+    
+    add_to_history(f"Du ziehst das {weapon['name']}...")
+    add_to_history("")
+    play_random_punch_sound()
+    resolve_attack(weapon, enemy, enemy_in_room)
+    add_to_history("")
+
+def read_item(item):
+    """Lese ein Item (Zeitung, Notizen, etc.)"""
+    if item not in player_inventory: 
+        add_to_history(f"Du hast '{item}' nicht im Inventar.")
+        add_to_history("")
+        return
+    
+    readable_items = {
+        'zeitung': """DEAD WORLD ZEITUNG
+Letzte Ausgabe - Tag 0
+QUARANTÄNE VERHÄNGT - INFEKTIONSWELLE BREITET SICH AUS
+Gestern Nacht bestätigten Behörden den Ausbruch eines unbekannten Parasiten. Betroffene zeigen aggressives Verhalten und physische Mutationen.
+Überlebende werden aufgefordert, Bunker aufzusuchen.
+---
+Für neue Überlebende: Du bist neu in dieser Welt? Tippe 'help' oder 'hilfe' um die wichtigsten Befehle zu sehen.
+Überlebe. Kämpfe. Erforsche.
+""",
+        'notizen': "Labornotizen: 'Test-Subjekt 7 zeigt Resistenz... Parasiten-DNA mutiert...'",
+        'notiz': "Eine hastige Notiz: 'Sie kommen durch die Lüftung. Gott hilf uns.'"
+    }
+    
+    if item in readable_items:
+        add_to_history(readable_items[item])
+        add_to_history("")
+    else:
+        add_to_history(f"'{item}' kann nicht gelesen werden.")
+        add_to_history("")
+
+def attack_with_weapon(target, weapon_name):
+    """Greife ein Ziel mit einer bestimmten Waffe an"""
+    room = rooms[current_room]
+    enemy_in_room = room.get('enemy', None)
+    
+    # Normalisiere Waffen-Name
+    weapon_key = weapon_name.lower().strip()
+    
+    # Prüfe ob Gegner im Raum ist
+    if not enemy_in_room:
+        add_to_history("Es gibt hier nichts zum Angreifen!")
+        add_to_history("")
+        return
+    
+    # Finde den Gegner
+    enemy = enemies.get(enemy_in_room)
+    if not enemy or enemy['health'] <= 0:
+        add_to_history("Der Gegner wurde bereits besiegt.")
+        add_to_history("")
+        return
+    
+    # Ziel-Validierung: target muss zum Gegner passen
+    if not enemy_target_matches(target, enemy_in_room, enemy):
+        add_to_history(f"Hier ist kein '{target}'. Hier ist: {enemy['name']}")
+        add_to_history("")
+        return
+
+    # Prüfe ob die Waffe existiert
+    if weapon_key not in weapons:
+        add_to_history(f"'{weapon_name}' ist keine bekannte Waffe.")
+        add_to_history("")
+        return
+    
+    # Prüfe ob Spieler die Waffe hat (Inventar oder im Raum)
+    has_weapon = weapon_key in player_inventory
+    weapon_in_room = weapon_key in room.get('items', [])
+    
+    if not has_weapon and not weapon_in_room:
+        add_to_history(f"Du hast keinen {weapons[weapon_key]['name']} und siehst auch keinen hier.")
+        add_to_history("")
+        return
+    
+    # Wenn Waffe im Raum liegt, nimm sie automatisch auf
+    if weapon_in_room and not has_weapon:
+        room['items'].remove(weapon_key)
+        player_inventory.append(weapon_key)
+        add_to_history(f"Du schnappst dir den {weapons[weapon_key]['name']} vom Boden!")
+        add_to_history("")
+    
+    # Waffe ist jetzt im Inventar - führe Angriff aus
+    weapon = weapons[weapon_key]
+    add_to_history(f"Du schwingst den {weapon['name']}!")
+    add_to_history("")
+    if weapon.get('type') == 'ranged':
+        play_random_gun_sound()
+    else:
+        play_random_punch_sound()
+    resolve_attack(weapon, enemy, enemy_in_room)
+    add_to_history("")
+
+def unarmed_attack(target):
+    """Unbewaffneter Angriff oder mit improvisierten Waffen"""
+    room = rooms[current_room]
+    enemy_in_room = room.get('enemy', None)
+    
+    if not enemy_in_room:
+        add_to_history("Es gibt hier nichts zum Angreifen!")
+        add_to_history("")
+        return
+    
+    # Ziel-Validierung: target muss zum Gegner passen
+    enemy = enemies.get(enemy_in_room)
+    if enemy:
+        if not enemy_target_matches(target, enemy_in_room, enemy):
+            add_to_history(f"Hier ist kein '{target}'. Hier ist: {enemy['name']}")
+            add_to_history("")
+            return
+
+    # Spezialfall: Zombie mit Feuerlöscher (im Inventar oder Raum)
+    if current_room == 'start' and enemy_in_room == 'zombie':
+        if 'feuerlöscher' in player_inventory:
+            add_to_history("Du schwingst den Feuerlöscher!")
+            add_to_history("")
+            play_random_punch_sound()
+            resolve_attack(weapons['feuerlöscher'], enemies['zombie'], 'zombie')
+        elif 'feuerlöscher' in room.get('items', []):
+            # Feuerlöscher ist im Raum - nimm und benutze ihn
+            room['items'].remove('feuerlöscher')
+            player_inventory.append('feuerlöscher')
+            add_to_history("Du reißt den Feuerlöscher von der Wand!")
+            add_to_history("")
+            play_random_punch_sound()
+            resolve_attack(weapons['feuerlöscher'], enemies['zombie'], 'zombie')
+        else:
+            add_to_history("Du schlägst mit bloßen Fäusten!")
+            add_to_history("")
+            play_random_punch_sound()
+            resolve_attack(weapons['fäuste'], enemies['zombie'], 'zombie')
+    else:
+        # Generischer Nahkampf in allen anderen Räumen
+        enemy = enemies.get(enemy_in_room)
+        if not enemy or enemy['health'] <= 0:
+            add_to_history("Der Gegner wurde bereits besiegt.")
+            add_to_history("")
+            return
+        
+        add_to_history("Du schlägst mit bloßen Fäusten!")
+        add_to_history("")
+        play_random_punch_sound()
+        resolve_attack(weapons['fäuste'], enemy, enemy_in_room)
+
+
+def grant_enemy_loot_on_death(enemy_key):
+    """Legt raumspezifische Beute nach einem Kill auf den Boden."""
+    room = rooms[current_room]
+    if enemy_key == 'geheimlabor_boss' and current_room == 'gl_boss_raum':
+        loot = 'keycard_armband_lvl3'
+        bucket = room.setdefault('items', [])
+        if loot not in bucket:
+            bucket.append(loot)
+            add_to_history("")
+            add_to_history(f"Am Boden liegt nun ein {get_item_name(loot)}.")
+    elif enemy_key == 'zombie_hure' and current_room == 'sex_dungeon':
+        loot = 'tanga_schlüssel'
+        bucket = room.setdefault('items', [])
+        if loot not in bucket:
+            bucket.append(loot)
+            add_to_history("")
+            add_to_history("Zwischen den Überresten liegt ein blutiger TANGA-SCHLÜSSEL.")
+
+
+# ============================================================
+# BEGLEITER-SYSTEM
+# ============================================================
+
+def trigger_friedhof_boss_fight():
+    """Scripted Friedhof Boss Sequence.
+    
+    Prüft ob alle Begleiter anwesend sind.
+    Ohne alle drei → dramatischer Solo-Tod.
+    Mit allen drei → vollständige Sequenz inkl. Helenes Tod,
+    Sieg, Entführung Emilias und Christophers Verstümmelung."""
+    global friedhof_event_abgeschlossen, christopher_verletzt
+
+    comp            = player_stats.get('companion')
+    emilia_f        = player_stats.get('emilia_following', False)
+    helene_f        = player_stats.get('helene_following', False)
+    all_present     = (comp == 'christopher' and emilia_f and helene_f)
+
+    h = add_to_history  # shorthand
+
+    # ── SOLO-TOD (fehlende Begleiter) ──────────────────────────────────
+    if not all_present:
+        missing = []
+        if comp != 'christopher':
+            missing.append("Christopher")
+        if not emilia_f:
+            missing.append("Emilia")
+        if not helene_f:
+            missing.append("Helene")
+        h("")
+        h("═" * 50)
+        h("")
+        h("Du greifst an.")
+        h("")
+        h("Der Verschlinger wendet sich dir zu.")
+        h("Ohne Eile. Ohne Interesse.")
+        h("Du bist kein Gegner — du bist eine Lästigkeit.")
+        h("")
+        h("Seine Tendril kommt schneller als dein Auge folgen kann.")
+        h("")
+        if len(missing) == 1:
+            h(f"Ohne {missing[0]} hast du keine Chance.")
+        else:
+            h(f"Ohne {', '.join(missing[:-1])} und {missing[-1]} hast du keine Chance.")
+        h("")
+        h("Es gibt keinen Schmerz.")
+        h("Nur Dunkelheit.")
+        h("")
+        h("═" * 50)
+        h("")
+        player_stats['health'] = 0
+        _handle_player_death()
+        return
+
+    # ── VOLLSTÄNDIGE SEQUENZ ────────────────────────────────────────────
+
+    # ── PHASE 1: DER KAMPF BEGINNT ──────────────────────────────────────
+    h("")
+    h("═" * 50)
+    h("")
+    h("Die Gruppe steht.")
+    h("")
+    h("Christopher links von dir — die Knöchel weiß um sein Messer.")
+    h("Emilia rechts — ruhig, konzentriert, gefährlicher als sie aussieht.")
+    h("Helene hinter euch — ihr Kräuterbeutel eng an die Brust gedrückt.")
+    h("")
+    h('"Zusammen", sagt Christopher.')
+    h("Nicht laut. Er muss es nicht laut sagen.")
+    h("")
+    h("Der Verschlinger schreit.")
+    h("")
+    h("Nicht mit einem Maul. Mit Dutzenden.")
+    h("Die Stimmen in seiner Brust kreischen alle gleichzeitig auf —")
+    h("menschliche Stimmen, verzerrt bis zur Unkenntlichkeit,")
+    h("und dann stürmt er vor.")
+    h("")
+    h("Er ist SCHNELL.")
+    h("")
+    h("Für etwas seiner Größe ist es obszön — ein schwarzer Blitz")
+    h("aus Teer und Sehnen der durch eure Formation bricht wie durch Papier.")
+    h("")
+    h("Christopher weicht aus. Emilia rollt zur Seite.")
+    h("Du springst zurück.")
+    h("Helene bleibt stehen.")
+    h("")
+    h('"HELENE!"')
+    h("")
+    h("Eine Tendril peitscht durch die Luft — und verfehlt sie knapp.")
+    h("Knapp. Haarscharf.")
+    h("")
+    h("Ihr greift an.")
+    h("")
+    h("Christophers Messer findet schwarzes Fleisch — es zischt dort")
+    h("wo es trifft, wie Säure auf Metall. Der Verschlinger brüllt.")
+    h("Emilia trifft ihn mit einem Stein an der Seite seines Mauls.")
+    h("Du greifst zu allem was du hast und schlägst zu.")
+    h("")
+    h("Er trifft zurück.")
+    h("")
+    h("Die Tendril erwischt Christopher quer über die Brust — er fliegt")
+    h("drei Meter zurück, keucht, steht wieder auf.")
+    h("Eine andere trifft dich. Rippen. Luft weg. Weitermachen.")
+    h("Emilia schreit kurz auf — Blut an ihrer Schulter — und kämpft weiter.")
+    h("")
+    h("Minuten vergehen. Eine Ewigkeit.")
+    h("")
+
+    # ── PHASE 2: HELENES TOD ────────────────────────────────────────────
+    h("Dann — ein Laut den ihr nie vergessen werdet.")
+    h("")
+    h("Ein Reißen.")
+    h("Nass. Tief. Unaufhaltsam.")
+    h("")
+    h("Die Tendril trifft Helene an der linken Seite —")
+    h("trifft sie nicht, reißt DURCH sie.")
+    h("")
+    h("Die schwarze Masse wickelt sich um ihre Hüfte und ZIEHT.")
+    h("")
+    h("Helenes Schrei beginnt als Schrei.")
+    h("Er endet als etwas anderes.")
+    h("Als Luft aus Lungen, die es nicht mehr geben sollte.")
+    h("Als ein Laut den der menschliche Körper nicht machen kann —")
+    h("und dann doch macht, am Ende von allem.")
+    h("")
+    h("Du siehst zu viel.")
+    h("")
+    h("Du siehst wie ihr Oberkörper sich vom Unterkörper trennt —")
+    h("nicht sauber, nicht schnell, kein Schnitt.")
+    h("Ein Reißen. Ein Herausreißen. Schicht für Schicht, Faser für Faser.")
+    h("Ihre Wirbelsäule bricht mit einem Knacken das durch das")
+    h("gesamte Gräberfeld hallt — ein Laut wie brechender Ast,")
+    h("aber feuchter, schwerer, endgültiger.")
+    h("")
+    h("Ihre Rippen. Bloß. Weiß. Splitternackend im Mondlicht.")
+    h("Eine Lunge die noch atmet — noch pumpt — noch kämpft")
+    h("für einen Körper der nicht mehr da ist.")
+    h("Ihre Eingeweide folgen der Schwerkraft,")
+    h("dampfend in der Nachtluft.")
+    h("")
+    h("Der Verschlinger frisst.")
+    h("")
+    h("Nicht schluckt. FRISST.")
+    h("Seine Tendrilen durchsuchen was von ihr übrig ist,")
+    h("zerren Stücke auseinander, schlürfen, reißen, zermalmen.")
+    h("Das Geräusch ist das schlimmste was du je gehört hast.")
+    h("")
+    h("Was bleibt von Helene liegt auf dem Boden des Friedhofs.")
+    h("Ihre Augen sind offen.")
+    h("Sie sehen zur Seite.")
+    h("Sie sehen Emilia an.")
+    h("Sie sehen sie noch an als das Licht erlischt.")
+    h("")
+    h("Emilia gibt keinen Laut von sich.")
+    h("")
+    h("Sie steht einfach. Das Gesicht weiß wie die Grabsteine.")
+    h("Und dann kehrt die Farbe zurück —")
+    h("aber es ist das falsche Rot.")
+    h("")
+
+    # ── PHASE 3: WUTSTURM & SIEG ────────────────────────────────────────
+    h("Was danach geschieht hat keine Ordnung.")
+    h("Keine Strategie. Keinen Plan.")
+    h("")
+    h("Christopher stürmt vor — mit dem Messer, dann mit den Fäusten,")
+    h("dann mit dem ganzen Körper. Er schreit dabei.")
+    h("Emilia schreit — ein Laut der nicht nach ihr klingt —")
+    h("und trommelt auf die schwarze Masse ein ohne aufzuhören.")
+    h("Du greifst zu allem was du hast.")
+    h("")
+    h("Alles.")
+    h("")
+    h("Der Verschlinger trifft euch. Er verletzt euch.")
+    h("Ihr kämpft weiter.")
+    h("Er kämpft noch. Ihr kämpft immer noch.")
+    h("")
+    h("Irgendwann gibt er nach.")
+    h("")
+    h("Nicht dramatisch. Nicht filmreif.")
+    h("Er bricht zusammen — langsam, wie ein Gebäude das seinen")
+    h("letzten tragenden Pfeiler verliert.")
+    h("Die schwarze Masse fließt auseinander.")
+    h("Die Stimmen in seiner Brust verstummen, eine nach der anderen.")
+    h("Bis die letzte erlischt.")
+    h("")
+    h("Er liegt still.")
+    h("")
+    h("Ihr keucht. Ihr blutet. Ihr lebt noch.")
+    h("")
+    h("═" * 50)
+    h("")
+
+    # ── PHASE 4: DER STRECKER ───────────────────────────────────────────
+    h("Emilia kniet bei dem was von Helene übrig ist.")
+    h("")
+    h("Du willst etwas sagen.")
+    h("Irgendetwas.")
+    h("")
+    h("Dann —")
+    h("")
+    h("Ein Schatten aus dem Dunkel zwischen den Grabsteinen.")
+    h("")
+    h("Zu lang.")
+    h("Zu dünn.")
+    h("Gelenke in Winkeln die keine menschlichen Gelenke haben sollten.")
+    h("")
+    h("Das Ding bewegt sich in einem einzigen Ruck —")
+    h("keine Vorwarnung, kein Geräusch —")
+    h("")
+    h("und Emilia ist weg.")
+    h("")
+    h("W E G.")
+    h("")
+    h("Weggerissen wie ein Blatt aus einer Hand.")
+    h("Eine Sekunde da, eine Sekunde nicht mehr.")
+    h("")
+    h("Sie schreit.")
+    h("Du hörst es.")
+    h("Du hörst wie das Schreien kleiner wird.")
+    h("")
+
+    # ── PHASE 5: CHRISTOPHERS OPFER ────────────────────────────────────
+    h("Christopher.")
+    h("")
+    h("Er springt hinterher.")
+    h("")
+    h("Er ist schneller als du in diesem Moment denkst.")
+    h("Er erreicht das Ding — er greift nach Emilia —")
+    h("")
+    h("Das lange Ding dreht sich.")
+    h("Nicht um. Es dreht sich, in einem Winkel der falscher ist")
+    h("als alles was du bisher gesehen hast.")
+    h("")
+    h("Es greift nach Christophers Bein.")
+    h("")
+    h("Der Ruck ist kurz.")
+    h("Das Geräusch danach ist es nicht.")
+    h("")
+    h("Ein dumpfes, nasses K N A C K E N —")
+    h("und Christopher liegt auf dem Boden des Friedhofs,")
+    h("drei Meter zurückgeschleudert.")
+    h("")
+    h("Sein Bein ist nicht mehr am richtigen Ort.")
+    h("")
+    h("Er schreit nicht sofort.")
+    h("Das ist das Schlimmste.")
+    h("Es gibt diese Sekunde — diese eine fürchterliche Sekunde —")
+    h("in der er einfach auf das schaut was mit ihm passiert ist.")
+    h("Und versteht.")
+    h("")
+    h("Dann schreit er.")
+    h("")
+    h("Das Ding geht in die Hocke neben ihm. Ganz nah. Interessiert.")
+    h("Seine Finger — zu lang, zu viele Gelenke —")
+    h("greifen nach Christophers Ohr.")
+    h("")
+    h("Du läufst los.")
+    h("")
+    h("Du kommst nicht rechtzeitig hin.")
+    h("")
+    h("Das Reißen ist nass und kurz.")
+    h("Du siehst das Ding sein Maul bewegen.")
+    h("Du siehst Christophers Gesicht wenn er versteht")
+    h("was gerade — direkt vor deinen Augen — geschieht.")
+    h("")
+    h("Dann ist das Ding weg.")
+    h("Emilia ist weg.")
+    h("")
+
+    # ── AFTERMATH ───────────────────────────────────────────────────────
+    h("═" * 50)
+    h("")
+    h("Du stehst auf einem Friedhof, zwischen den Toten.")
+    h("Mit dem was von deiner Gruppe übrig geblieben ist.")
+    h("")
+    h("Christopher lebt noch.")
+    h("Er blutet. Er zittert.")
+    h("Er schaut dich an.")
+    h("")
+    h('"Find her."')
+    h("")
+    h("Seine Zähne sind rot. Er lächelt nicht.")
+    h("")
+    h('"Find... sie."')
+    h("")
+    h("═" * 50)
+    h("")
+
+    # State-Änderungen
+    friedhof_event_abgeschlossen = True
+    christopher_verletzt = True
+    player_stats['helene_following'] = False
+    player_stats['emilia_following'] = False
+    player_stats['companion_hp'] = 20
+    player_stats['companion_stunned_turns'] = 0
+    player_stats['in_combat'] = False
+    stop_combat_resume_ambient()
+
+    h('[Helene Albrecht — Tot]')
+    h('[Emilia Albrecht — Entführt vom Strecker]')
+    h('[Christopher Thomson — Schwer verletzt, folgt dir weiter]')
+    h("")
+
+    # Credits nach dem Ende einleiten
+    global credits_pending
+    credits_pending = True
+    h("════════════════════════════════════════════")
+    h("")
+    h("                    ENDE")
+    h("")
+    h("════════════════════════════════════════════")
+    h("")
+    h("  [ ENTER drücken um die Credits zu sehen ]")
+    h("")
+
+
+def _companion_post_combat_heal():
+    """Passiver HP-Regen nach einem erfolgreichen Kampf wenn Begleiter aktiv."""
+    comp = player_stats.get('companion')
+    if comp and comp != 'christopher_waiting' and player_stats['health'] < 100:
+        heal = 5
+        player_stats['health'] = min(100, player_stats['health'] + heal)
+        if christopher_verletzt:
+            add_to_history(f"Christopher verbindet deine Wunden, so gut er es mit einer Hand kann. +{heal} HP")
+        else:
+            add_to_history(f"Christopher versorgt deine Wunden. +{heal} HP")
+        add_to_history("")
+
+
+def _companion_intercept(base_damage):
+    """Prüft ob der Begleiter den Angriff abfängt. Gibt modifizierten Schaden zurück."""
+    comp = player_stats.get('companion')
+    if not comp or comp == 'christopher_waiting':
+        return base_damage
+
+    stunned = player_stats.get('companion_stunned_turns', 0)
+    if stunned > 0:
+        player_stats['companion_stunned_turns'] = stunned - 1
+        if player_stats['companion_stunned_turns'] == 0:
+            add_to_history("Christopher erholt sich langsam und ist wieder einsatzbereit.")
+            add_to_history("")
+        return base_damage
+
+    # Begleiter fängt jeden Angriff ab und halbiert den Schaden (deterministisch)
+    reduced = max(1, int(base_damage * 0.5))
+    if christopher_verletzt:
+        add_to_history("Christopher schleppt sich zwischen dich und den Feind!")
+    else:
+        add_to_history("Christopher reißt den Feind zur Seite!")
+    add_to_history(f"[Begleiter-Schutz: Schaden {base_damage} → {reduced}]")
+    add_to_history("")
+
+    comp_dmg = 15
+    player_stats['companion_hp'] = max(0, player_stats['companion_hp'] - comp_dmg)
+
+    if player_stats['companion_hp'] <= 0:
+        player_stats['companion_stunned_turns'] = 3
+        if christopher_verletzt:
+            add_to_history("Christopher bricht zusammen — sein Körper gibt nach. Er braucht eine Pause!")
+        else:
+            add_to_history("Christopher ist verletzt und für kurze Zeit außer Gefecht!")
+        add_to_history("")
+
+    return reduced
+
+
+def _handle_player_death():
+    """Zentralisierte Todes-Behandlung: Reset und Neustart."""
+    global player_deaths, last_death_room
+    player_deaths += 1
+    last_death_room = current_room
+    stop_zombie_sounds()
+    stop_combat_sounds()
+    add_to_history("")
+    add_to_history("=== DU BIST GESTORBEN ===")
+
+    player_stats['health'] = 100
+    player_stats['strength'] = 100
+    player_stats['hunger'] = 0
+    player_stats['turns_since_last_meal'] = 0
+    player_stats['last_recovery_turn'] = 0
+    player_stats['equipped_weapon'] = None
+    player_stats['weapon_type'] = None
+    player_stats['in_combat'] = False
+    player_stats['companion'] = None
+    player_stats['companion_hp'] = 100
+    player_stats['companion_stunned_turns'] = 0
+    player_stats['emilia_following'] = False
+    player_stats['helene_following'] = False
+
+    for ek in enemies:
+        enemies[ek]['health'] = enemies[ek]['max_health']
+
+    rooms['start']['first_visit'] = True
+    rooms['start']['enemy'] = 'zombie'
+    rooms['start']['items'] = ['feuerlöscher', 'zeitung']
+    start_game()
+
+
+# ============================================================
+# KAMPF-AUFLÖSUNG (Sieg-Logik)
+# ============================================================
+
+def _resolve_enemy_defeat(enemy, target, room):
+    """Gemeinsame Sieg-Logik wenn ein Gegner im Nahkampf besiegt wird."""
+    stop_zombie_sounds()
+    play_zombie_dying_sound()
+    add_to_history("")
+    if target == 'zombie':
+        add_to_history("Der Zombie zuckt ein letztes Mal.")
+        add_to_history("Schwarze Flüssigkeit sickert aus dem zerschmetterten Schädel.")
+    elif target == 'zombie_hure':
+        add_to_history("Die Zombie-Hure zuckt ein letztes Mal und liegt still.")
+        add_to_history("Der Raum riecht schlimmer als zuvor. Aber er ist sicher.")
+    else:
+        add_to_history(f"{enemy['name']} sackt schwer zusammen.")
+    add_to_history("")
+    add_to_history("=== SIEG ===")
+    add_to_history("")
+
+    room['enemy'] = None
+    player_stats['in_combat'] = False
+    stop_combat_resume_ambient()
+    zombie_kill_times[current_room] = get_ticks()
+    add_score('zombie_kill', context=current_room)
+    grant_enemy_loot_on_death(target)
+    _companion_post_combat_heal()
+
+    if current_room == 'start':
+        rooms['start'].setdefault('exits', {})['norden'] = 'corridor'
+        refresh_exits('start')
+        room['items'].append('taschenlampe')
+        add_to_history("Der Bunker ist still. Du bist vorerst sicher.")
+        add_to_history("Im NORDEN siehst du nun einen Korridor.")
+    else:
+        add_to_history("Der Raum ist jetzt sicher.")
+
+
+
+# Handler bekommen die Engine (nicht das Frontend) als Spielmodul
+command_handlers.init_handlers(sys.modules[__name__])
+
+
+# ============================================================
+# HEADLESS-FASSADE
+# ============================================================
+
+class Engine:
+    """Spielt Dead World ohne Fenster, Sound oder Typewriter.
+
+        eng = Engine()
+        eng.new_game()
+        for line in eng.send("nimm zeitung"):
+            print(line)
+
+    Alle Engine-Objekte teilen sich den Modulzustand (siehe Kopf der Datei)."""
+
+    def __init__(self, frontend=None, clock=None):
+        init_frontend(frontend)
+        init_clock(clock)
+
+    def new_game(self, skip_prolog=True, seed=None):
+        """Startet in einer frischen Welt. skip_prolog blättert den Prolog
+        durch, danach steht der Spieler im Startraum. Mit seed (und einer
+        ManualClock) ist die Ausgabe für dieselben Befehle immer gleich."""
+        reset_world()
+        start_game(seed)
+        while skip_prolog and not prolog_shown:
+            process_command("")
+        return self.drain_output()
+
+    def send(self, text):
+        """Führt eine Eingabezeile aus und gibt die neuen Ausgabezeilen zurück."""
+        if prolog_shown:
+            submit_input(text)
+        else:
+            process_command("")
+        return self.drain_output()
+
+    def drain_output(self):
+        """Übernimmt alle wartenden Absätze sofort nach game_history und
+        gibt sie umgebrochen (get_max_chars) als Zeilen zurück."""
+        paragraphs = list(output_queue)
+        output_queue.clear()
+        game_history.extend(paragraphs)
+        max_chars = _frontend.get_max_chars()
+        return [line for text, _color in paragraphs for line in wrap_paragraph(text, max_chars)]
+
+    @property
+    def room(self):
+        return current_room
+
+    @property
+    def inventory(self):
+        return player_inventory
+
+    @property
+    def stats(self):
+        return player_stats
+
+    @property
+    def score(self):
+        return game_score
+
+    @property
+    def moves(self):
+        return game_moves
@@ -2,11 +2,13 @@
 # event_handlers.py — Extracted Event Handlers for Dead World
 # ============================================================
 # Splits the dense main() event loop into focused handler functions.
-# Each handler accesses game state via a module reference (_game).
+# Each handler accesses frontend state via a module reference (_game)
+# and the game core (prolog, command history, parser) via engine.
 
 import pygame
 import ctypes
 from config import *
+import engine
 
 _game = None
 
@@ -68,7 +70,7 @@ def init_event_handlers(game_module):
 # ========================
 def handle_key_repeats(current_ms):
     """Process held-key repeats for terminal input. Called every frame."""
-    if _game.prolog_shown and _game.current_state == GAME:
+    if engine.prolog_shown and _game.current_state == GAME:
         if _game.backspace_held:
             if current_ms - _game.last_backspace_time > backspace_repeat_delay:
                 if _game.cursor_position > 0:
@@ -97,8 +99,8 @@ def handle_key_repeats(current_ms):
     # Enter repeat (works in both prolog and game)
     if _game.enter_held and _game.current_state == GAME:
         if current_ms - _game.last_enter_time > key_repeat_delay:
-            if not _game.prolog_shown:
-                _game.process_command("")
+            if not engine.prolog_shown:
+                engine.process_command("")
             _game.last_enter_time = current_ms
 
 
@@ -186,20 +188,17 @@ def handle_keydown_options(event):
 def handle_keydown_game(event):
     """Keydown events while in GAME state."""
     if event.key == pygame.K_RETURN:
-        if not _game.prolog_shown:
-            _game.process_command("")
+        if not engine.prolog_shown:
+            engine.process_command("")
         elif _game.input_text.strip():
-            raw_cmds = _game.input_text.split(',')
-            for sub_cmd in raw_cmds:
-                sub_cmd = sub_cmd.strip()
-                if sub_cmd:
-                    _game.add_to_history(f"> {sub_cmd}")
-                    _game.process_command(sub_cmd)
+            engine.submit_input(_game.input_text)
             _game.input_text = ""
             _game.cursor_position = 0
-            _game.history_index = -1
-        elif getattr(_game, 'credits_pending', False):
-            _game.credits_pending = False
+            engine.history_index = -1
+        elif _game.typewriter_active:
+            _game.skip_typewriter()  # ENTER ohne Eingabe überspringt den Typewriter
+        elif engine.credits_pending:
+            engine.credits_pending = False
             _game.show_credits()
         _game.enter_held = True
         _game.last_enter_time = pygame.time.get_ticks() + key_initial_delay
@@ -217,63 +216,63 @@ def handle_keydown_game(event):
         _game.delete_held = True
         _game.last_delete_time = pygame.time.get_ticks() + key_initial_delay
 
-    elif event.key == pygame.K_LEFT and _game.prolog_shown:
+    elif event.key == pygame.K_LEFT and engine.prolog_shown:
         if _game.cursor_position > 0:
             _game.cursor_position -= 1
         _game.left_held = True
         _game.last_left_time = pygame.time.get_ticks() + key_initial_delay
 
-    elif event.key == pygame.K_RIGHT and _game.prolog_shown:
+    elif event.key == pygame.K_RIGHT and engine.prolog_shown:
         if _game.cursor_position < len(_game.input_text):
             _game.cursor_position += 1
         _game.right_held = True
         _game.last_right_time = pygame.time.get_ticks() + key_initial_delay
 
-    elif event.key == pygame.K_PAGEUP and _game.prolog_shown:
+    elif event.key == pygame.K_PAGEUP and engine.prolog_shown:
         _game.scroll_offset -= 10
         _game.scroll_offset = max(0, _game.scroll_offset)
 
-    elif event.key == pygame.K_PAGEDOWN and _game.prolog_shown:
+    elif event.key == pygame.K_PAGEDOWN and engine.prolog_shown:
         _game.scroll_offset += 10
         _game.scroll_offset = min(_game.scroll_offset, _game.max_scroll)
 
-    elif event.key == pygame.K_HOME and _game.prolog_shown:
+    elif event.key == pygame.K_HOME and engine.prolog_shown:
         _game.scroll_offset = 0
 
-    elif event.key == pygame.K_END and _game.prolog_shown:
+    elif event.key == pygame.K_END and engine.prolog_shown:
         _game.scroll_offset = _game.max_scroll
 
-    elif event.key == pygame.K_UP and _game.prolog_shown:
+    elif event.key == pygame.K_UP and engine.prolog_shown:
         if _game.scroll_offset == 0:
-            if _game.command_history:
-                if _game.history_index == -1:
-                    _game.history_index = len(_game.command_history) - 1
-                elif _game.history_index > 0:
-                    _game.history_index -= 1
-                if 0 <= _game.history_index < len(_game.command_history):
-                    _game.input_text = _game.command_history[_game.history_index]
+            if engine.command_history:
+                if engine.history_index == -1:
+                    engine.history_index = len(engine.command_history) - 1
+                elif engine.history_index > 0:
+                    engine.history_index -= 1
+                if 0 <= engine.history_index < len(engine.command_history):
+                    _game.input_text = engine.command_history[engine.history_index]
                     _game.cursor_position = len(_game.input_text)
         else:
             _game.scroll_offset -= 3
             _game.scroll_offset = max(0, _game.scroll_offset)
 
-    elif event.key == pygame.K_DOWN and _game.prolog_shown:
+    elif event.key == pygame.K_DOWN and engine.prolog_shown:
         if _game.scroll_offset == 0:
-            if _game.command_history and _game.history_index != -1:
-                _game.history_index += 1
-                if _game.history_index >= len(_game.command_history):
-                    _game.history_index = -1
+            if engine.command_history and engine.history_index != -1:
+                engine.history_index += 1
+                if engine.history_index >= len(engine.command_history):
+                    engine.history_index = -1
                     _game.input_text = ""
                     _game.cursor_position = 0
                 else:
-                    _game.input_text = _game.command_history[_game.history_index]
+                    _game.input_text = engine.command_history[engine.history_index]
                     _game.cursor_position = len(_game.input_text)
         else:
             _game.scroll_offset += 3
             _game.scroll_offset = min(_game.scroll_offset, _game.max_scroll)
 
     # Ctrl+V — Einfügen aus Zwischenablage
-    elif event.key == pygame.K_v and (pygame.key.get_mods() & pygame.KMOD_CTRL) and _game.prolog_shown:
+    elif event.key == pygame.K_v and (pygame.key.get_mods() & pygame.KMOD_CTRL) and engine.prolog_shown:
         pasted = _clipboard_get()
         # Nur erste Zeile, Steuerzeichen entfernen
         pasted = pasted.split('\n')[0].split('\r')[0]
@@ -286,12 +285,12 @@ def handle_keydown_game(event):
             _game.cursor_position = min(len(before) + len(pasted), 200)
 
     # Ctrl+C — aktuellen Input in Zwischenablage kopieren
-    elif event.key == pygame.K_c and (pygame.key.get_mods() & pygame.KMOD_CTRL) and _game.prolog_shown:
+    elif event.key == pygame.K_c and (pygame.key.get_mods() & pygame.KMOD_CTRL) and engine.prolog_shown:
         if _game.input_text:
             _clipboard_set(_game.input_text)
 
     # Normal input
-    elif _game.prolog_shown and len(_game.input_text) < 200 and event.unicode.isprintable():
+    elif engine.prolog_shown and len(_game.input_text) < 200 and event.unicode.isprintable():
         _game.input_text = _game.input_text[:_game.cursor_position] + event.unicode + _game.input_text[_game.cursor_position:]
         _game.cursor_position += 1
 
@@ -0,0 +1,82 @@
+# ============================================================
+# frame_governor.py — Adaptive Framerate for Dead World
+# ============================================================
+# Replaces the fixed clock.tick(FPS) in main(). Three modes:
+#   'full'  — FPS while something animates (typewriter, intro fade,
+#             credits scroll, key repeat) or input just arrived
+#   'pulse' — FPS_PULSE while only a slow pulse is on screen (menu hover
+#             underline and hints, pause and options hints, the prolog's
+#             "[Drücke ENTER]"); never drops to 'low' or 'sleep', which
+#             would make the sine pulses visibly stutter
+#   'low'   — FPS_IDLE while the player is only reading
+#   'sleep' — blocks in pygame.event.wait() until an event arrives or
+#             IDLE_WAIT_TIMEOUT_MS passes (keeps the cursor blinking)
+
+import pygame
+from config import FPS, FPS_IDLE, FPS_PULSE, INPUT_ACTIVE_MS, IDLE_SLEEP_AFTER_MS, IDLE_WAIT_TIMEOUT_MS
+
+MODE_FULL = 'full'
+MODE_PULSE = 'pulse'
+MODE_LOW = 'low'
+MODE_SLEEP = 'sleep'
+
+# Event-Typen, die als Spieler-Aktivität zählen
+_INPUT_EVENTS = (
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION, pygame.MOUSEWHEEL,
+)
+
+_SMOOTHING = 0.1  # Gewicht des neuesten Frames im gleitenden Mittel
+
+
+class FrameGovernor:
+    """Wählt pro Frame die Ziel-Framerate und misst die Frame-Zeit.
+
+    mode          — aktueller Modus ('full' | 'pulse' | 'low' | 'sleep')
+    frame_time_ms — geglättete Dauer eines ganzen Frames inkl. Warten
+    busy_time_ms  — geglättete Arbeitszeit eines Frames ohne Warten
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.mode = MODE_FULL
+        self.frame_time_ms = 1000.0 / FPS
+        self.busy_time_ms = 0.0
+        self.last_input_ms = pygame.time.get_ticks()
+
+    def note_event(self, event):
+        """Merkt sich Eingabe-Events, damit direkt danach volle FPS laufen."""
+        if event.type in _INPUT_EVENTS:
+            self.last_input_ms = pygame.time.get_ticks()
+
+    def tick(self, animating, pulsing=False):
+        """Beendet den Frame. animating=True erzwingt volle Framerate,
+        pulsing=True mindestens FPS_PULSE (kein Schlafmodus)."""
+        idle_ms = pygame.time.get_ticks() - self.last_input_ms
+
+        if animating or idle_ms < INPUT_ACTIVE_MS:
+            self.mode = MODE_FULL
+            self.clock.tick(FPS)
+        elif pulsing:
+            self.mode = MODE_PULSE
+            self.clock.tick(FPS_PULSE)
+        elif idle_ms < IDLE_SLEEP_AFTER_MS:
+            self.mode = MODE_LOW
+            self.clock.tick(FPS_IDLE)
+        else:
+            self.mode = MODE_SLEEP
+            event = pygame.event.wait(IDLE_WAIT_TIMEOUT_MS)
+            if event.type != pygame.NOEVENT:
+                # Zurück in die Queue, damit main() es regulär verarbeitet
+                pygame.event.post(event)
+                self.note_event(event)
+            self.clock.tick()
+
+        self.frame_time_ms += _SMOOTHING * (self.clock.get_time() - self.frame_time_ms)
+        self.busy_time_ms += _SMOOTHING * (self.clock.get_rawtime() - self.busy_time_ms)
+
+    @property
+    def fps(self):
+        """Gemessene Framerate aus der geglätteten Frame-Zeit."""
+        return 1000.0 / self.frame_time_ms if self.frame_time_ms > 0 else 0.0
@@ -0,0 +1,103 @@
+# ============================================================
+# frame_profiler.py — Frame-Time Diagnostics for Dead World
+# ============================================================
+# Optional instrumentation for main(): each frame is split into phases
+# (event pump, key repeats, typewriter, draw, present, wait) by calling
+# mark(phase) at the end of each phase. The last PROFILER_HISTORY frames
+# are kept with their per-phase times and the render_utils counters
+# (surface allocations, font renders), shown by the overlay in the
+# pygame frontend and exportable as CSV to compare builds.
+#
+# Toggle with F3 in-game or start with DEAD_WORLD_PROFILE=1.
+# F4 writes the CSV (PROFILER_CSV_FILE).
+
+import csv
+import time
+from collections import deque
+from config import PROFILER_HISTORY
+
+PHASES = ('key_repeats', 'events', 'typewriter', 'draw', 'present', 'wait')
+COUNTERS = ('allocations', 'font_renders')
+HISTOGRAM_EDGES_MS = (4, 8, 12, 16.7, 25, 33.3, 50, 100)  # Obergrenzen der Balken, letzter = Rest
+
+
+class FrameProfiler:
+    """Misst Phasen-Zeiten je Frame (Millisekunden) über ein gleitendes Fenster.
+
+    Ist enabled False, kosten begin_frame()/mark()/end_frame() nur einen
+    Attribut-Zugriff.
+    """
+
+    def __init__(self, enabled=False, history=PROFILER_HISTORY):
+        self.enabled = enabled
+        self.frames = deque(maxlen=history)   # dict je Frame: frame_ms, PHASES, COUNTERS
+        self._row = None
+        self._frame_start = 0.0
+        self._last_mark = 0.0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._row = None
+        return self.enabled
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._frame_start = self._last_mark = now
+        self._row = dict.fromkeys(PHASES, 0.0)
+
+    def mark(self, phase):
+        """Schließt die laufende Phase ab (Zeit seit dem letzten mark)."""
+        if self._row is None:
+            return
+        now = time.perf_counter()
+        self._row[phase] += (now - self._last_mark) * 1000.0
+        self._last_mark = now
+
+    def end_frame(self, **counters):
+        if self._row is None:
+            return
+        row = self._row
+        row['frame_ms'] = (time.perf_counter() - self._frame_start) * 1000.0
+        for name in COUNTERS:
+            row[name] = counters.get(name, 0)
+        self.frames.append(row)
+        self._row = None
+
+    # ── Auswertung ─────────────────────────────────────────────────────────
+    def percentile(self, pct, key='frame_ms'):
+        values = sorted(row[key] for row in self.frames)
+        if not values:
+            return 0.0
+        idx = min(len(values) - 1, max(0, int(round(pct / 100.0 * (len(values) - 1)))))
+        return values[idx]
+
+    def average(self, key):
+        if not self.frames:
+            return 0.0
+        return sum(row[key] for row in self.frames) / len(self.frames)
+
+    def histogram(self, key='frame_ms'):
+        """Anzahl Frames je Bucket von HISTOGRAM_EDGES_MS (+ ein Bucket für den Rest)."""
+        counts = [0] * (len(HISTOGRAM_EDGES_MS) + 1)
+        for row in self.frames:
+            value = row[key]
+            for i, edge in enumerate(HISTOGRAM_EDGES_MS):
+                if value <= edge:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return counts
+
+    def export_csv(self, path):
+        """Schreibt alle gespeicherten Frames als CSV (eine Zeile je Frame)."""
+        fields = ('frame', 'frame_ms') + PHASES + COUNTERS
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(fields)
+            for i, row in enumerate(self.frames):
+                writer.writerow([i] + [round(row[name], 4) if isinstance(row[name], float) else row[name]
+                                       for name in fields[1:]])
+        return len(self.frames)
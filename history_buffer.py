@@ -0,0 +1,160 @@
+# ============================================================
+# history_buffer.py — Bounded Terminal History for Dead World
+# ============================================================
+# game_history used to be a plain list that grew for the whole session.
+# HistoryBuffer keeps only the newest `capacity` lines in a fixed ring.
+# Lines that fall out of the ring can optionally be spilled to an
+# on-disk transcript (one JSON line per entry); the buffer then still
+# behaves like one continuous sequence: len() counts spilled + in-memory
+# lines, and indexing into the spilled range reads the lines back from
+# disk in small blocks, so only lines that become visible again are
+# ever loaded. Without a transcript, evicted lines are gone; first_index
+# then says how many were dropped, and generation changes on clear() so
+# derived views (text_layout) know when to start over.
+
+import json
+from array import array
+from collections import OrderedDict
+
+_SPILL_BLOCK = 64         # Zeilen pro Lese-Block aus dem Transcript
+_SPILL_CACHE_BLOCKS = 8   # Gecachte Blöcke (LRU) — reicht für mehrere Bildschirmseiten
+
+
+class HistoryBuffer:
+    """Ringpuffer fester Kapazität für (text, color)-Zeilen.
+
+    spill_path — optionale Transcript-Datei für verdrängte Zeilen
+                 (None = verdrängte Zeilen werden verworfen)
+    """
+
+    def __init__(self, capacity, spill_path=None):
+        self.capacity = max(1, int(capacity))
+        self._ring = [None] * self.capacity
+        self._head = 0                       # Ring-Index der ältesten Zeile
+        self._count = 0                      # Zeilen im Ring
+        self._dropped = 0                    # Verworfene Zeilen (ohne Transcript)
+        self.generation = 0                  # Zählt hoch, wenn Indizes ungültig werden
+        self._spill_path = spill_path
+        self._spill_file = None              # Wird erst bei der ersten Verdrängung geöffnet
+        self._spill_offsets = array('q')     # Dateiposition je ausgelagerter Zeile
+        self._spill_cache = OrderedDict()    # block_nr -> [(text, color), ...]
+
+    # ── Sequenz-Schnittstelle ──────────────────────────────────────────────
+    def __len__(self):
+        return len(self._spill_offsets) + self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        total = len(self)
+        if index < 0:
+            index += total
+        if not 0 <= index < total:
+            raise IndexError('history index out of range')
+        spilled = len(self._spill_offsets)
+        if index >= spilled:
+            return self._ring[(self._head + index - spilled) % self.capacity]
+        return self._read_spilled(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, entry):
+        if self._count < self.capacity:
+            self._ring[(self._head + self._count) % self.capacity] = entry
+            self._count += 1
+            return
+        evicted = self._ring[self._head]
+        self._ring[self._head] = entry
+        self._head = (self._head + 1) % self.capacity
+        self._spill(evicted)
+
+    def extend(self, entries):
+        for entry in entries:
+            self.append(entry)
+
+    def clear(self):
+        """Leert Ring und Transcript (z.B. Befehl 'clear', neues Spiel)."""
+        self._ring = [None] * self.capacity
+        self._head = 0
+        self._count = 0
+        self._dropped = 0
+        self._reset_spill()
+
+    def recent(self):
+        """Nur die Zeilen im Speicher, älteste zuerst."""
+        return [self._ring[(self._head + i) % self.capacity] for i in range(self._count)]
+
+    # ── Transcript ─────────────────────────────────────────────────────────
+    def enable_spill(self, path):
+        """Aktiviert (oder mit None deaktiviert) das Auslagern verdrängter Zeilen."""
+        self._reset_spill()
+        self._spill_path = path
+
+    def close(self):
+        self._reset_spill()
+
+    @property
+    def first_index(self):
+        """Absoluter Index (seit clear) von self[0]."""
+        return self._dropped
+
+    @property
+    def spilled_count(self):
+        return len(self._spill_offsets)
+
+    def _reset_spill(self):
+        if self._spill_file is not None:
+            try:
+                self._spill_file.close()
+            except OSError:
+                pass
+            self._spill_file = None
+        self._spill_offsets = array('q')
+        self._spill_cache.clear()
+        self.generation += 1
+
+    def _spill(self, entry):
+        if not self._spill_path:
+            self._dropped += 1
+            return
+        try:
+            if self._spill_file is None:
+                # 'w+b' leert ein Transcript aus einer früheren Sitzung
+                self._spill_file = open(self._spill_path, 'w+b')
+            f = self._spill_file
+            f.seek(0, 2)
+            offset = f.tell()
+            text, color = entry
+            f.write(json.dumps([text, list(color) if color is not None else None],
+                               ensure_ascii=False).encode('utf-8') + b'\n')
+        except (OSError, TypeError, ValueError):
+            # Transcript nicht schreibbar → wie ohne Spill weiter, nichts aufhalten
+            self.enable_spill(None)
+            return
+        self._spill_offsets.append(offset)
+
+    def _read_spilled(self, index):
+        block = index // _SPILL_BLOCK
+        lines = self._spill_cache.get(block)
+        if lines is None:
+            lines = self._load_block(block)
+            self._spill_cache[block] = lines
+            if len(self._spill_cache) > _SPILL_CACHE_BLOCKS:
+                self._spill_cache.popitem(last=False)
+        else:
+            self._spill_cache.move_to_end(block)
+        return lines[index - block * _SPILL_BLOCK]
+
+    def _load_block(self, block):
+        first = block * _SPILL_BLOCK
+        count = min(_SPILL_BLOCK, len(self._spill_offsets) - first)
+        f = self._spill_file
+        f.flush()
+        f.seek(self._spill_offsets[first])
+        lines = []
+        for _ in range(count):
+            text, color = json.loads(f.readline().decode('utf-8'))
+            lines.append((text, tuple(color) if color is not None else None))
+        return lines
@@ -0,0 +1,201 @@
+# ============================================================
+# input_recorder.py — Session Recording and Replay for Dead World
+# ============================================================
+# The engine reports every input entry point to the recorder: commands
+# (process_command), input lines (submit_input), "new game" and "load"
+# from the menu. Calls made from inside another entry (e.g. the command
+# 'neu' starting a new game) are not recorded, they happen again on
+# replay. Also logged, as information for the replay:
+#   's' — every new RNG seed (new game, save, load)
+#   'l' — the save data (and slot) read by a load, so a replay does not
+#         depend on the save files that existed at recording time
+#
+# Log format: one compact JSON list per line, [kind, ticks, *payload];
+# the first line is the header ['h', version, wall clock at tick 0].
+#
+# Recording is off by default; start the game with DEAD_WORLD_RECORD=1
+# (or set RECORD_SESSIONS in config.py). A new session moves the previous
+# log to <file>.1 instead of overwriting it.
+#
+# Replay (headless, no typewriter, no audio, as fast as possible):
+#     python input_recorder.py dead_world_session.log [--print] [--render out.png]
+# The ticks of each entry drive a ManualClock, so cooldowns and the
+# play time come out as recorded. A seed that differs from the recorded
+# one means the replay diverged.
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import datetime
+import tempfile
+
+LOG_VERSION = 1
+ENTRY_KINDS = ('c', 'i', 'n', 'm')   # process_command, submit_input, start_game, load_game_from_menu
+
+
+class CommandRecorder:
+    """Schreibt Einträge zeilenweise nach path (Datei wird beim ersten Eintrag angelegt)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def record(self, kind, ticks, *payload):
+        if self.path is None:
+            return
+        try:
+            if self._file is None:
+                if os.path.exists(self.path):
+                    os.replace(self.path, self.path + '.1')  # Vorherige Sitzung aufheben
+                self._file = open(self.path, 'w', encoding='utf-8')
+                wall = datetime.datetime.now() - datetime.timedelta(milliseconds=ticks)
+                self._write(['h', LOG_VERSION, wall.isoformat(timespec='milliseconds')])
+            self._write([kind, ticks, *payload])
+        except (OSError, TypeError, ValueError):
+            # Log nicht schreibbar → Aufnahme abschalten, das Spiel läuft weiter
+            self.close()
+            self.path = None
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._file.flush()  # Log soll auch einen Absturz überstehen
+
+    def close(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+
+def read_log(path):
+    """→ (header, [eintrag, ...]). Eine abgeschnittene letzte Zeile wird ignoriert."""
+    header = None
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            if entry[0] == 'h':
+                header = entry
+            else:
+                records.append(entry)
+    return header, records
+
+
+def _clock_start(header):
+    if header and len(header) > 2:
+        try:
+            return datetime.datetime.fromisoformat(header[2])
+        except ValueError:
+            pass
+    return datetime.datetime(2000, 1, 1)
+
+
+def replay(header, records, on_lines=None):
+    """Spielt die Einträge headless nach. on_lines(zeilen) bekommt die
+    Ausgabe je Eintrag. Gibt eine Statistik als dict zurück."""
+    import engine
+    from rng_service import ManualClock
+
+    clock = ManualClock(start=_clock_start(header))
+    eng = engine.Engine(clock=clock)
+    engine.reset_world()
+    saved_path = engine.SAVE_FILE
+    save_dir = tempfile.mkdtemp(prefix='dead_world_replay_')
+    engine.SAVE_FILE = os.path.join(save_dir, os.path.basename(saved_path))
+    entries = seed_mismatches = 0
+    start = time.perf_counter()
+    try:
+        for i, entry in enumerate(records):
+            kind = entry[0]
+            if kind not in ENTRY_KINDS:
+                continue
+            info = []
+            j = i + 1
+            while j < len(records) and records[j][0] not in ENTRY_KINDS:
+                info.append(records[j])
+                j += 1
+            load = next((e for e in info if e[0] == 'l'), None)
+            if load is not None:
+                slot = load[3] if len(load) > 3 else engine.DEFAULT_SLOT
+                with open(engine.save_slots().path(slot), 'w', encoding='utf-8') as f:
+                    json.dump(load[2], f, ensure_ascii=False)
+            seeds = [e[2] for e in info if e[0] == 's']
+
+            clock.ticks = entry[1]
+            if kind == 'c':
+                engine.process_command(entry[2])
+            elif kind == 'i':
+                engine.submit_input(entry[2])
+            elif kind == 'n':
+                engine.start_game(seeds[0] if seeds else None)
+            elif kind == 'm':
+                engine.load_game_from_menu(*entry[2:])
+            entries += 1
+            if seeds and seeds[-1] != engine.rng.seed:
+                seed_mismatches += 1
+            lines = eng.drain_output()
+            if on_lines is not None:
+                on_lines(lines)
+    finally:
+        shutil.rmtree(save_dir, ignore_errors=True)
+        engine.SAVE_FILE = saved_path
+    return {
+        'entries': entries,
+        'seconds': time.perf_counter() - start,
+        'seed_mismatches': seed_mismatches,
+        'room': engine.current_room,
+        'moves': engine.game_moves,
+        'score': engine.game_score,
+    }
+
+
+def render_final_frame(path):
+    """Zeichnet den Spielbildschirm nach dem Replay einmal und speichert ihn als Bild."""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    import pygame
+    import engine
+    import dead_world_intro_v_omega as game
+
+    engine.game_history.enable_spill(None)
+    game.current_state = game.GAME
+    game.request_full_redraw()
+    game.draw_game(engine.get_ticks(), force=True)
+    pygame.image.save(game.screen, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Dead World Session-Replay')
+    parser.add_argument('log', help='Aufgezeichnete Sitzung (RECORDING_FILE)')
+    parser.add_argument('--print', dest='print_output', action='store_true',
+                        help='Spielausgabe auf stdout schreiben')
+    parser.add_argument('--render', metavar='PNG', help='Nur den letzten Frame rendern und speichern')
+    args = parser.parse_args(argv)
+
+    def print_lines(lines):
+        for line in lines:
+            print(line)
+
+    header, records = read_log(args.log)
+    stats = replay(header, records, print_lines if args.print_output else None)
+    if args.render:
+        render_final_frame(args.render)
+    rate = stats['entries'] / stats['seconds'] if stats['seconds'] else 0.0
+    print(f"[REPLAY] {stats['entries']} Einträge in {stats['seconds'] * 1000:.1f} ms "
+          f"({rate:.0f}/s) — Raum {stats['room']}, Züge {stats['moves']}, Score {stats['score']}")
+    if stats['seed_mismatches']:
+        print(f"[REPLAY] WARNUNG: {stats['seed_mismatches']} Seed-Abweichung(en) — Replay ist auseinandergelaufen")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,54 @@
+# ============================================================
+# prefix_index.py — Prefix Lookup for the Command Parser
+# ============================================================
+# Sorted key array + bisect. A prefix query is two binary searches
+# (O(log n)) plus the k matching keys — no scan over the vocabulary.
+# Keys can be added/removed one at a time (insort / bisect + del),
+# so overlays for room items and inventory stay incremental.
+
+from bisect import bisect_left, insort
+
+_PREFIX_END = '\U0010ffff'  # Sortiert hinter jedem realen Zeichen
+
+
+class PrefixIndex:
+    """Sortierte, duplikatfreie Schlüsselmenge mit Präfixsuche."""
+
+    def __init__(self, keys=()):
+        self._keys = sorted(set(keys))
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        i = bisect_left(self._keys, key)
+        return i < len(self._keys) and self._keys[i] == key
+
+    def add(self, key):
+        if key not in self:
+            insort(self._keys, key)
+
+    def discard(self, key):
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+
+    def with_prefix(self, prefix):
+        """Alle Schlüssel die mit prefix beginnen (sortiert)."""
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + _PREFIX_END, lo)
+        return self._keys[lo:hi]
+
+
+def rank_candidates(matches, room_items, inventory):
+    """Sortiert Präfix-Treffer nach Relevanz: erst Gegenstände im Raum,
+    dann im Inventar, dann der Rest — jeweils kürzeste Ergänzung zuerst."""
+    def _rank(key):
+        if key in room_items:
+            tier = 0
+        elif key in inventory:
+            tier = 1
+        else:
+            tier = 2
+        return (tier, len(key), key)
+    return sorted(matches, key=_rank)
@@ -9,14 +9,24 @@
 
 import pygame
 import math
-from config import REFERENCE_WIDTH, REFERENCE_HEIGHT, TERMINAL_FONT_NAME
+from collections import OrderedDict
+from config import REFERENCE_WIDTH, REFERENCE_HEIGHT, TERMINAL_FONT_NAME, LINE_CACHE_SIZE, GLOW_CACHE_SIZE
 
 # ========================
 # MODULE STATE
 # ========================
 _screen = None           # Set via init_render()
 _font_cache = {}
+_font_sizes = {}         # id(font) -> skalierte Größe (nur Fonts aus get_scaled_font)
 _last_scale_factor = None
+_line_cache = OrderedDict()  # (text, color, size) -> Surface, LRU-geordnet
+_glyph_atlases = {}          # (size, color, antialias) -> GlyphAtlas
+_glow_scratch = None         # Wiederverwendete Surface für den Glow-Pass von draw_text_glow
+_glow_sprites = OrderedDict()  # (text, color, font, radius, alpha) -> (Surface, rand), LRU-geordnet
+_surface_pool = {}           # tag -> ((größe, flags), Surface) — eine Surface je Verwendungszweck
+_alloc_count = 0             # Über new_surface() angelegte Surfaces seit take_frame_allocations()
+_render_count = 0            # font.render-Aufrufe (Fonts aus get_scaled_font) seit take_frame_font_renders()
+_prefix_run = None           # Zuletzt gezeichnete Typewriter-Teilzeile (siehe draw_glyph_prefix)
 
 
 def init_render(screen_surface):
@@ -66,21 +76,266 @@ def get_scaled_font(base_size):
     current_factor = get_scale_factor()
     if _last_scale_factor != current_factor:
         _font_cache.clear()
+        _font_sizes.clear()
+        _line_cache.clear()
+        _clear_glyph_atlases()
         _last_scale_factor = current_factor
 
     scaled_size = max(12, scale(base_size))
     if scaled_size not in _font_cache:
-        _font_cache[scaled_size] = pygame.font.SysFont(TERMINAL_FONT_NAME, scaled_size)
+        font = pygame.font.SysFont(TERMINAL_FONT_NAME, scaled_size, constructor=_counting_font)
+        _font_cache[scaled_size] = font
+        _font_sizes[id(font)] = scaled_size
     return _font_cache[scaled_size]
 
 
+class _CountingFont(pygame.font.Font):
+    """pygame-Font, der jeden render()-Aufruf mitzählt (für den Frame-Profiler)."""
+
+    def render(self, *args, **kwargs):
+        global _render_count
+        _render_count += 1
+        return super().render(*args, **kwargs)
+
+
+def _counting_font(fontpath, size, bold, italic):
+    """Font-Konstruktor für SysFont (wie pygame.sysfont.font_constructor)."""
+    font = _CountingFont(fontpath, size)
+    font.set_bold(bold)
+    font.set_italic(italic)
+    return font
+
+
+def take_frame_font_renders():
+    """Anzahl der font.render-Aufrufe seit dem letzten Aufruf (setzt zurück)."""
+    global _render_count
+    count = _render_count
+    _render_count = 0
+    return count
+
+
 def clear_font_cache():
     """Leert den Font-Cache bei manueller Auflösungsänderung"""
     global _last_scale_factor
     _font_cache.clear()
+    _font_sizes.clear()
+    _line_cache.clear()
+    _clear_glyph_atlases()
     _last_scale_factor = None
 
 
+# ========================
+# SURFACE POOL
+# ========================
+# Overlays (Abdunkeln, Fades) brauchen jeden Frame eine bildschirmgroße
+# Surface. Statt sie pro Frame neu anzulegen, hält der Pool eine Surface
+# je Verwendungszweck; neu angelegt wird nur, wenn sich Größe oder Flags
+# ändern (Auflösungswechsel). new_surface() zählt jede Allokation, damit
+# sich prüfen lässt, dass ein ruhiger Frame nichts mehr anlegt.
+
+def new_surface(size, flags=0):
+    """pygame.Surface anlegen und im Allokations-Zähler vermerken."""
+    global _alloc_count
+    _alloc_count += 1
+    return pygame.Surface(size, flags)
+
+
+def take_frame_allocations():
+    """Anzahl der Surfaces aus new_surface() seit dem letzten Aufruf (setzt zurück)."""
+    global _alloc_count
+    count = _alloc_count
+    _alloc_count = 0
+    return count
+
+
+def pooled_surface(tag, size, flags=0):
+    """(Surface, neu) — wiederverwendbare Surface für tag.
+
+    neu=True heißt: gerade angelegt, der Aufrufer muss sie einmal befüllen.
+    Sonst enthält sie noch den Inhalt der letzten Verwendung.
+    """
+    key = (tuple(size), flags)
+    entry = _surface_pool.get(tag)
+    if entry is not None and entry[0] == key:
+        return entry[1], False
+    surf = new_surface(size, flags)
+    _surface_pool[tag] = (key, surf)
+    return surf, True
+
+
+def get_dim_overlay(size, alpha):
+    """Schwarze Overlay-Surface mit Surface-Alpha (einmal gefüllt, dann nur noch set_alpha)."""
+    surf, fresh = pooled_surface('dim', size)
+    if fresh:
+        surf.fill((0, 0, 0))
+    surf.set_alpha(alpha)
+    return surf
+
+
+# ========================
+# LINE SURFACE CACHE
+# ========================
+
+def render_cached_line(font, text, color):
+    """Gibt die gerenderte Surface einer fertigen Terminal-Zeile zurück (LRU-gecacht).
+
+    Schlüssel ist (text, color, Fontgröße). Nur Fonts aus get_scaled_font()
+    werden gecacht — bei fremden Fonts wird direkt gerendert.
+    """
+    size = _font_sizes.get(id(font))
+    if size is None:
+        return font.render(text, True, color)
+
+    key = (text, color, size)
+    surf = _line_cache.get(key)
+    if surf is not None:
+        _line_cache.move_to_end(key)
+        return surf
+
+    surf = font.render(text, True, color)
+    _line_cache[key] = surf
+    if len(_line_cache) > LINE_CACHE_SIZE:
+        _line_cache.popitem(last=False)
+    return surf
+
+
+def clear_line_cache():
+    """Verwirft alle gecachten Zeilen (z.B. nach Wechsel des Terminal-Farbschemas)."""
+    _line_cache.clear()
+
+
+# ========================
+# GLYPH ATLAS
+# ========================
+# Der Terminal-Font ist monospace und kommt nur in wenigen Farben vor.
+# Statt jede Zeichenkette mit font.render neu zu rastern, liegt jede
+# Glyphe je (Größe, Farbe) einmal auf einer Atlas-Surface; eine Zeile ist
+# dann ein einziger Surface.blits-Aufruf mit Ausschnitten aus dem Atlas.
+
+_GLYPH_CHARSET = ''.join(chr(c) for c in range(32, 127)) + 'äöüÄÖÜß→←↑↓…–—„“”«»°·'
+
+
+class GlyphAtlas:
+    """Alle Glyphen eines Fonts in einer Farbe auf einer Surface.
+
+    Unbekannte Zeichen werden beim ersten Auftreten nachgerendert
+    (der Atlas wird dann einmal neu aufgebaut).
+    """
+
+    def __init__(self, font, color, antialias=True):
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.height = font.get_height()
+        self.surface = None
+        self._chars = []
+        self._rects = {}       # zeichen -> Rect im Atlas (Breite = Vorschub)
+        self._build(_GLYPH_CHARSET)
+
+    def _build(self, new_chars):
+        for ch in new_chars:
+            if ch not in self._rects and ch not in self._chars:
+                self._chars.append(ch)
+        glyphs = [self.font.render(ch, self.antialias, self.color) for ch in self._chars]
+        size = (max(1, sum(g.get_width() for g in glyphs)), self.height)
+        if self.antialias:
+            atlas = new_surface(size, pygame.SRCALPHA)
+        else:
+            # Ohne AA reicht Colorkey statt Per-Pixel-Alpha (schneller Blit-Pfad, wie bisher beim Glow)
+            atlas = new_surface(size)
+            atlas.set_colorkey((0, 0, 0))
+        rects = {}
+        x = 0
+        for ch, glyph in zip(self._chars, glyphs):
+            if self.antialias:
+                # Per-Pixel-Alpha exakt übernehmen (kein Blending auf dem leeren Atlas)
+                atlas.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            else:
+                atlas.blit(glyph, (x, 0))  # 8-Bit mit Colorkey → Hintergrund bleibt schwarz
+            rects[ch] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+        self.surface = atlas
+        self._rects = rects
+
+    def glyphs(self, text, x=0):
+        """([(x, rect), ...] je sichtbarem Zeichen ab Position x, x hinter dem Text)."""
+        rects = self._rects
+        missing = [ch for ch in text if ch not in rects]
+        if missing:
+            self._build(missing)
+            rects = self._rects
+        placed = []
+        for ch in text:
+            rect = rects[ch]
+            if ch != ' ':
+                placed.append((x, rect))
+            x += rect.width
+        return placed, x
+
+    def blit_line(self, surface, text, pos):
+        x, y = pos
+        placed, _end = self.glyphs(text, x)  # Kann den Atlas erweitern → surface erst danach lesen
+        atlas = self.surface
+        surface.blits([(atlas, (gx, y), rect) for gx, rect in placed], doreturn=False)
+
+
+def get_glyph_atlas(font, color, antialias=True):
+    """Atlas für font + Farbe; None bei Fonts, die nicht aus get_scaled_font() stammen."""
+    size = _font_sizes.get(id(font))
+    if size is None:
+        return None
+    key = (size, tuple(color), antialias)
+    atlas = _glyph_atlases.get(key)
+    if atlas is None:
+        atlas = _glyph_atlases[key] = GlyphAtlas(font, color, antialias)
+    return atlas
+
+
+def _clear_glyph_atlases():
+    global _prefix_run, _glow_scratch
+    _glyph_atlases.clear()
+    _glow_sprites.clear()
+    _prefix_run = None
+    _glow_scratch = None
+
+
+def _get_glow_scratch(width, height):
+    """Schwarze Colorkey-Surface mind. width x height (wächst bei Bedarf, wird nie pro Aufruf neu angelegt)."""
+    global _glow_scratch
+    if _glow_scratch is None or _glow_scratch.get_width() < width or _glow_scratch.get_height() < height:
+        w = max(width, _glow_scratch.get_width() if _glow_scratch else 0)
+        h = max(height, _glow_scratch.get_height() if _glow_scratch else 0)
+        _glow_scratch = new_surface((w, h))
+        _glow_scratch.set_colorkey((0, 0, 0))
+    return _glow_scratch
+
+
+def draw_glyph_prefix(surface, font, text, count, color, pos):
+    """Zeichnet die ersten count Zeichen von text (Typewriter-Teilzeile).
+
+    Die Zeile wächst auf einer eigenen Surface: kommen Zeichen hinzu,
+    werden nur die neuen Glyphen aus dem Atlas angehängt, statt den ganzen
+    Prefix neu zu rendern. Pro Frame bleibt ein einziger Blit.
+    """
+    global _prefix_run
+    atlas = get_glyph_atlas(font, color)
+    if atlas is None:
+        surface.blit(font.render(text[:count], True, color), pos)
+        return
+    run = _prefix_run
+    if run is None or run[0] is not atlas or run[1] != text or run[2] > count:
+        _placed, width = atlas.glyphs(text)
+        line_surf = new_surface((max(1, width), atlas.height), pygame.SRCALPHA)
+        run = _prefix_run = [atlas, text, 0, 0, line_surf]
+    _atlas, _text, done, x, line_surf = run
+    if count > done:
+        placed, x = atlas.glyphs(text[done:count], x)
+        line_surf.blits([(atlas.surface, (gx, 0), rect, pygame.BLEND_RGBA_MAX) for gx, rect in placed],
+                        doreturn=False)
+        run[2], run[3] = count, x
+    surface.blit(line_surf, pos)
+
+
 # ========================
 # TEXT RENDERING HELPERS
 # ========================
@@ -106,15 +361,80 @@ def draw_text_line(surface, text, x, y, color, font):
 def draw_text_glow(surface, text, pos, color, font, glow_radius=1, glow_alpha=35):
     """Scharfer Text mit optionalem Phosphor-Halo. Artifact-frei auf reinem Schwarz.
 
-    Glow: kein AA (exakte Pixel) + colorkey(0,0,0) → nur Textpixel leuchten,
-    kein Blur-Rechteck. Radius=1 = 8 Blits statt 24 → deutlich sauberer.
-    Sharp: AA direkt geblit, schwarzer BG unsichtbar auf (0,0,0)-Screen.
+    Gezeichnet wird ein fertig zusammengesetztes Glow-Sprite aus dem
+    LRU-Cache (get_glow_sprite) — ein Blit pro Aufruf. Ein blinkender
+    Cursor gehört nicht in text, sondern wird separat darüber gezeichnet,
+    sonst erzeugt jedes Blinken ein neues Sprite.
     """
     if not text or not text.strip():
         return
 
+    sprite, margin = get_glow_sprite(text, color, font, glow_radius, glow_alpha)
+    surface.blit(sprite, (pos[0] - margin, pos[1] - margin))
+
+
+def text_width(font, text, color):
+    """Breite von text so, wie draw_text_glow/draw_glyph_prefix ihn setzen (Pixel)."""
+    atlas = get_glyph_atlas(font, color)
+    if atlas is None:
+        return font.size(text)[0]
+    return atlas.glyphs(text)[1]
+
+
+def get_glow_sprite(text, color, font, glow_radius=1, glow_alpha=35):
+    """(Surface, rand) mit Halo + scharfem Text, vorgemischt auf Schwarz.
+
+    Der Text liegt bei (rand, rand) im Sprite; Schwarz ist Colorkey.
+    Schlüssel ist (text, color, font, radius, alpha), LRU mit
+    GLOW_CACHE_SIZE Einträgen.
+    """
+    key = (text, tuple(color), font, glow_radius, glow_alpha)
+    entry = _glow_sprites.get(key)
+    if entry is not None:
+        _glow_sprites.move_to_end(key)
+        return entry
+
+    margin = max(0, glow_radius) if glow_alpha > 0 else 0
+    width, height = text_width(font, text, color), font.get_height()
+    sprite = new_surface((width + 2 * margin, height + 2 * margin))
+    _draw_glow_passes(sprite, text, (margin, margin), color, font, glow_radius, glow_alpha)
+    sprite.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+
+    entry = _glow_sprites[key] = (sprite, margin)
+    if len(_glow_sprites) > GLOW_CACHE_SIZE:
+        _glow_sprites.popitem(last=False)
+    return entry
+
+
+def _draw_glow_passes(surface, text, pos, color, font, glow_radius, glow_alpha):
+    """Halo + scharfer Text direkt auf surface (schwarzer Untergrund).
+
+    Glow: kein AA (exakte Pixel) + colorkey(0,0,0) → nur Textpixel leuchten,
+    kein Blur-Rechteck. Radius=1 = 8 Blits statt 24 → deutlich sauberer.
+    Sharp: AA direkt geblit, schwarzer BG unsichtbar auf (0,0,0)-Screen.
+    Fonts aus get_scaled_font() zeichnen beide Pässe aus dem Glyph-Atlas.
+    """
     x, y = pos
 
+    sharp = get_glyph_atlas(font, color)
+    if sharp is not None:
+        if glow_radius > 0 and glow_alpha > 0:
+            # Glow-Zeile einmal aus dem Atlas zusammensetzen, dann 8 ganze Blits
+            glow = get_glyph_atlas(font, color, antialias=False)
+            placed, width = glow.glyphs(text)
+            area = pygame.Rect(0, 0, width, glow.height)
+            scratch = _get_glow_scratch(width, glow.height)
+            scratch.fill((0, 0, 0), area)
+            scratch.blits([(glow.surface, (gx, 0), rect) for gx, rect in placed], doreturn=False)
+            scratch.set_alpha(glow_alpha)
+            for dx in (-glow_radius, 0, glow_radius):
+                for dy in (-glow_radius, 0, glow_radius):
+                    if dx == 0 and dy == 0:
+                        continue
+                    surface.blit(scratch, (x + dx, y + dy), area)
+        sharp.blit_line(surface, text, pos)
+        return
+
     if glow_radius > 0 and glow_alpha > 0:
         glow = font.render(text, False, color)
         glow.set_colorkey((0, 0, 0))
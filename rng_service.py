@@ -0,0 +1,65 @@
+# ============================================================
+# rng_service.py — Seeded Randomness and Clock for Dead World
+# ============================================================
+# All randomness of the game goes through one RngService with separate
+# streams per subsystem:
+#   gameplay — spawn rolls and everything that changes the game state
+#   flavor   — text variants (damage reactions, unknown-verb replies)
+#   audio    — sound and music selection (frontend only)
+# Each stream is derived from the session seed, so an extra sound roll
+# never shifts a spawn roll. Same seed + same commands = same output.
+#
+# The seed chain: start_game() and save_game() move to the next seed
+# drawn from the gameplay stream; the save file stores that seed, so
+# "save, keep playing" and "load, keep playing" continue identically.
+#
+# ManualClock replaces the frontend ticks and the wall clock for
+# replays and simulations (time only moves when advance() is called).
+
+import random
+import datetime
+
+STREAMS = ('gameplay', 'flavor', 'audio')
+
+
+class RngService:
+    """Zufallsströme je Subsystem aus einem gemeinsamen Seed.
+
+    seed=None → Seed aus der Entropie des Betriebssystems
+    """
+
+    def __init__(self, seed=None):
+        self.seed = None
+        self.reseed(seed if seed is not None else random.SystemRandom().getrandbits(32))
+
+    def reseed(self, seed):
+        """Setzt alle Ströme auf den Anfang von seed zurück."""
+        self.seed = int(seed)
+        # String-Seeds werden per SHA-512 abgeleitet → unabhängig von PYTHONHASHSEED
+        for name in STREAMS:
+            setattr(self, name, random.Random(f'{self.seed}/{name}'))
+        return self.seed
+
+    def advance(self):
+        """Nächster Seed der Kette (aus dem Gameplay-Strom) → wird aktiv."""
+        return self.reseed(self.gameplay.getrandbits(32))
+
+
+class ManualClock:
+    """Deterministische Uhr: Ticks (ms) und Uhrzeit ändern sich nur per advance().
+
+    start — Uhrzeit bei Tick 0 (für 'time' u.ä.)
+    """
+
+    def __init__(self, start=datetime.datetime(2000, 1, 1), ticks=0):
+        self.start = start
+        self.ticks = ticks
+
+    def advance(self, ms):
+        self.ticks += int(ms)
+
+    def get_ticks(self):
+        return self.ticks
+
+    def now(self):
+        return self.start + datetime.timedelta(milliseconds=self.ticks)
@@ -0,0 +1,181 @@
+# ============================================================
+# room_graph.py — Compiled Room Graph for Dead World
+# ============================================================
+# rooms[...]['exits'] stays the source of truth (it is what the map
+# data, puzzles and save games edit). This module compiles it once:
+#   - room keys and direction names are interned to ints
+#   - one array('i') per direction: index = room id, value = target id
+#     (NO_EXIT = -1)
+#   - target keys are resolved once at compile time, not per move
+# Movement and exit listing are then plain index lookups. Whoever edits
+# a room's exits calls sync_room() for that room afterwards.
+#
+# EdgeIndex keeps the TRANSITIONS edge list the same way: single edges
+# are added/removed, the reverse direction comes from a lookup table.
+
+from array import array
+
+NO_EXIT = -1
+
+
+class RoomGraph:
+    """Int-indizierter Raumgraph über rooms[...]['exits'].
+
+    resolve_key        — löst einen Ziel-Eintrag auf einen Raum-Key auf (oder None)
+    normalize_direction — normalisiert Richtungsnamen ('Norden ' → 'norden')
+    """
+
+    def __init__(self, resolve_key, normalize_direction):
+        self._resolve_key = resolve_key
+        self._normalize = normalize_direction
+        self.room_ids = {}       # room_key -> int
+        self.room_keys = []      # int -> room_key
+        self.dir_ids = {}        # richtung -> int
+        self.dir_names = []      # int -> richtung
+        self._targets = []       # dir_id -> array('i') über alle Räume
+        self._exit_dirs = []     # room_id -> Tupel der dir_ids in exits-Reihenfolge
+
+    def compile(self, rooms):
+        """Einmaliger Auflösungs-Durchlauf über alle Räume."""
+        self.room_keys = list(rooms)
+        self.room_ids = {rk: i for i, rk in enumerate(self.room_keys)}
+        self.dir_ids = {}
+        self.dir_names = []
+        self._targets = []
+        self._exit_dirs = [()] * len(self.room_keys)
+        for room_key, room_data in rooms.items():
+            self._compile_room(self.room_ids[room_key], room_data)
+
+    def sync_room(self, room_key, room_data):
+        """Übernimmt geänderte exits eines einzelnen Raums."""
+        rid = self.room_ids.get(room_key)
+        if rid is None:
+            return
+        for did in self._exit_dirs[rid]:
+            self._targets[did][rid] = NO_EXIT
+        self._compile_room(rid, room_data)
+
+    def _dir_id(self, name):
+        did = self.dir_ids.get(name)
+        if did is None:
+            did = self.dir_ids[name] = len(self.dir_names)
+            self.dir_names.append(name)
+            self._targets.append(array('i', [NO_EXIT]) * len(self.room_keys))
+        return did
+
+    def _compile_room(self, rid, room_data):
+        dirs = []
+        for direction, target in room_data.get('exits', {}).items():
+            name = self._normalize(direction)
+            tid = self.room_ids.get(self._resolve_key(target), NO_EXIT)
+            if not name or tid == NO_EXIT:
+                continue
+            did = self._dir_id(name)
+            if self._targets[did][rid] != NO_EXIT:
+                continue  # Erster Eintrag je Richtung gewinnt (wie bisher)
+            self._targets[did][rid] = tid
+            dirs.append(did)
+        self._exit_dirs[rid] = tuple(dirs)
+
+    def target(self, room_key, direction):
+        """Zielraum-Key für room_key + Richtung oder None."""
+        rid = self.room_ids.get(room_key)
+        did = self.dir_ids.get(self._normalize(direction))
+        if rid is None or did is None:
+            return None
+        tid = self._targets[did][rid]
+        return self.room_keys[tid] if tid != NO_EXIT else None
+
+    def exits(self, room_key):
+        """[(richtung, ziel_key), ...] in der Reihenfolge von exits."""
+        rid = self.room_ids.get(room_key)
+        if rid is None:
+            return []
+        keys = self.room_keys
+        return [(self.dir_names[did], keys[self._targets[did][rid]]) for did in self._exit_dirs[rid]]
+
+
+class EdgeIndex:
+    """Übergänge (TRANSITIONS) als Kanten-Index, kantenweise änderbar.
+
+    Jede Kante ist ein Dict wie früher aus rebuild_transitions_from_exits()
+    ('id', 'from', 'to', 'dir_from', 'dir_to', ...). 'dir_to' — die erste
+    Richtung, die vom Ziel zurückführt — kommt aus einer Rückweg-Tabelle
+    statt aus einer Suche über die exits des Zielraums.
+    """
+
+    def __init__(self):
+        self._edges = {}        # edge_id -> Kante (Einfügereihenfolge)
+        self._room_edges = {}   # from_room -> {richtung: edge_id}
+        self._between = {}      # (from_room, to_room) -> [edge_id, ...]
+        self._dirs = {}         # (from_room, to_room) -> [richtung, ...] in exits-Reihenfolge
+
+    def __iter__(self):
+        return iter(self._edges.values())
+
+    def __len__(self):
+        return len(self._edges)
+
+    def get(self, edge_id):
+        return self._edges.get(edge_id)
+
+    def build(self, graph):
+        """Kompletter Aufbau aus einem RoomGraph."""
+        self._edges.clear()
+        self._room_edges.clear()
+        self._between.clear()
+        self._dirs.clear()
+        for room_key in graph.room_keys:
+            for direction, target in graph.exits(room_key):
+                self.add_edge(room_key, direction, target)
+
+    def sync_room(self, room_key, exits):
+        """Ersetzt die ausgehenden Kanten eines Raums durch exits [(richtung, ziel)]."""
+        for direction in list(self._room_edges.get(room_key, ())):
+            self.remove_edge(room_key, direction)
+        for direction, target in exits:
+            self.add_edge(room_key, direction, target)
+
+    def add_edge(self, from_room, direction, to_room):
+        if direction in self._room_edges.get(from_room, ()):
+            self.remove_edge(from_room, direction)
+        edge_id = f'edge_{from_room}_{direction}'
+        back = self._dirs.get((to_room, from_room))
+        self._edges[edge_id] = {
+            'id': edge_id,
+            'type': 'passage',
+            'from': from_room,
+            'to': to_room,
+            'dir_from': direction,
+            'dir_to': back[0] if back else None,
+            'locked': False,
+            'trigger': None,
+            'lock_msg': None,
+        }
+        self._room_edges.setdefault(from_room, {})[direction] = edge_id
+        self._between.setdefault((from_room, to_room), []).append(edge_id)
+        dirs = self._dirs.setdefault((from_room, to_room), [])
+        dirs.append(direction)
+        if len(dirs) == 1:
+            self._set_reverse(to_room, from_room, direction)
+
+    def remove_edge(self, from_room, direction):
+        edge_id = self._room_edges.get(from_room, {}).pop(direction, None)
+        if edge_id is None:
+            return
+        to_room = self._edges.pop(edge_id)['to']
+        pair = (from_room, to_room)
+        self._between[pair].remove(edge_id)
+        dirs = self._dirs[pair]
+        was_first = dirs[0] == direction
+        dirs.remove(direction)
+        if not dirs:
+            del self._between[pair]
+            del self._dirs[pair]
+        if was_first:
+            self._set_reverse(to_room, from_room, dirs[0] if dirs else None)
+
+    def _set_reverse(self, from_room, to_room, direction):
+        """Setzt 'dir_to' aller Kanten from_room → to_room."""
+        for edge_id in self._between.get((from_room, to_room), ()):
+            self._edges[edge_id]['dir_to'] = direction
@@ -0,0 +1,127 @@
+# ============================================================
+# save_slots.py — Save Slots and Slot Index for Dead World
+# ============================================================
+# SAVE_SLOTS manual slots ('1', '2', ...) plus AUTOSAVE_SLOTS rotating
+# autosave slots ('auto1', ...). Slot '1' is the classic SAVE_FILE, so
+# saves from older versions show up there. The other slots sit next to
+# it:
+#     dead_world_save.json          slot 1
+#     dead_world_save_2.json        slot 2
+#     dead_world_save_auto1.json    autosave 1
+#     dead_world_save_index.json    metadata of all slots
+#
+# The index holds per-slot metadata (room, score, moves, play time,
+# timestamp), so slot lists never parse a full save. SaveSlots keeps it
+# in memory: the disk is read once, after that the cache is updated on
+# every save and re-read only after a failed write. Menus can query it
+# every frame.
+
+import os
+import json
+import datetime
+from config import SAVE_SLOTS, AUTOSAVE_SLOTS
+
+INDEX_VERSION = 1
+DEFAULT_SLOT = '1'
+# Pflichtfelder eines Index-Eintrags (siehe engine.save_game)
+META_KEYS = {'room_name': str, 'score': int, 'moves': int, 'elapsed_ms': int, 'timestamp': str}
+
+
+def _valid_meta(entry):
+    """Ob entry ein vollständiger Index-Eintrag ist (Datei kann von Hand editiert sein)."""
+    return isinstance(entry, dict) and all(
+        isinstance(entry.get(key), kind) for key, kind in META_KEYS.items())
+
+
+class SaveSlots:
+    """Slot-Pfade und Metadaten-Cache für einen Basis-Spielstand (SAVE_FILE)."""
+
+    def __init__(self, base_path, slots=SAVE_SLOTS, autosaves=AUTOSAVE_SLOTS):
+        self.base_path = base_path
+        root, ext = os.path.splitext(base_path)
+        self._root = root
+        self._ext = ext
+        self.index_path = f'{root}_index{ext}'
+        self.manual = tuple(str(n) for n in range(1, slots + 1))
+        self.autosaves = tuple(f'auto{n}' for n in range(1, autosaves + 1))
+        self._meta = None   # slot → Metadaten, None = noch nicht gelesen
+
+    @property
+    def ids(self):
+        return self.manual + self.autosaves
+
+    def path(self, slot):
+        if slot == DEFAULT_SLOT:
+            return self.base_path
+        return f'{self._root}_{slot}{self._ext}'
+
+    def slot_for(self, path):
+        """Slot zu einem Spielstand-Pfad (None → kein Slot dieses Managers)."""
+        for slot in self.ids:
+            if self.path(slot) == path:
+                return slot
+        return None
+
+    # ── Cache ──────────────────────────────────────────────────────────────
+    def refresh(self):
+        """Liest Index und Slot-Dateien neu ein (einmalig bzw. nach Fehlern)."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                indexed = json.load(f).get('slots', {})
+        except (OSError, ValueError, AttributeError):
+            indexed = {}
+        meta = {}
+        for slot in self.ids:
+            path = self.path(slot)
+            if not os.path.exists(path):
+                continue
+            entry = indexed.get(slot)
+            if not _valid_meta(entry):
+                # Spielstand ohne (vollständigen) Index-Eintrag → nur Dateizeit
+                mtime = datetime.datetime.fromtimestamp(os.path.getmtime(path))
+                entry = {'timestamp': mtime.isoformat(timespec='seconds')}
+            meta[slot] = entry
+        self._meta = meta
+
+    def _entries(self):
+        if self._meta is None:
+            self.refresh()
+        return self._meta
+
+    def exists(self, slot=None):
+        """Ob slot (None → irgendein Slot) belegt ist — aus dem Cache."""
+        entries = self._entries()
+        return bool(entries) if slot is None else slot in entries
+
+    def entries(self):
+        """→ [(slot, metadaten)] in Slot-Reihenfolge, nur belegte Slots."""
+        entries = self._entries()
+        return [(slot, dict(entries[slot])) for slot in self.ids if slot in entries]
+
+    def newest(self, slots=None):
+        """Zuletzt gespeicherter Slot (unter slots, None → alle) oder None."""
+        entries = self._entries()
+        candidates = [s for s in (slots or self.ids) if s in entries]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda s: entries[s].get('timestamp', ''))
+
+    def next_autosave(self):
+        """Autosave-Slot für den nächsten Autosave: frei oder am ältesten.
+
+        None → keine Autosave-Slots (AUTOSAVE_SLOTS = 0), Autosave ist aus
+        """
+        if not self.autosaves:
+            return None
+        entries = self._entries()
+        for slot in self.autosaves:
+            if slot not in entries:
+                return slot
+        return min(self.autosaves, key=lambda s: entries[s].get('timestamp', ''))
+
+    def record(self, slot, meta):
+        """Trägt meta für slot in den Cache ein → Inhalt der neuen Index-Datei."""
+        entries = self._entries()
+        entries[slot] = dict(meta)
+        return {'version': INDEX_VERSION,
+                'slots': {s: dict(m) for s, m in entries.items()}}
@@ -0,0 +1,123 @@
+# ============================================================
+# save_writer.py — Background Save Writer for Dead World
+# ============================================================
+# save_game() builds the save data on the main thread (a cheap copy of
+# the player state and the world deltas). This module serializes and
+# writes it on a worker thread, so a slow disk or a virus scanner does
+# not freeze the frame loop.
+#
+# Every write is atomic: the JSON goes into a temp file next to the
+# target, is fsync'ed and then swapped in with os.replace(). A crash
+# during the write leaves the previous save untouched (at worst a stray
+# *.tmp file next to it).
+#
+# A save can carry a follow-up file (the slot index, see save_slots.py)
+# that is written only after the save itself succeeded.
+#
+# Results come back through a thread-safe queue; main() in the pygame
+# frontend drains poll() once per frame and hands them to the engine.
+# Without a writer (headless runs, replays) save_game() calls
+# write_atomic() directly.
+
+import os
+import json
+import queue
+import tempfile
+import threading
+
+
+def write_atomic(path, data):
+    """Schreibt data als JSON nach path: Temp-Datei + fsync, dann os.replace."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(directory)
+
+
+def _fsync_dir(directory):
+    """Macht auch das Umbenennen dauerhaft (nur POSIX, Windows öffnet keine Ordner)."""
+    if os.name != 'posix':
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class SaveWriter:
+    """Ein Worker-Thread, der Spielstände der Reihe nach schreibt.
+
+    submit() kehrt sofort zurück; poll() liefert die fertigen Ergebnisse
+    als (path, fehler) — fehler ist None bei Erfolg.
+    """
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._thread = None
+
+    def submit(self, path, data, followup=None):
+        """data darf danach vom Hauptthread nicht mehr verändert werden.
+
+        followup — optional (path, data), wird nach erfolgreichem Schreiben geschrieben
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='SaveWriter', daemon=True)
+            self._thread.start()
+        self._jobs.put((path, data, followup))
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            try:
+                if job is None:
+                    return
+                path, data, followup = job
+                try:
+                    write_atomic(path, data)
+                    if followup is not None:
+                        write_atomic(*followup)
+                    error = None
+                except Exception as e:
+                    error = e
+                self._results.put((path, error))
+            finally:
+                self._jobs.task_done()
+
+    def poll(self):
+        """Alle seit dem letzten Aufruf fertig gewordenen Ergebnisse."""
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def flush(self):
+        """Wartet bis alle angenommenen Spielstände geschrieben sind."""
+        if self._thread is not None:
+            self._jobs.join()
+
+    def close(self):
+        """Schreibt Ausstehendes zu Ende und beendet den Thread."""
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread.join()
+            self._thread = None
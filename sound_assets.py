@@ -0,0 +1,96 @@
+# ============================================================
+# sound_assets.py — Lazy Sound Loading for Dead World
+# ============================================================
+# Decodes the short SFX categories (zombie groans, gun shots, ...)
+# on demand instead of at import time. prefetch() loads all of them
+# on a daemon thread while the INTRO screen is showing; get_sounds()
+# never blocks and returns [] while a category is still loading.
+#
+# Call init_sounds(base_dir) once after pygame.mixer.init().
+
+import os
+import threading
+import pygame
+
+# Kategorie → Unterordner in Game_music/
+SOUND_CATEGORIES = {
+    'zombie':       'Zombie Sounds',        # Kurze Groans/Calls/Roars
+    'zombie_dying': 'Zombie Dying Sounds',  # Sterbe-Schrei beim Kill
+    'gun':          'Gun Sounds',
+    'punch':        'Punch_Sounds',         # Nahkampf
+}
+
+_SOUND_EXTENSIONS = ('.mp3', '.wav', '.ogg')
+
+# ========================
+# MODULE STATE
+# ========================
+_music_dir = None        # Set via init_sounds()
+_loaded = {}             # category -> [pygame.mixer.Sound]
+_pending = set()         # Kategorien, die gerade im Hintergrund laden
+_lock = threading.Lock()
+
+
+def init_sounds(base_dir):
+    """Call once at startup with the directory that contains Game_music/."""
+    global _music_dir
+    _music_dir = os.path.join(base_dir, "Game_music")
+
+
+def _decode_category(category):
+    """Dekodiert alle Dateien einer Kategorie (läuft im Hintergrund-Thread)."""
+    sounds = []
+    folder = os.path.join(_music_dir, SOUND_CATEGORIES[category])
+    try:
+        files = sorted(os.listdir(folder))
+    except OSError:
+        files = []
+    for filename in files:
+        if filename.endswith(_SOUND_EXTENSIONS):
+            try:
+                sounds.append(pygame.mixer.Sound(os.path.join(folder, filename)))
+            except Exception:
+                pass
+    with _lock:
+        _loaded[category] = sounds
+        _pending.discard(category)
+
+
+def _load_in_background(categories):
+    """Startet einen Daemon-Thread für alle noch nicht geladenen Kategorien."""
+    if _music_dir is None:
+        return  # Vor init_sounds() nichts vormerken, sonst bliebe es ewig "pending"
+    with _lock:
+        todo = [c for c in categories if c not in _loaded and c not in _pending]
+        _pending.update(todo)
+    if not todo:
+        return
+
+    def _worker():
+        for category in todo:
+            _decode_category(category)
+
+    threading.Thread(target=_worker, name="sound-prefetch", daemon=True).start()
+
+
+def prefetch():
+    """Lädt alle Kategorien im Hintergrund vor (während des Intros aufrufen)."""
+    _load_in_background(list(SOUND_CATEGORIES))
+
+
+def get_sounds(category):
+    """Gibt die Sounds einer Kategorie zurück, ohne je zu blockieren.
+
+    Ist die Kategorie noch nicht geladen, wird das Laden angestoßen und
+    [] zurückgegeben — der Aufrufer spielt dann einfach keinen Sound.
+    """
+    sounds = _loaded.get(category)
+    if sounds is None:
+        _load_in_background([category])
+        return []
+    return sounds
+
+
+def is_ready(category):
+    """True sobald eine Kategorie fertig dekodiert ist."""
+    return category in _loaded
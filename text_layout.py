@@ -0,0 +1,117 @@
+# ============================================================
+# text_layout.py — Lazy Word-Wrap Layout for the Terminal History
+# ============================================================
+# game_history stores logical paragraphs (text, color). The physical
+# lines on screen depend on the window width, so they are computed here,
+# per width, and only as far back as the view needs:
+#   - new paragraphs are wrapped when they arrive at the bottom
+#   - older paragraphs are wrapped on demand when scrolling reaches them
+#     (visible window + a margin), never the whole history up front
+# After a resize a fresh layout starts empty and wraps from the bottom.
+# LayoutCache keeps the layouts of the last few (width, font size)
+# combinations, so switching back and forth does not re-wrap anything.
+#
+# All positions are counted from the bottom, like scroll_offset.
+
+from collections import OrderedDict, deque
+
+_RESYNC_LIMIT = 512  # Mehr neue Absätze seit dem letzten Sync → Layout neu aufbauen
+
+
+class WrappedLayout:
+    """Umgebrochene Zeilen eines HistoryBuffer für eine feste Zeilenbreite.
+
+    wrap — Funktion text -> [zeile, ...] für diese Breite
+    Gehalten wird ein zusammenhängender Bereich [lo, hi) von Absätzen
+    (absolute Indizes, siehe HistoryBuffer.first_index).
+    """
+
+    def __init__(self, history, wrap):
+        self._history = history
+        self._wrap = wrap
+        self._reset()
+
+    def _reset(self):
+        h = self._history
+        self._generation = h.generation
+        self._lo = self._hi = h.first_index + len(h)
+        self._lines = deque()    # (text, color) der Absätze lo..hi-1, älteste zuerst
+        self._counts = deque()   # Zeilenanzahl je Absatz lo..hi-1
+
+    def _wrap_entry(self, entry):
+        text, color = entry
+        return [(line, color) for line in self._wrap(text)]
+
+    def sync(self):
+        """Übernimmt neue Absätze unten und vergisst verdrängte oben."""
+        h = self._history
+        first = h.first_index
+        end = first + len(h)
+        if h.generation != self._generation or self._hi < first or end - self._hi > _RESYNC_LIMIT:
+            self._reset()
+            return
+        while self._lo < first and self._counts:
+            for _ in range(self._counts.popleft()):
+                self._lines.popleft()
+            self._lo += 1
+        self._lo = max(self._lo, first)
+        while self._hi < end:
+            lines = self._wrap_entry(h[self._hi - first])
+            self._lines.extend(lines)
+            self._counts.append(len(lines))
+            self._hi += 1
+
+    def ensure(self, line_count):
+        """Bricht ältere Absätze um, bis line_count Zeilen vorliegen (oder der Anfang erreicht ist)."""
+        h = self._history
+        first = h.first_index
+        while len(self._lines) < line_count and self._lo > first:
+            self._lo -= 1
+            lines = self._wrap_entry(h[self._lo - first])
+            self._lines.extendleft(reversed(lines))
+            self._counts.appendleft(len(lines))
+
+    def estimated_lines(self):
+        """Exakte Zeilen des umgebrochenen Bereichs + mind. 1 je noch nicht umgebrochenem Absatz."""
+        return len(self._lines) + (self._lo - self._history.first_index)
+
+    def window(self, offset, count, tail=(), margin=0):
+        """Bis zu count Zeilen (älteste zuerst), deren unterste offset Zeilen
+        über dem Ende liegt. tail sind Zeilen, die noch unter der Historie
+        stehen (z.B. fertig getippte Zeilen des laufenden Absatzes)."""
+        self.sync()
+        tail_len = len(tail)
+        self.ensure(offset + count - tail_len + margin)
+        lines = self._lines
+        n = len(lines)
+        result = []
+        for k in range(offset + count - 1, offset - 1, -1):
+            if k < tail_len:
+                result.append(tail[tail_len - 1 - k])
+            elif k - tail_len < n:
+                result.append(lines[n - 1 - (k - tail_len)])
+        return result
+
+
+class LayoutCache:
+    """LRU der WrappedLayouts je Schlüssel (z.B. (breite, fontgröße))."""
+
+    def __init__(self, history, size=4):
+        self._history = history
+        self._size = size
+        self._layouts = OrderedDict()
+
+    def get(self, key, wrap):
+        layout = self._layouts.get(key)
+        if layout is None:
+            layout = self._layouts[key] = WrappedLayout(self._history, wrap)
+            if len(self._layouts) > self._size:
+                self._layouts.popitem(last=False)
+        else:
+            self._layouts.move_to_end(key)
+        return layout
+
+    def rebind(self, history):
+        """Neue Historie (z.B. engine.game_history ersetzt) → alle Layouts verwerfen."""
+        self._history = history
+        self._layouts.clear()